@@ -0,0 +1,88 @@
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from render_profiler import record_cache
+
+
+def estimate_bytes(value):
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return int(np.sum(value.memory_usage(index=True, deep=True)))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+def canonical_key(version, components, name):
+    """(데이터 버전, 필터 조건, 집계 이름) 을 순서와 무관한 해시 키로 변환"""
+    payload = json.dumps(
+        [version, sorted(components), name], ensure_ascii=False, default=str
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class AggregateCache:
+    """
+    세션 간에 공유하는 집계 결과 LRU 캐시
+
+    - 키: 데이터 버전 + 필터 조건(search_term, company, skills) + 집계 이름의 해시
+    - 저장된 결과의 추정 크기 합이 max_bytes 를 넘으면 오래 쓰지 않은 항목부터 제거
+    - 여러 세션 스레드에서 동시에 사용하므로 잠금으로 보호
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, compute):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key][0]
+            self.misses += 1
+
+        # 계산은 잠금 밖에서 (같은 키를 두 세션이 동시에 계산할 수는 있지만 결과는 같음)
+        value = compute()
+        size = estimate_bytes(value)
+        with self._lock:
+            if key not in self._items and size <= self.max_bytes:
+                self._items[key] = (value, size)
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    _, (_, evicted_size) = self._items.popitem(last=False)
+                    self.bytes -= evicted_size
+        return value
+
+
+class AggregateScope:
+    """한 번의 rerun 에서 현재 필터 상태에 대한 집계를 캐시에서 조회"""
+
+    def __init__(self, cache, version, components):
+        self.cache = cache
+        self.version = version
+        self.components = components
+
+    def get(self, name, compute):
+        computed = []
+
+        def compute_once():
+            computed.append(True)
+            return compute()
+
+        value = self.cache.get(canonical_key(self.version, self.components, name), compute_once)
+        # 프로파일 중이면 집계 이름별 캐시 적중 여부를 rerun 기록에 남김
+        record_cache(name, hit=not computed)
+        return value
@@ -0,0 +1,75 @@
+"""
+새로 수집된 공고 반영 비교 - 전체 다시 읽기 vs 추가된 행만 읽어 Dataset.append
+
+CSV 를 수집 스크립트처럼 기존 행 + 새 행으로 다시 저장한 뒤,
+전체를 다시 읽어 데이터셋 / 색인을 만드는 시간과 DatasetWatcher 가 추가된 행만 반영하는 시간을 재고
+두 데이터셋의 색인 / 집계가 같은지 확인
+
+    python benchmark/bench_append.py --sizes 20000 200000 --added 500
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from synthetic_data import make_jobs  # noqa: E402
+from data_watcher import DatasetWatcher  # noqa: E402
+from dataset import Dataset  # noqa: E402
+
+
+def load(path, signature):
+    return Dataset(pd.read_csv(path, dtype=str), version=signature)
+
+
+def append(dataset, rows, signature):
+    return dataset.append(rows, version=signature)
+
+
+def same_dataset(expected, actual):
+    if list(expected.skill_index.skills) != list(actual.skill_index.skills):
+        return False
+    if (expected.skill_index.matrix != actual.skill_index.matrix).nnz:
+        return False
+    if any(not expected.skill_leaderboards[name].equals(actual.skill_leaderboards[name])
+           for name in expected.skill_leaderboards):
+        return False
+    for col in ("company", "position", "category"):
+        if not np.array_equal(expected.codes(col), actual.codes(col)):
+            return False
+    return expected.text_index.texts == actual.text_index.texts
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20_000, 200_000])
+    parser.add_argument("--added", type=int, default=500, help="새로 수집된 공고 수")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'added':>7} {'reload (s)':>11} {'append (s)':>11} {'same':>5}")
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = os.path.join(data_dir, "merged_data_total.csv")
+        for n_rows in args.sizes:
+            df = make_jobs(n_rows + args.added, text=False)[["company", "position", "skill"]]
+            df.iloc[:n_rows].to_csv(path, index=False, encoding="utf-8-sig")
+            watcher = DatasetWatcher(path, load, append, dtype=str)
+
+            df.to_csv(path, index=False, encoding="utf-8-sig")
+            start = time.perf_counter()
+            watcher.check()
+            append_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            expected = load(path, None)
+            reload_time = time.perf_counter() - start
+
+            same = same_dataset(expected, watcher.dataset)
+            print(f"{n_rows:>10,} {args.added:>7,} {reload_time:>11.2f} {append_time:>11.2f} {'yes' if same else 'NO':>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+create_animated_bar_chart 그래프 크기(JSON bytes)와 생성 시간 비교 - 기존 7프레임 방식 vs 현재 방식
+
+    python benchmark/bench_bar_chart.py --top-n 10 20 50 100 200
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from web_main import build_animated_bar_chart, create_animated_bar_chart  # noqa: E402
+
+
+def legacy_animated_bar_chart(data_df, x_col, y_col, title, orientation="v", color_scale="Plasma"):
+
+    if data_df.empty:
+        return None
+        
+    # 애니메이션 프레임 설정 - 최적화
+    animation_frames = []
+    # 최대 8개 프레임으로 제한
+    for i in range(1, 8):
+        subset = data_df.copy()
+        subset["animated_count"] = (subset[y_col] * (i / 7)).round(1)
+        
+        if orientation == "h":
+            frame = go.Frame(
+                data=[
+                    go.Bar(
+                        x=subset["animated_count"],
+                        y=subset[x_col],
+                        orientation="h",
+                        marker=dict(
+                            color=subset["animated_count"],
+                            colorscale=color_scale,
+                            showscale=True,
+                            colorbar=dict(title="빈도"),
+                        ),
+                        text=subset["animated_count"].round(0).astype(int),
+                        textposition="outside",
+                        hovertemplate="<b>%{y}</b><br>빈도: %{x:,}",
+                    )
+                ],
+                name=f"frame{i}",
+            )
+        else:
+            frame = go.Frame(
+                data=[
+                    go.Bar(
+                        x=subset[x_col],
+                        y=subset["animated_count"],
+                        marker=dict(
+                            color=subset["animated_count"],
+                            colorscale=color_scale,
+                            showscale=True,
+                            colorbar=dict(title="빈도"),
+                        ),
+                        text=subset["animated_count"].round(0).astype(int),
+                        textposition="outside",
+                        hovertemplate="<b>%{x}</b><br>빈도: %{y:,}",
+                    )
+                ],
+                name=f"frame{i}",
+            )
+        animation_frames.append(frame)
+
+    # 처음에는 빈 값으로 시작
+    empty_vals = [0] * len(data_df)
+    
+    # 그래프 생성
+    if orientation == "h":
+        fig = go.Figure(
+            data=[
+                go.Bar(
+                    x=empty_vals,
+                    y=data_df[x_col],
+                    orientation="h",
+                    marker=dict(
+                        color=empty_vals,
+                        colorscale=color_scale,
+                        showscale=True,
+                        colorbar=dict(title="빈도"),
+                    ),
+                    text=empty_vals,
+                    textposition="outside",
+                    hovertemplate="<b>%{y}</b><br>빈도: %{x:,}",
+                )
+            ],
+            frames=animation_frames,
+        )
+        
+        # x축 범위 설정 (최대값의 1.1배까지)
+        xmax = max(data_df[y_col]) * 1.1
+        fig.update_layout(
+            xaxis_title="빈도",
+            yaxis_title="",
+            xaxis_range=[0, xmax],
+            yaxis={"categoryorder": "total ascending"},
+        )
+    else:
+        fig = go.Figure(
+            data=[
+                go.Bar(
+                    x=data_df[x_col],
+                    y=empty_vals,
+                    marker=dict(
+                        color=empty_vals,
+                        colorscale=color_scale,
+                        showscale=True,
+                        colorbar=dict(title="빈도"),
+                    ),
+                    text=empty_vals,
+                    textposition="outside",
+                    hovertemplate="<b>%{x}</b><br>빈도: %{y:,}",
+                )
+            ],
+            frames=animation_frames,
+        )
+        
+        # y축 범위 설정 (최대값의 1.1배까지)
+        ymax = max(data_df[y_col]) * 1.1
+        fig.update_layout(
+            xaxis_title="",
+            yaxis_title="빈도", 
+            yaxis_range=[0, ymax],
+            xaxis=dict(tickangle=-45),
+        )
+
+    # 공통 레이아웃 설정
+    fig.update_layout(
+        title={
+            "text": title,
+            "y": 0.95,
+            "x": 0.5,
+            "xanchor": "center",
+            "yanchor": "top",
+        },
+        height=600,
+        margin=dict(l=20 if orientation == "v" else 150, r=20, t=70, b=100 if orientation == "v" else 70),
+        updatemenus=[
+            {
+                "type": "buttons",
+                "buttons": [
+                    {
+                        "label": "▶️ 그래프 표시",
+                        "method": "animate",
+                        "args": [
+                            None,
+                            {
+                                "frame": {"duration": 200, "redraw": True},
+                                "fromcurrent": True,
+                                "mode": "immediate",
+                            },
+                        ],
+                    }
+                ],
+                "direction": "left",
+                "pad": {"r": 10, "t": 10},
+                "showactive": False,
+                "x": 0.5,
+                "y": 1.15,
+                "xanchor": "center",
+                "yanchor": "top",
+            }
+        ],
+    )
+
+    return fig
+
+
+def make_counts(top_n):
+    return pd.DataFrame({
+        "company": [f"회사{i}" for i in range(top_n)],
+        "count": [1000 // (i + 1) for i in range(top_n)],
+    })
+
+
+def timed(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top-n", type=int, nargs="+", default=[10, 20, 50, 100, 200])
+    args = parser.parse_args()
+
+    print(f"{'top-n':>6} {'legacy KB':>10} {'legacy ms':>10} {'new KB':>8} {'new ms':>8} {'cached ms':>10}")
+    for top_n in args.top_n:
+        df = make_counts(top_n)
+        legacy_time, legacy_fig = timed(
+            lambda: legacy_animated_bar_chart(df, "company", "count", "", orientation="v")
+        )
+
+        def build_uncached():
+            build_animated_bar_chart.clear()
+            return create_animated_bar_chart(df, "company", "count", "", orientation="v")
+
+        new_time, new_fig = timed(build_uncached)
+        cached_time, _ = timed(lambda: create_animated_bar_chart(df, "company", "count", "", orientation="v"))
+        print(
+            f"{top_n:>6} {len(legacy_fig.to_json()) / 1024:>10.1f} {legacy_time * 1e3:>10.1f} "
+            f"{len(new_fig.to_json()) / 1024:>8.1f} {new_time * 1e3:>8.1f} {cached_time * 1e3:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
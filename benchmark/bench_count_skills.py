@@ -0,0 +1,83 @@
+"""
+count_skills 벤치마크 - 기존 iterrows 구현과 벡터화 구현 비교
+(대시보드는 이제 SkillIndex.counts 를 쓰므로 두 구현 모두 비교용으로 이 파일에만 있음)
+
+    python benchmark/bench_count_skills.py --sizes 10000 100000 1000000
+"""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from synthetic_data import make_jobs  # noqa: E402
+from skill_index import explode_skills  # noqa: E402
+
+EXCLUDED = ["AI", "UI", "UIUX", "NATIVE", "BOOT", "API", "WEB", "SW"]
+
+
+def legacy_count_skills(df, exclude_skills=None):
+    skill_counts = Counter()
+    for index, row in df.iterrows():
+        skills_str = row["skill"]
+        if pd.notna(skills_str):
+            skills = [skill.strip().upper() for skill in skills_str.split(",")]
+            skill_counts.update(skills)
+
+    if exclude_skills:
+        exclude_skills_upper = [skill.upper() for skill in exclude_skills]
+        skill_counts = {
+            skill: count
+            for skill, count in skill_counts.items()
+            if skill not in exclude_skills_upper
+        }
+
+    return pd.Series(skill_counts).sort_values(ascending=False)
+
+
+def count_skills(df, exclude_skills=None):
+    skill_counts = explode_skills(df).value_counts()
+
+    if exclude_skills:
+        exclude_skills_upper = {skill.upper() for skill in exclude_skills}
+        skill_counts = skill_counts[~skill_counts.index.isin(exclude_skills_upper)]
+
+    return skill_counts.rename_axis(None).rename(None)
+
+
+def make_postings(n_rows, seed=0):
+    # 기술 스택 컬럼만 사용 (Zipf 분포, 일부 별칭 표기 / 결측 포함)
+    return make_jobs(n_rows, seed, text=False)[["skill"]]
+
+
+def timed(func, *args, repeat=3, **kwargs):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'iterrows (s)':>14} {'vectorized (s)':>16} {'speedup':>9}")
+    for n_rows in args.sizes:
+        df = make_postings(n_rows)
+        legacy_time, expected = timed(legacy_count_skills, df, exclude_skills=EXCLUDED, repeat=1)
+        new_time, result = timed(count_skills, df, exclude_skills=EXCLUDED)
+        # 동률 순서는 정렬 알고리즘에 따라 다를 수 있으므로 값으로 비교
+        pd.testing.assert_series_equal(
+            result.sort_index(), expected.sort_index(), check_dtype=False, check_names=False
+        )
+        print(f"{n_rows:>10,} {legacy_time:>14.3f} {new_time:>16.3f} {legacy_time / new_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+필터 / 집계 엔진 비교 - pandas(메모리의 Dataset) vs Polars(lazy 질의) vs DuckDB(Parquet 위의 SQL)
+
+필터 상태마다 필터링 + 요약 지표 + 회사 / 직무 상위 20 + 기술 스택 빈도 + 공고 위치 배열을 계산하는
+시간을 재고, 모든 엔진의 결과가 pandas 엔진과 같은지(값과 순서) 확인
+
+    python benchmark/bench_query_backend.py --sizes 20000 200000 1000000
+
+pandas 엔진과 결과가 다르면 same 칸에 NO 가 표시되고 종료 코드 1 로 끝남
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from synthetic_data import make_jobs  # noqa: E402
+from dataset import Dataset  # noqa: E402
+from query_backend import DuckDBBackend, DuckDBQuery, PandasQuery, PolarsBackend, PolarsQuery  # noqa: E402
+from selection import IncrementalFilter, filter_components  # noqa: E402
+
+FILTERS = [
+    ("", "전체", []),
+    ("java", "전체", []),
+    ("백엔드", "전체", ["React"]),
+    ("", "전체", ["Spring", "JPA"]),
+    ("aws", "회사1", []),
+]
+
+
+def run_query(query):
+    return (
+        query.count(),
+        query.nunique("company"),
+        query.nunique("position"),
+        query.value_counts("company").head(20),
+        query.value_counts("position").head(20),
+        query.skill_counts(),
+        query.rows,
+    )
+
+
+def same_results(expected, actual):
+    for a, b in zip(expected, actual):
+        if hasattr(a, "index"):
+            if list(a.index) != list(b.index) or not np.array_equal(a.to_numpy(), b.to_numpy()):
+                return False
+        elif isinstance(a, np.ndarray):
+            if not np.array_equal(a, b):
+                return False
+        elif a != b:
+            return False
+    return True
+
+
+def timed(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20_000, 200_000, 1_000_000])
+    args = parser.parse_args()
+
+    mismatched = False
+    print(f"{'rows':>10} {'filter':>24} {'pandas (ms)':>12} {'polars (ms)':>12} {'duckdb (ms)':>12} {'same':>5}")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for n_rows in args.sizes:
+            dataset = Dataset(make_jobs(n_rows, text=False)[["company", "position", "skill"]])
+            polars_setup, polars_backend = timed(lambda: PolarsBackend(dataset), repeat=1)
+            duckdb_setup, duckdb_backend = timed(lambda: DuckDBBackend(dataset, cache_dir), repeat=1)
+            print(f"{n_rows:>10,} {'(setup)':>24} {'':>12} {polars_setup * 1e3:>12.1f} {duckdb_setup * 1e3:>12.1f}")
+            for term, company, skills in FILTERS:
+                components = filter_components(term, company, skills)
+                pandas_time, expected = timed(
+                    lambda: run_query(PandasQuery(dataset, IncrementalFilter(dataset).select(components)))
+                )
+                polars_time, polars_result = timed(lambda: run_query(PolarsQuery(polars_backend, components)))
+                duckdb_time, duckdb_result = timed(lambda: run_query(DuckDBQuery(duckdb_backend, components)))
+                label = "/".join(filter(None, [term, company if company != "전체" else "", *skills])) or "(none)"
+                same = same_results(expected, polars_result) and same_results(expected, duckdb_result)
+                mismatched = mismatched or not same
+                print(
+                    f"{'':>10} {label:>24} {pandas_time * 1e3:>12.1f} {polars_time * 1e3:>12.1f} "
+                    f"{duckdb_time * 1e3:>12.1f} {'yes' if same else 'NO':>5}"
+                )
+    if mismatched:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
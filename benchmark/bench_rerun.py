@@ -0,0 +1,63 @@
+"""
+대시보드 rerun 지연 시간 측정 - 모든 탭 렌더링 vs 선택한 탭만 렌더링
+
+합성 데이터를 임시 폴더의 data/ 에 만들고 streamlit AppTest 로 web_main.py 를 실행
+
+    python benchmark/bench_rerun.py --rows 20000 --reruns 10
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from synthetic_data import make_jobs  # noqa: E402
+
+SEARCH_TERMS = ["java", "react", "백엔드", "aws", "spring", "type"]
+
+
+def write_dataset(data_dir, n_rows):
+    df = make_jobs(n_rows)
+    os.makedirs(data_dir, exist_ok=True)
+    df.to_csv(os.path.join(data_dir, "merged_data_total.csv"), index=False)
+
+
+def measure(lazy, reruns):
+    # 모드 간에 공유 캐시(집계, 데이터셋)가 섞이지 않도록 초기화
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    app = AppTest.from_file(os.path.join(ROOT, "web_main.py"), default_timeout=120).run()
+    app.sidebar.checkbox[0].set_value(lazy).run()
+    timings = []
+    for i in range(reruns):
+        # 검색어를 바꿔 가며 rerun
+        start = time.perf_counter()
+        app.sidebar.text_input[0].input(SEARCH_TERMS[i % len(SEARCH_TERMS)]).run()
+        timings.append(time.perf_counter() - start)
+        assert not app.exception, app.exception
+    timings.sort()
+    return timings[len(timings) // 2], timings[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--reruns", type=int, default=12)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        write_dataset(os.path.join(work_dir, "data"), args.rows)
+        os.chdir(work_dir)
+        print(f"{'mode':>10} {'median (ms)':>12} {'max (ms)':>10}")
+        for lazy in (False, True):
+            median, worst = measure(lazy, args.reruns)
+            print(f"{'active' if lazy else 'all tabs':>10} {median * 1e3:>12.1f} {worst * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+데이터 로딩 방식별 컬럼 메모리 사용량 비교
+
+    python benchmark/memory_report.py data/merged_data_total.csv
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from columnar_cache import read_csv_cached  # noqa: E402
+from dataset import assign_categories, to_categoricals  # noqa: E402
+from web_main import CSV_DTYPES, TEXT_COLUMNS  # noqa: E402
+
+
+def memory_report(before, after):
+    """컬럼별 메모리 사용량(bytes) - after 가 0 인 컬럼은 지연 로딩, before 가 0 인 컬럼은 로딩 시 추가된 컬럼"""
+    report = pd.DataFrame({
+        "before": before.memory_usage(index=False, deep=True),
+        "after": after.memory_usage(index=False, deep=True),
+    })
+    report = report.fillna(0).astype(int)
+    report.loc["합계"] = report.sum()
+    report["ratio"] = (report["after"] / report["before"].where(report["before"] > 0)).round(3)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("csv_path", nargs="?", default="data/merged_data_total.csv")
+    args = parser.parse_args()
+
+    # 기존 방식: 모든 컬럼을 object 문자열로 읽음
+    before = pd.read_csv(args.csv_path, dtype=object)
+    # 현재 방식: 긴 텍스트 컬럼 제외, 반복 값 컬럼은 카테고리형
+    after = read_csv_cached(args.csv_path, dtype=CSV_DTYPES, usecols=lambda col: col not in TEXT_COLUMNS)
+    after = to_categoricals(assign_categories(after))
+
+    print(memory_report(before, after).to_string())
+
+
+if __name__ == "__main__":
+    main()
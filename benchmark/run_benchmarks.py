@@ -0,0 +1,201 @@
+"""
+web_main 데이터 함수 벤치마크 - 합성 데이터(synthetic_data.py) 크기별로 측정하고 기준값과 비교
+
+측정 항목
+- dataset_build: 공유 Dataset 생성 (범주형 변환, 기술 스택 / 검색 색인, 빈도표)
+- filter[...]: 새 세션에서 필터 적용 (make_query - 세션 필터 조합기 IncrementalFilter 생성, 조건별 마스크 계산)
+- filter_narrow[...]: 조건 하나가 빠진 필터를 본 세션에서 그 조건을 추가 (이전 선택에서 이어서 좁힘)
+- agg:*: 요약 지표, 회사 / 직무 상위 20, 필터 결과의 기술 스택 빈도, 기술 쌍 연관 지표, 동시 출현 표
+- chart:*: 애니메이션 막대 그래프 생성(캐시 없이), Plotly JSON 직렬화
+
+기준값 파일이 있으면 (기준값 대비 비율 > --tolerance) 이고 차이가 --noise-ms 보다 크면 REGRESSION 으로
+표시하고 종료 코드 1 로 끝남 (기준값은 측정한 장비에서 --save-baseline 으로 저장)
+
+    python benchmark/run_benchmarks.py --sizes 1000 10000 100000
+    python benchmark/run_benchmarks.py --sizes 1000 10000 100000 --save-baseline
+    python benchmark/run_benchmarks.py --sizes 1000000 --cases dataset_build filter
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import plotly.io
+import streamlit as st
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from synthetic_data import make_jobs  # noqa: E402
+from dataset import Dataset  # noqa: E402
+from selection import filter_components  # noqa: E402
+from web_main import (  # noqa: E402
+    TEXT_COLUMNS, build_animated_bar_chart, create_animated_bar_chart, make_query,
+)
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# (이름, 검색어, 회사, 기술 스택)
+FILTERS = [
+    ("none", "", "전체", []),
+    ("search", "java", "전체", []),
+    ("skills", "", "전체", ["Spring", "JPA"]),
+    ("search+skill", "백엔드", "전체", ["React"]),
+    ("company+search", "aws", "회사1", []),
+]
+
+
+def timed(func, repeat, setup=None):
+    """repeat 번 실행한 시간의 중앙값 (ms) 과 마지막 결과 (setup 은 매번 실행 전에 호출하고 시간에서 뺌)"""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1e3)
+    return float(np.median(timings)), result
+
+
+def session_query(dataset, components):
+    """대시보드 rerun 과 같은 경로 (세션의 IncrementalFilter 로 선택 후 질의 객체 생성)"""
+    query = make_query(dataset, components, "pandas")
+    query.count()
+    return query
+
+
+def new_session():
+    st.session_state.pop("row_filter", None)
+
+
+def filter_cases(dataset):
+    """필터 항목 - 새 세션(조건별 마스크 계산)과 조건 하나를 추가한 rerun(이전 선택에서 좁힘)"""
+    cases = []
+    for name, term, company, skills in FILTERS:
+        components = filter_components(term, company, skills)
+        cases.append((f"filter[{name}]", lambda c=components: session_query(dataset, c), 5, new_session))
+        if components:
+            # 조건 하나가 빠진 필터를 본 새 세션 (추가한 조건의 마스크만 새로 계산)
+            broader = components - {max(components)}
+
+            def narrow_setup(b=broader):
+                new_session()
+                session_query(dataset, b)
+
+            cases.append((f"filter_narrow[{name}]", lambda c=components: session_query(dataset, c), 5, narrow_setup))
+    return cases
+
+
+def build_cases(dataset):
+    """(이름, 함수, 반복 횟수, 준비 함수) 목록 - 데이터셋은 dataset_build 결과를 재사용"""
+    new_session()
+    query = session_query(dataset, filter_components("", "전체", ["Spring"]))
+    rows = query.rows
+    skill_index = dataset.skill_index
+    company_counts = query.value_counts("company").head(20).reset_index()
+    company_counts.columns = ["company", "count"]
+
+    def summary():
+        return query.count(), query.nunique("company"), query.nunique("position")
+
+    def animated_chart():
+        # 세션 간 그래프 캐시를 비워 그래프를 실제로 만드는 시간을 측정
+        build_animated_bar_chart.clear()
+        return create_animated_bar_chart(company_counts, "company", "count", "", orientation="v")
+
+    figure = animated_chart()
+    cases = filter_cases(dataset)
+    cases += [
+        ("agg:summary", summary, 5),
+        ("agg:top20_company", lambda: query.value_counts("company").head(20), 5),
+        ("agg:top20_position", lambda: query.value_counts("position").head(20), 5),
+        ("agg:skill_counts", query.skill_counts, 5),
+        ("agg:leaderboards", lambda: [skill_index.counts(view) for view in dataset.views.values()], 5),
+        ("agg:skill_pairs", lambda: skill_index.associations(rows, min_together=5), 3),
+        ("agg:cooccurrence_table", lambda: skill_index.cooccurrence_table(query.skill_counts().head(15).index, rows), 3),
+        ("chart:animated_bar", animated_chart, 5),
+        ("chart:to_json", lambda: plotly.io.to_json(figure, validate=False), 5),
+    ]
+    return cases
+
+
+def run(sizes, selected, repeat_scale):
+    """[{case, rows, ms}] - selected 가 있으면 이름이 그 접두어로 시작하는 항목만"""
+    results = []
+    for n_rows in sizes:
+        frame = make_jobs(n_rows).drop(columns=TEXT_COLUMNS)
+        build_ms, dataset = timed(lambda: Dataset(frame.copy()), 1)
+        cases = [("dataset_build", None, 1)] + build_cases(dataset)
+        for name, func, repeat, *setup in cases:
+            if selected and not any(name.startswith(prefix) for prefix in selected):
+                continue
+            if func is None:
+                ms = build_ms
+            else:
+                ms = timed(func, max(1, round(repeat * repeat_scale)), *setup)[0]
+            results.append({"case": name, "rows": n_rows, "ms": ms})
+    return results
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path, results, baseline):
+    baseline = dict(baseline)
+    baseline.update({f"{r['case']}|{r['rows']}": round(r["ms"], 3) for r in results})
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def report(results, baseline, tolerance, noise_ms):
+    """결과 표를 출력하고 회귀가 있었는지 반환"""
+    regressed = False
+    print(f"{'case':<30} {'rows':>10} {'ms':>10} {'baseline':>10} {'ratio':>7}  status")
+    for r in results:
+        base = baseline.get(f"{r['case']}|{r['rows']}")
+        if base is None:
+            base_text, ratio_text, status = "-", "-", "new"
+        else:
+            ratio = r["ms"] / base if base > 0 else float("inf")
+            # 아주 짧은 측정은 잡음이 크므로 차이가 noise_ms 이하면 비율과 관계없이 통과
+            slow = ratio > tolerance and r["ms"] - base > noise_ms
+            regressed = regressed or slow
+            base_text, ratio_text = f"{base:.2f}", f"{ratio:.2f}"
+            status = "REGRESSION" if slow else "ok"
+        print(f"{r['case']:<30} {r['rows']:>10,} {r['ms']:>10.2f} {base_text:>10} {ratio_text:>7}  {status}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--cases", nargs="*", help="측정할 항목 이름 접두어 (기본: 전체)")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=1.3, help="회귀로 볼 기준값 대비 비율")
+    parser.add_argument("--noise-ms", type=float, default=2.0, help="이 차이 이하는 회귀로 보지 않음")
+    parser.add_argument("--repeat-scale", type=float, default=1.0, help="항목별 반복 횟수 배율")
+    parser.add_argument("--json", help="결과를 JSON 파일로도 저장")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.cases, args.repeat_scale)
+    baseline = load_baseline(args.baseline)
+    regressed = report(results, baseline, args.tolerance, args.noise_ms)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if args.save_baseline:
+        save_baseline(args.baseline, results, baseline)
+        print(f"기준값 저장: {args.baseline}")
+    elif regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+동시 세션 수에 따른 대시보드 프로세스 메모리(RSS) 측정
+
+합성 데이터를 임시 폴더의 data/ 에 만들고 streamlit AppTest 세션을 --sessions 개수까지 늘려 가며
+각 세션에 서로 다른 검색어 / 기술 스택 필터를 적용한 상태로 유지 (세션은 같은 프로세스에서 실행되므로
+실제 서버처럼 공유 Dataset 과 캐시를 함께 씀). 세션 수마다 gc 후 RSS 와 세션당 증가량을 출력
+
+    python benchmark/session_load_test.py --rows 20000 --sessions 1 10 25 50
+
+RSS 는 /proc/self/statm 에서 읽음 (없는 환경에서는 최대 RSS)
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+
+import numpy as np
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from synthetic_data import make_jobs  # noqa: E402
+
+SEARCH_TERMS = ["", "", "java", "react", "백엔드", "aws"]
+SKILL_CHOICES = [[], [], ["Java"], ["React"], ["Spring", "JPA"], ["TypeScript"]]
+
+
+def rss_mb():
+    """현재 프로세스 RSS (MB) - /proc 가 없으면 최대 RSS"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def open_session(rng):
+    """AppTest 세션 하나를 열고 무작위 필터를 적용"""
+    app = AppTest.from_file(os.path.join(ROOT, "web_main.py"), default_timeout=120).run()
+    app.sidebar.text_input[0].input(SEARCH_TERMS[rng.integers(len(SEARCH_TERMS))]).run()
+    skills = SKILL_CHOICES[rng.integers(len(SKILL_CHOICES))]
+    if skills:
+        skill_select = app.sidebar.multiselect[0]
+        skill_select.set_value([skill for skill in skills if skill in skill_select.options]).run()
+    assert not app.exception, app.exception
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 25, 50])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.makedirs(os.path.join(work_dir, "data"))
+        make_jobs(args.rows).to_csv(os.path.join(work_dir, "data", "merged_data_total.csv"), index=False)
+        os.chdir(work_dir)
+        st.cache_data.clear()
+        st.cache_resource.clear()
+
+        rng = np.random.default_rng(args.seed)
+        counts = sorted(args.sessions)
+        gc.collect()
+        start_rss = rss_mb()
+        sessions = []
+        print(f"{'sessions':>8} {'RSS (MB)':>9} {'+ start (MB)':>13} {'per extra session (MB)':>23}")
+        for n_sessions in counts:
+            while len(sessions) < n_sessions:
+                sessions.append(open_session(rng))
+            gc.collect()
+            rss = rss_mb()
+            if n_sessions == counts[0]:
+                first_rss = rss
+            # 첫 측정 이후 늘어난 세션 하나당 증가량 (공유 Dataset / 캐시는 첫 세션에서 만들어짐)
+            extra = (rss - first_rss) / (n_sessions - counts[0]) if n_sessions > counts[0] else 0.0
+            print(f"{n_sessions:>8} {rss:>9.1f} {rss - start_rss:>13.1f} {extra:>23.2f}")
+
+
+if __name__ == "__main__":
+    main()
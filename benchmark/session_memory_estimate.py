@@ -0,0 +1,93 @@
+"""
+동시 세션 수에 따른 보관 데이터 크기 추정 (프로세스 메모리 측정이 아니라 객체 크기의 합)
+
+기존 방식은 세션마다 df.copy() 후 필터링한 데이터프레임을 들고 있고,
+현재 방식은 공유 Dataset 하나와 세션별 공고 위치 배열만 들고 있음
+공유 Dataset 에는 기술 스택 희소 행렬과 검색 색인이 함께 들어 있어 세션이 적을 때는 현재 방식이
+더 큼 (20k 행 기준 세션 1개 1.7MB vs 10.3MB, 15개 10.5MB vs 11.2MB, 25개 16.7MB vs 11.7MB)
+실제 프로세스 메모리(RSS)는 session_load_test.py 로 측정
+
+    python benchmark/session_memory_estimate.py --rows 20000 --sessions 1 10 50
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from synthetic_data import make_jobs  # noqa: E402
+from dataset import Dataset  # noqa: E402
+from selection import ALL_COMPANIES, IncrementalFilter, filter_components  # noqa: E402
+
+SEARCH_TERMS = ["", "", "java", "react", "백엔드", "aws"]
+SKILL_CHOICES = [[], [], ["Java"], ["React"], ["Spring", "JPA"], ["TypeScript"]]
+
+
+def make_frame(n_rows, seed=0):
+    return make_jobs(n_rows, seed, text=False)[["company", "position", "skill"]]
+
+
+def session_filters(n_sessions, seed=1):
+    rng = np.random.default_rng(seed)
+    return [
+        (SEARCH_TERMS[rng.integers(len(SEARCH_TERMS))], SKILL_CHOICES[rng.integers(len(SKILL_CHOICES))])
+        for _ in range(n_sessions)
+    ]
+
+
+def legacy_filter(df, search_term, selected_skills):
+    filtered_df = df.copy()
+    if search_term:
+        search_mask = (
+            filtered_df["company"].str.contains(search_term, case=False, na=False)
+            | filtered_df["position"].str.contains(search_term, case=False, na=False)
+            | filtered_df["skill"].str.contains(search_term, case=False, na=False)
+        )
+        filtered_df = filtered_df[search_mask]
+    for skill in selected_skills:
+        filtered_df = filtered_df[filtered_df["skill"].str.contains(skill, case=False, na=False)]
+    return filtered_df
+
+
+def frame_bytes(df):
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def dataset_bytes(dataset):
+    """공유 Dataset 의 대략적인 크기 (데이터프레임 + 희소 행렬 + 역색인)"""
+    matrix = dataset.skill_index.matrix
+    by_skill = dataset.skill_index.by_skill
+    sparse_bytes = sum(m.data.nbytes + m.indices.nbytes + m.indptr.nbytes for m in (matrix, by_skill))
+    text_bytes = sum(rows.nbytes for rows in dataset.text_index.postings.values())
+    return frame_bytes(dataset.frame) + sparse_bytes + text_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 25, 50])
+    args = parser.parse_args()
+
+    frame = make_frame(args.rows)
+    dataset = Dataset(frame.copy())
+    legacy_shared = frame_bytes(frame) / 1e6
+    shared = dataset_bytes(dataset) / 1e6
+
+    # 공유 데이터 + 세션마다 필터 결과를 들고 있는 상태의 메모리
+    print(f"{'sessions':>8} {'legacy (MB)':>12} {'shared + row ids (MB)':>22}")
+    for n_sessions in args.sessions:
+        filters = session_filters(n_sessions)
+        legacy_sessions = [legacy_filter(frame, term, skills) for term, skills in filters]
+        # 세션마다 대시보드와 같은 필터 조합기(IncrementalFilter)로 선택한 공고 위치 배열
+        sessions = [
+            IncrementalFilter(dataset).select(filter_components(term, ALL_COMPANIES, skills))
+            for term, skills in filters
+        ]
+        legacy_total = legacy_shared + sum(frame_bytes(df) for df in legacy_sessions) / 1e6
+        total = shared + sum(rows.nbytes for rows in sessions) / 1e6
+        print(f"{n_sessions:>8} {legacy_total:>12.1f} {total:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
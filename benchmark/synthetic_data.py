@@ -0,0 +1,148 @@
+"""
+벤치마크용 합성 채용공고 데이터 (web_main 이 읽는 merged_data_total.csv 와 같은 컬럼)
+
+- company / 기술 스택은 Zipf 분포 (소수의 회사 / 기술이 대부분의 공고를 차지하는 실제 분포와 비슷하게)
+- 회사명 일부는 법인 표기 / UI 문구가 붙은 표기, 기술 스택 일부는 별칭 표기로 만들어 표준화 경로도 거침
+- 주요업무 / 자격요건 본문은 공고의 기술 스택으로 문장을 만들어 채움 (본문 기술 추출 / 중복 검사용)
+- 행 단위 반복 없이 numpy 배열로 생성 (1M 행에 몇 초)
+
+    python benchmark/synthetic_data.py --rows 100000 --out data/merged_data_total.csv
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+SKILL_POOL = [
+    "Java", "Spring", "Spring Boot", "JPA", "MySQL", "Python", "Django", "AWS", "Docker",
+    "Kubernetes", "React", "TypeScript", "JavaScript", "Next.js", "Vue.js", "Node.js",
+    "Git", "REST API", "Redis", "Kotlin", "Go", "PostgreSQL", "HTML", "CSS", "AI", "API",
+    "Kafka", "Elasticsearch", "MongoDB", "GraphQL", "Flutter", "Swift", "FastAPI", "Nest.js",
+    "Terraform", "Jenkins", "GCP", "Azure", "Linux", "Oracle", "C++", "C#", "Rust", "Scala",
+    "Spark", "Airflow", "Hadoop", "Figma", "Jira", "Svelte",
+]
+# 같은 기술의 다른 표기 (skill_aliases 에서 표준 이름으로 합쳐짐)
+SKILL_VARIANTS = {
+    "Spring Boot": "SpringBoot", "JavaScript": "JS", "TypeScript": "TS", "Kubernetes": "k8s",
+    "Node.js": "NodeJS", "PostgreSQL": "Postgres", "Vue.js": "Vue", "Next.js": "NextJS",
+}
+POSITIONS = {
+    "backend": ["백엔드 개발자", "Backend Engineer", "서버 개발자 (백엔드)", "Back-end 개발자"],
+    "frontend": ["프론트엔드 개발자", "Frontend Engineer", "웹 프론트엔드 개발자", "Front-end 개발자"],
+    "fullstack": ["풀스택 개발자", "Fullstack Engineer", "Full-stack 웹 개발자"],
+}
+COMPANY_DECORATIONS = ["(주){}", "{} 주식회사", "㈜ {}", "{}\n기업정보 보기"]
+DUTIES = ["{} 기반 서비스 개발 및 운영", "{} 를 활용한 API 설계", "{} 환경의 신규 기능 개발", "{} 성능 개선"]
+REQUIREMENTS = ["{} 실무 경험 {}년 이상", "{} 에 대한 이해", "{} 사용 경험이 있으신 분"]
+
+
+def zipf_weights(n, exponent=1.1):
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+
+def _join_groups(rows, values, n_rows, sep):
+    """(행 번호, 값) 쌍을 행별로 sep 으로 이어 붙인 문자열 배열 (rows 는 정렬된 상태, 값이 없는 행은 None)"""
+    values = list(values)
+    starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]]) if len(rows) else np.empty(0, dtype=np.int64)
+    ends = np.r_[starts[1:], len(rows)]
+    result = np.full(n_rows, None, dtype=object)
+    result[rows[starts]] = [sep.join(values[start:end]) for start, end in zip(starts.tolist(), ends.tolist())]
+    return result
+
+
+def make_skills(n_rows, rng, max_skills=8, missing=0.05, variant_rate=0.05):
+    """
+    공고별 기술 스택 문자열 ("Java, Spring, AWS" 형식)
+    - 공고마다 1~max_skills 개를 Zipf 가중치로 뽑고, 한 공고 안의 중복은 제거
+    - variant_rate 비율의 토큰은 별칭 표기로, missing 비율의 공고는 기술 스택 없음(NaN)
+    """
+    counts = rng.integers(1, max_skills + 1, size=n_rows)
+    rows = np.repeat(np.arange(n_rows), counts)
+    picks = rng.choice(len(SKILL_POOL), size=len(rows), p=zipf_weights(len(SKILL_POOL)))
+    keep = ~pd.DataFrame({"row": rows, "skill": picks}).duplicated().to_numpy()
+    rows, picks = rows[keep], picks[keep]
+
+    tokens = np.array(SKILL_POOL, dtype=object)[picks]
+    variants = np.array([SKILL_VARIANTS.get(skill, skill) for skill in SKILL_POOL], dtype=object)[picks]
+    use_variant = rng.random(len(tokens)) < variant_rate
+    tokens[use_variant] = variants[use_variant]
+
+    skills = _join_groups(rows, tokens, n_rows, ", ")
+    skills[rng.random(n_rows) < missing] = np.nan
+    return skills, rows, picks
+
+
+def make_companies(n_rows, rng, n_companies=None, decorated=0.03):
+    """Zipf 분포 회사명 (decorated 비율은 법인 표기 / UI 문구가 붙은 표기)"""
+    n_companies = n_companies or max(10, n_rows // 20)
+    ranks = rng.choice(n_companies, size=n_rows, p=zipf_weights(n_companies))
+    names = pd.Series(ranks).map(lambda rank: f"회사{rank}").to_numpy(dtype=object)
+    decorate = np.flatnonzero(rng.random(n_rows) < decorated)
+    templates = rng.integers(0, len(COMPANY_DECORATIONS), size=len(decorate))
+    for i, template in zip(decorate, templates):
+        names[i] = COMPANY_DECORATIONS[template].format(names[i])
+    return names
+
+
+def make_texts(n_rows, rows, picks, rng, templates, sentences=3, with_years=False):
+    """공고의 앞쪽 기술 스택으로 문장을 만들어 줄바꿈으로 이은 본문"""
+    first = np.r_[True, rows[1:] != rows[:-1]]
+    position_in_row = np.arange(len(rows)) - np.flatnonzero(first)[np.cumsum(first) - 1]
+    keep = position_in_row < sentences
+    rows, picks = rows[keep], picks[keep]
+    # (문장 틀, 기술, 경력 연수) 조합별 문장을 미리 만들어 두고 번호로 골라 씀
+    years = range(1, 8) if with_years else [None]
+    sentences_table = np.array([
+        "• " + template.format(skill, year) for template in templates for skill in SKILL_POOL for year in years
+    ], dtype=object)
+    template_ids = rng.integers(0, len(templates), size=len(rows))
+    year_ids = rng.integers(0, len(years), size=len(rows))
+    lines = sentences_table[(template_ids * len(SKILL_POOL) + picks) * len(years) + year_ids]
+    texts = _join_groups(rows, lines, n_rows, "\n")
+    texts[pd.isna(texts)] = "• 서비스 개발 및 운영"
+    return texts
+
+
+def make_jobs(n_rows, seed=0, text=True):
+    """
+    web_main 이 읽는 컬럼의 합성 공고 데이터프레임
+    컬럼: company, position, skill, category, 링크 (+ text=True 이면 주요업무, 자격요건)
+    """
+    rng = np.random.default_rng(seed)
+    skills, rows, picks = make_skills(n_rows, rng)
+    categories = rng.choice(list(POSITIONS), size=n_rows, p=[0.5, 0.3, 0.2])
+    positions = np.empty(n_rows, dtype=object)
+    for category, titles in POSITIONS.items():
+        selected = categories == category
+        positions[selected] = rng.choice(titles, size=selected.sum())
+
+    df = pd.DataFrame({
+        "company": make_companies(n_rows, rng),
+        "position": positions,
+        "skill": skills,
+        "category": categories,
+        "링크": [f"https://jumpit.saramin.co.kr/position/{50000 + i}" for i in range(n_rows)],
+    })
+    if text:
+        df["주요업무"] = make_texts(n_rows, rows, picks, rng, DUTIES)
+        df["자격요건"] = make_texts(n_rows, rows, picks, rng, REQUIREMENTS, with_years=True)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="data/merged_data_total.csv")
+    args = parser.parse_args()
+
+    df = make_jobs(args.rows, args.seed)
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    df.to_csv(args.out, index=False, encoding="utf-8-sig")
+    print(f"{len(df):,}개 공고 -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
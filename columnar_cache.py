@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow.parquet
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+
+CACHE_DIR_NAME = ".cache"
+
+# 사이드카 Parquet 의 행 그룹 크기 - 일부 행만 읽을 때는 그 행이 들어 있는 행 그룹만 읽음
+ROW_GROUP_ROWS = 8192
+
+
+def file_signature(path):
+    """파일 변경 여부 판단용 (수정 시각 ns, 크기)"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sidecar_paths(csv_path):
+    """CSV 옆 .cache 폴더에 저장되는 Parquet 파일과 메타데이터 파일 경로"""
+    cache_dir = os.path.join(os.path.dirname(csv_path), CACHE_DIR_NAME)
+    name = os.path.basename(csv_path)
+    return os.path.join(cache_dir, name + ".parquet"), os.path.join(cache_dir, name + ".json")
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path, write):
+    # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _write_meta(meta_path, meta):
+    def write(path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+    _write_atomic(meta_path, write)
+
+
+def _project(columns, usecols):
+    if usecols is None:
+        return list(columns)
+    if callable(usecols):
+        return [col for col in columns if usecols(col)]
+    return [col for col in columns if col in usecols]
+
+
+def _read_parquet(parquet_path, usecols):
+    if usecols is None:
+        return pd.read_parquet(parquet_path)
+    names = pyarrow.parquet.read_schema(parquet_path).names
+    return pd.read_parquet(parquet_path, columns=_project(names, usecols))
+
+
+def _fresh_sidecar(csv_path, dtype_key):
+    """원본과 내용이 같은 사이드카가 있으면 Parquet 경로, 없으면 None"""
+    parquet_path, meta_path = sidecar_paths(csv_path)
+    mtime_ns, size = file_signature(csv_path)
+    meta = _read_meta(meta_path)
+    if not meta or meta.get("dtype") != dtype_key or not os.path.exists(parquet_path):
+        return None
+    if meta["mtime_ns"] == mtime_ns and meta["size"] == size:
+        return parquet_path
+    if meta["size"] == size and meta["sha1"] == file_hash(csv_path):
+        # 내용은 같고 수정 시각만 바뀐 경우 (복사, touch 등)
+        _write_meta(meta_path, dict(meta, mtime_ns=mtime_ns))
+        return parquet_path
+    return None
+
+
+def read_csv_cached(csv_path, dtype=None, usecols=None):
+    """
+    CSV 를 읽되, 처음 읽을 때 Parquet 사이드카를 만들어 두고 이후에는 사이드카에서 읽음
+    usecols: 읽을 컬럼 목록 또는 컬럼명을 받는 함수 (pd.read_csv 와 같음, 없는 컬럼은 무시)
+
+    - 원본의 (수정 시각, 크기)가 같으면 사이드카를 그대로 사용
+    - 수정 시각만 바뀌고 내용 해시가 같으면 메타데이터만 갱신하고 사이드카 사용
+    - 내용이 바뀌었거나 dtype 설정이 바뀌면 CSV 를 다시 읽고 사이드카를 새로 씀
+    - pyarrow 가 없으면 캐시 없이 pd.read_csv 로 동작
+    """
+    if not HAS_PARQUET:
+        header = pd.read_csv(csv_path, nrows=0).columns
+        return pd.read_csv(csv_path, dtype=dtype, usecols=_project(header, usecols))
+
+    dtype_key = json.dumps(dtype, sort_keys=True, default=str)
+    parquet_path = _fresh_sidecar(csv_path, dtype_key)
+    if parquet_path is not None:
+        return _read_parquet(parquet_path, usecols)
+
+    # 사이드카에는 모든 컬럼을 저장하고, 반환할 때만 필요한 컬럼으로 줄임
+    mtime_ns, size = file_signature(csv_path)
+    df = pd.read_csv(csv_path, dtype=dtype)
+    parquet_path, meta_path = sidecar_paths(csv_path)
+    try:
+        os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+        _write_atomic(parquet_path, lambda path: df.to_parquet(path, index=False, row_group_size=ROW_GROUP_ROWS))
+        _write_meta(meta_path, {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "sha1": file_hash(csv_path),
+            "dtype": dtype_key,
+        })
+    except OSError:
+        # 읽기 전용 폴더 등에서는 캐시 없이 사용
+        pass
+    return df[_project(df.columns, usecols)]
+
+
+def read_rows_cached(csv_path, rows, dtype=None, usecols=None):
+    """
+    CSV 의 일부 행만 읽음 (rows: 0부터 시작하는 행 위치, 반환 데이터프레임의 인덱스도 행 위치)
+    사이드카에서 해당 행이 들어 있는 행 그룹의 usecols 컬럼만 읽으므로 표 한 페이지를 보여 줄 때 씀
+    (사이드카가 없거나 원본이 바뀌었으면 read_csv_cached 로 전체를 읽어 사이드카를 새로 만듦)
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    parquet_path = None
+    if HAS_PARQUET:
+        parquet_path = _fresh_sidecar(csv_path, json.dumps(dtype, sort_keys=True, default=str))
+    if parquet_path is None:
+        df = read_csv_cached(csv_path, dtype=dtype, usecols=usecols)
+        return df.iloc[rows].set_axis(rows)
+
+    parquet_file = pyarrow.parquet.ParquetFile(parquet_path)
+    metadata = parquet_file.metadata
+    sizes = np.array([metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)], dtype=np.int64)
+    starts = np.cumsum(sizes) - sizes
+    groups = np.searchsorted(starts, rows, side="right") - 1
+    selected = np.unique(groups)
+    table = parquet_file.read_row_groups(
+        selected.tolist(), columns=_project(parquet_file.schema_arrow.names, usecols)
+    )
+    # 읽은 행 그룹들을 이어 붙인 테이블 안에서의 위치로 변환
+    read_starts = np.cumsum(sizes[selected]) - sizes[selected]
+    local = rows - starts[groups] + read_starts[np.searchsorted(selected, groups)]
+    return table.take(local).to_pandas().set_axis(rows)
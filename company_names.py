@@ -0,0 +1,244 @@
+"""
+회사명 표준화 - 표기만 다른 같은 회사를 하나의 회사 ID 로 묶음
+
+수집 시기마다 공백, (주) / 주식회사 같은 법인 표기, 상세 페이지의 "기업정보 보기" 같은 UI 문구가
+섞여 같은 회사가 여러 개로 집계되므로
+1) 규칙으로 정리한 키가 같으면 같은 회사
+2) 키가 조금 다른 경우는 문자 2-gram 블로킹으로 후보를 좁힌 뒤 유사도가 기준 이상이면 같은 회사
+로 묶고, 회사명 -> 회사 ID 매핑을 CSV 로 저장해 다음 로딩 / 수집에서도 같은 ID 를 사용
+
+매핑 파일은 수집 / 병합 단계(이 스크립트, snapshot_store.py)에서만 갱신하고,
+대시보드는 매핑을 읽기만 함 (새 회사는 메모리에서만 ID 를 받음)
+
+    python company_names.py data/merged_data_total.csv
+"""
+import argparse
+import os
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+import pandas as pd
+
+MAPPING_FILE = "company_ids.csv"
+
+# 법인 표기 (앞뒤 어디에 붙어도 제거)
+_LEGAL_FORMS = re.compile(
+    r"\(주\)|㈜|\(유\)|\(사\)|주식회사|유한회사|유한책임회사|"
+    r"\b(?:co\.?,?\s*ltd\.?|corp(?:oration)?\.?|inc\.?|ltd\.?)(?=\W|$)",
+    re.IGNORECASE,
+)
+# 상세 페이지에서 회사명과 함께 긁히는 UI 문구
+_UI_TEXT = re.compile(r"(기업정보\s*보기|기업\s*정보|팔로우|채용\s*중|관심\s*기업)\s*$")
+_NON_WORD = re.compile(r"[\s\W_]+")
+
+
+def clean_company(name):
+    """표시용 회사명 정리 (첫 줄만, UI 문구 / 법인 표기 제거, 공백 정리)"""
+    name = str(name).strip().splitlines()[0] if str(name).strip() else ""
+    name = _UI_TEXT.sub("", name)
+    name = _LEGAL_FORMS.sub(" ", name)
+    return " ".join(name.split())
+
+
+def company_key(name):
+    """비교용 키 (정리한 이름에서 공백 / 기호 제거, 소문자)"""
+    return _NON_WORD.sub("", clean_company(name).lower())
+
+
+def _bigrams(key):
+    return {key[i:i + 2] for i in range(len(key) - 1)} or {key}
+
+
+def match_keys(keys, threshold=0.85, max_block=200, new_from=0):
+    """
+    비슷한 키끼리 묶은 그룹 번호 (그룹에서 가장 앞 키의 위치)
+
+    - 키를 2-gram 으로 나누고 2-gram 별 키 목록(블록)을 만든 뒤,
+      같은 블록에 있는 키끼리만 공유 2-gram 수로 Dice 유사도를 계산 (전체 쌍을 비교하지 않음)
+    - 너무 많은 키가 공유하는 2-gram(max_block 초과)은 구분력이 없어 블록으로 쓰지 않음
+    - new_from 앞의 키(이미 매핑된 키)끼리는 비교하지 않고, 그 뒤의 새 키만 다른 모든 키와 비교
+    """
+    grams = [_bigrams(key) for key in keys]
+    blocks = defaultdict(list)
+    for i, key_grams in enumerate(grams):
+        for gram in key_grams:
+            blocks[gram].append(i)
+
+    parent = list(range(len(keys)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(new_from, len(keys)):
+        key_grams = grams[i]
+        shared = Counter()
+        for gram in key_grams:
+            block = blocks[gram]
+            if len(block) <= max_block:
+                shared.update(j for j in block if j > i or j < new_from)
+        for j, n_shared in shared.items():
+            if 2 * n_shared / (len(key_grams) + len(grams[j])) >= threshold:
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    return np.array([find(i) for i in range(len(keys))])
+
+
+def load_mapping(path):
+    """저장된 매핑 (key, company_id, company_name) - 없으면 빈 데이터프레임"""
+    if path and os.path.exists(path):
+        return pd.read_csv(path, dtype={"key": str, "company_name": str}, keep_default_na=False)
+    return pd.DataFrame({"key": pd.Series(dtype=str), "company_id": pd.Series(dtype=int),
+                         "company_name": pd.Series(dtype=str)})
+
+
+def save_mapping(mapping, path):
+    # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    mapping.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+    os.replace(tmp_path, path)
+
+
+def update_mapping(names, mapping, threshold=0.85):
+    """
+    회사명 목록을 기존 매핑에 반영한 새 매핑
+
+    - 이미 있는 키는 기존 ID 를 그대로 유지 (ID 가 바뀌지 않음)
+    - 새 키는 비슷한 기존 키가 있으면 그 ID, 없으면 새 ID 를 받고 가장 많이 쓰인 표기를 이름으로 사용
+    """
+    counts = pd.Series(names, dtype=object).dropna().value_counts()
+    cleaned = pd.Series([clean_company(name) for name in counts.index], index=counts.index)
+    keys = pd.Series([company_key(name) for name in counts.index], index=counts.index)
+
+    known = dict(zip(mapping["key"], mapping["company_id"]))
+    new_keys = [key for key in pd.unique(keys) if key and key not in known]
+    if not new_keys:
+        return mapping
+
+    all_keys = list(known) + new_keys
+    groups = match_keys(all_keys, threshold, new_from=len(known))
+    group_ids = defaultdict(list)
+    for key, group in zip(all_keys, groups):
+        if key in known:
+            group_ids[group].append(known[key])
+
+    next_id = int(mapping["company_id"].max()) + 1 if len(mapping) else 0
+    # 키별로 가장 많이 쓰인 표기와 사용 횟수 (counts 가 빈도 내림차순이라 처음 나온 표기가 가장 많음)
+    names_by_key, frequency = {}, Counter()
+    for name, key, count in zip(cleaned, keys, counts):
+        names_by_key.setdefault(key, name)
+        frequency[key] += count
+
+    # 새로 생긴 ID 의 이름은 그 ID 에 속한 표기 중 가장 많이 쓰인 것 (기존 ID 는 이름 유지)
+    id_names = dict(zip(mapping["company_id"], mapping["company_name"]))
+    best = {}
+    rows = []
+    for key, group in zip(all_keys[len(known):], groups[len(known):]):
+        if not group_ids[group]:
+            group_ids[group].append(next_id)
+            next_id += 1
+        company_id = min(group_ids[group])
+        rows.append((key, company_id))
+        if company_id not in id_names and frequency[key] > best.get(company_id, (0, None))[0]:
+            best[company_id] = (frequency[key], names_by_key[key])
+
+    id_names.update({company_id: name for company_id, (_, name) in best.items()})
+    added = pd.DataFrame(rows, columns=["key", "company_id"])
+    added["company_name"] = added["company_id"].map(id_names)
+    return pd.concat([mapping, added], ignore_index=True)
+
+
+def company_labels(mapping):
+    """
+    회사 ID -> 표시 이름 (Series)
+    이름이 같은 다른 회사는 뒤에 생긴 ID 에 "(#ID)" 를 붙여 구분하므로 표시 이름과 회사 ID 가 1:1
+    (company 컬럼으로 묶으면 회사 ID 로 묶는 것과 같음)
+    """
+    names = mapping.drop_duplicates("company_id").set_index("company_id")["company_name"].sort_index()
+    repeated = names.duplicated(keep="first")
+    return names.where(~repeated, names + " (#" + names.index.astype(str) + ")")
+
+
+class CompanyMapping:
+    """
+    회사명 -> 회사 ID 매핑
+
+    - 파일에서 읽은 매핑에 새 회사를 메모리에서만 추가 (같은 객체로 처리하는 동안은 새 회사의 ID 가 유지됨)
+    - 파일에는 save() 를 부를 때만 씀 (수집 / 병합 단계) - 대시보드는 읽기만 하고 저장하지 않음
+    """
+
+    def __init__(self, path=None, threshold=0.85):
+        self.path = path
+        self.threshold = threshold
+        self.reload()
+
+    def reload(self):
+        self.table = load_mapping(self.path)
+        self._saved_rows = len(self.table)
+
+    def canonicalize(self, df):
+        """
+        company 컬럼을 회사 ID 별 표시 이름으로 바꾸고 company_id 컬럼을 추가
+        고유 회사명 단위로 매핑을 만든 뒤 카테고리 코드로 행에 적용 (행 수가 아니라 고유 이름 수에 비례)
+        """
+        codes, uniques = pd.factorize(df["company"].astype(object))
+        self.table = update_mapping(df["company"], self.table, self.threshold)
+
+        unique_keys = [company_key(name) for name in uniques]
+        ids = self.table.set_index("key")["company_id"].reindex(unique_keys).to_numpy()
+        names = company_labels(self.table).reindex(ids).to_numpy()
+        # 매핑에 없는 값(빈 이름 등)은 원래 값을 그대로 사용
+        names = np.where(pd.isna(names), np.asarray(uniques, dtype=object), names)
+
+        valid = codes >= 0
+        company_ids = np.full(len(df), -1, dtype=np.int64)
+        company_ids[valid] = np.nan_to_num(ids.astype(float), nan=-1).astype(np.int64)[codes[valid]]
+        companies = np.full(len(df), None, dtype=object)
+        companies[valid] = names[codes[valid]]
+        df["company"] = companies
+        df["company_id"] = company_ids
+        return df
+
+    def save(self):
+        """메모리에서 추가된 회사가 있으면 매핑 파일에 저장"""
+        if self.path and len(self.table) != self._saved_rows:
+            save_mapping(self.table, self.path)
+            self._saved_rows = len(self.table)
+
+
+def canonicalize_companies(df, mapping_path=None, threshold=0.85):
+    """
+    수집 / 병합 단계용 회사명 표준화 - CompanyMapping.canonicalize 후 새 회사가 생기면 매핑 파일에 저장
+    (쓸 수 없는 위치면 저장만 건너뜀)
+    """
+    mapping = CompanyMapping(mapping_path, threshold)
+    df = mapping.canonicalize(df)
+    try:
+        mapping.save()
+    except OSError:
+        pass
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("csv_path")
+    parser.add_argument("--mapping", help=f"매핑 파일 (기본: CSV 와 같은 폴더의 {MAPPING_FILE})")
+    parser.add_argument("--threshold", type=float, default=0.85, help="같은 회사로 볼 2-gram Dice 유사도")
+    args = parser.parse_args()
+
+    mapping_path = args.mapping or os.path.join(os.path.dirname(args.csv_path), MAPPING_FILE)
+    df = pd.read_csv(args.csv_path, dtype=str)
+    column = "company" if "company" in df.columns else "회사명"
+    before = df[column].nunique()
+    df = canonicalize_companies(df.rename(columns={column: "company"}), mapping_path, args.threshold)
+    print(f"회사명 {before}개 -> 회사 {df['company_id'].nunique()}개 ({mapping_path} 저장)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+데이터 파일 감시 - 수집 스크립트가 CSV 를 갱신하면 추가된 행만 읽어 공유 데이터셋에 반영
+
+수집 결과는 기존 행 뒤에 새 행을 붙인 CSV 로 다시 저장되므로,
+- 마지막으로 읽은 부분(처음 ~ 읽은 바이트 위치)의 내용이 그대로면 그 뒤에 붙은 행만 파싱해
+  Dataset.append 로 새 버전을 만들고
+- 앞부분이 바뀌었으면(헤더 변경, 행 수정 / 삭제, 파일이 줄어듦) 전체를 다시 읽음
+별도 의존성 없이 os.stat 폴링으로 동작 (파일이 그대로면 확인 비용은 stat 한 번)
+"""
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+
+import pandas as pd
+
+from columnar_cache import file_signature
+
+UNCHANGED = "unchanged"
+APPENDED = "appended"
+REPLACED = "replaced"
+
+logger = logging.getLogger(__name__)
+
+
+def _prefix_digest(path, length, chunk_size=1 << 20):
+    """파일 앞 length 바이트의 sha1 (이어서 갱신할 수 있도록 해시 객체로 반환)"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        while length > 0:
+            chunk = f.read(min(chunk_size, length))
+            if not chunk:
+                break
+            digest.update(chunk)
+            length -= len(chunk)
+    return digest
+
+
+class CsvCursor:
+    """CSV 파일에서 이미 읽은 부분 (바이트 위치, 그 부분의 해시, 읽을 때의 파일 서명, 헤더)"""
+
+    def __init__(self, path, offset, digest, signature, columns):
+        self.path = path
+        self.offset = offset
+        self.digest = digest
+        self.signature = signature
+        self.columns = columns
+
+    @classmethod
+    def open(cls, path):
+        """파일 전체를 읽은 상태의 커서"""
+        signature = file_signature(path)
+        columns = list(pd.read_csv(path, nrows=0).columns)
+        return cls(path, signature[1], _prefix_digest(path, signature[1]), signature, columns)
+
+    def poll(self, dtype=None, usecols=None):
+        """
+        마지막으로 읽은 뒤의 변경 -> (변경 종류, 추가된 행, 새 커서)
+
+        - UNCHANGED: 그대로 (수정 시각만 바뀐 경우, 마지막 행을 아직 쓰는 중인 경우 포함)
+        - APPENDED: 읽은 부분은 그대로이고 뒤에 완성된 행이 추가됨
+        - REPLACED: 앞부분이 바뀜 -> 전체를 다시 읽어야 함 (새 커서 없음)
+        """
+        signature = file_signature(self.path)
+        if signature == self.signature:
+            return UNCHANGED, None, self
+        size = signature[1]
+        if size < self.offset or _prefix_digest(self.path, self.offset).digest() != self.digest.digest():
+            return REPLACED, None, None
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            tail = f.read(size - self.offset)
+        # 마지막 줄바꿈까지만 읽음 (그 뒤는 쓰는 중인 행이므로 다음 확인에서 읽음)
+        tail = tail[:tail.rfind(b"\n") + 1]
+        if not tail:
+            return UNCHANGED, None, self
+
+        digest = self.digest.copy()
+        digest.update(tail)
+        cursor = CsvCursor(self.path, self.offset + len(tail), digest, signature, self.columns)
+        if not tail.strip():
+            return UNCHANGED, None, cursor
+        try:
+            rows = pd.read_csv(io.BytesIO(tail), header=None, names=self.columns, dtype=dtype, usecols=usecols)
+        except pd.errors.ParserError:
+            # 따옴표 안의 줄바꿈(본문 컬럼)에서 끊긴 경우 - 행을 다 쓴 뒤 다시 읽음
+            return UNCHANGED, None, self
+        return APPENDED, rows, cursor
+
+
+class DatasetWatcher:
+    """
+    데이터 파일 하나를 주기적으로 확인하며 최신 데이터셋을 유지 (프로세스당 하나, 모든 세션이 공유)
+
+    - load(path, signature): 파일 전체를 읽어 데이터셋 생성
+    - append(dataset, rows, signature): 추가된 행만 반영한 새 버전의 데이터셋 생성
+    데이터셋은 교체만 하고 수정하지 않으므로, 렌더링 중인 세션은 이전 버전을 끝까지 사용하고
+    다음 rerun 에서 새 버전(version = 새 파일 서명)을 받음
+    확인 중 오류가 나면 로그만 남기고 이전 데이터셋을 유지한 채 다음 주기에 다시 확인
+    """
+
+    def __init__(self, path, load, append, dtype=None, usecols=None, interval=5.0, load_attempts=5, backoff=0.5):
+        self.path = path
+        self.load = load
+        self.append = append
+        self.dtype = dtype
+        self.usecols = usecols
+        self.interval = interval
+        self.load_attempts = load_attempts
+        self.backoff = backoff
+        self.appends = 0
+        self.reloads = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.dataset, self._cursor = self._load()
+
+    def _load(self):
+        for attempt in range(self.load_attempts):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            cursor = CsvCursor.open(self.path)
+            dataset = self.load(self.path, cursor.signature)
+            # 읽는 도중 파일이 바뀌었으면 읽은 내용과 커서가 어긋나므로 잠시 기다렸다가 다시 읽음
+            if file_signature(self.path) == cursor.signature:
+                return dataset, cursor
+        raise RuntimeError(f"{self.path} 가 읽는 동안 계속 바뀌어 {self.load_attempts}번 시도 후 포기")
+
+    def check(self):
+        """파일을 한 번 확인해 바뀐 내용을 반영 (데이터셋이 새 버전으로 바뀌었으면 True)"""
+        with self._lock:
+            if not os.path.exists(self.path):
+                return False
+            change, rows, cursor = self._cursor.poll(self.dtype, self.usecols)
+            if change == APPENDED:
+                self.dataset = self.append(self.dataset, rows, cursor.signature)
+                self.appends += 1
+            elif change == REPLACED:
+                self.dataset, cursor = self._load()
+                self.reloads += 1
+            self._cursor = cursor
+            return change != UNCHANGED
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="dataset-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                # 수집 스크립트가 파일을 교체하는 순간, 잘못된 행 등 - 스레드가 멈추지 않도록
+                # 이전 데이터셋을 유지하고 다음 확인에서 다시 시도
+                self.errors += 1
+                logger.exception("데이터 파일 확인 실패: %s", self.path)
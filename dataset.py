@@ -0,0 +1,190 @@
+import copy
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from dedup import GROUP_COLUMN, duplicate_groups
+from skill_index import SkillIndex
+from skill_miner import posting_texts
+from text_index import TextIndex
+
+# 반복되는 값이 많은 컬럼은 카테고리형으로 저장해 메모리 절약
+CATEGORICAL_COLUMNS = ["company", "position", "category"]
+
+# 본문(주요업무 / 자격요건)에서 추출한 기술 스택 컬럼 (skill_miner.py 로 생성)
+TEXT_SKILL_COLUMN = "text_skill"
+
+# 직무 카테고리별 키워드 (수집 스크립트의 JOB_CATEGORIES 와 동일), 앞에 있을수록 우선
+CATEGORY_KEYWORDS = {
+    "fullstack": ['풀스택', 'fullstack', 'full-stack', 'full stack'],
+    "backend": ['백엔드', 'backend', 'back-end', 'back end'],
+    "frontend": ['프론트엔드', 'frontend', 'front-end', 'front end'],
+}
+
+
+def assign_categories(df):
+    """
+    category 컬럼을 backend / frontend / fullstack / etc 로 정규화
+    (category 컬럼이 없으면 직무명의 키워드로 판단)
+    """
+    source = df["category"] if "category" in df.columns else df["position"]
+    source = source.astype(object).fillna("").astype(str).str.lower()
+    conditions = [
+        source.str.contains("|".join(re.escape(kw) for kw in keywords)).to_numpy()
+        for keywords in CATEGORY_KEYWORDS.values()
+    ]
+    df["category"] = pd.Categorical(
+        np.select(conditions, list(CATEGORY_KEYWORDS), default="etc"),
+        categories=list(CATEGORY_KEYWORDS) + ["etc"],
+    )
+    return df
+
+
+def to_categoricals(df):
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def concat_frames(frame, rows):
+    """
+    기존 데이터 뒤에 행을 붙임 - 카테고리형 컬럼은 값 목록을 합쳐 카테고리형으로 유지
+    (합친 값 목록은 처음부터 읽은 것과 같은 정렬 순서)
+    """
+    combined = pd.concat([frame, rows])
+    for col in CATEGORICAL_COLUMNS:
+        if col in frame.columns and not frame[col].cat.categories.equals(rows[col].cat.categories):
+            combined[col] = pd.Series(
+                union_categoricals([frame[col], rows[col]], sort_categories=True), index=combined.index
+            )
+    return combined
+
+
+def build_category_views(df):
+    """카테고리별 공고 위치 배열 - 데이터를 복사하지 않고 인덱스로만 부분집합을 표현"""
+    views = {name: np.empty(0, dtype=np.intp) for name in df["category"].cat.categories}
+    views.update(df.groupby("category", observed=True).indices)
+    return views
+
+
+class Dataset:
+    """
+    프로세스 전체에서 한 번만 만들어 모든 세션이 공유하는 읽기 전용 데이터셋
+
+    - frame 과 인덱스는 생성 후 수정하지 않음
+    - 세션별 필터 결과는 데이터프레임 복사본이 아니라 공고 위치(row id) 배열로 표현하고,
+      집계는 카테고리 코드 배열 위에서 바로 계산
+    - 전체 / 직무 카테고리별 기술 스택 빈도표는 로딩 시 한 번만 계산해 둠
+    - 본문 추출 기술 스택(text_skill) 컬럼이 있으면 태그 / 본문 / 태그 + 본문 색인을 함께 만듦
+    - 중복 공고 마스크는 처음 요청될 때 한 번만 계산 (dup_group 컬럼이 없으면 text_loader 로
+      읽은 본문에서 MinHash 로 찾음)
+    - 새로 수집된 공고는 append 로 추가된 공고만 색인한 새 버전을 만듦
+    """
+
+    def __init__(self, frame, version=None, text_loader=None):
+        frame = to_categoricals(assign_categories(frame.reset_index(drop=True)))
+        skill_sources = {"tag": SkillIndex(frame)}
+        if TEXT_SKILL_COLUMN in frame.columns:
+            skill_sources["text"] = SkillIndex(frame, (TEXT_SKILL_COLUMN,))
+            skill_sources["all"] = SkillIndex(frame, ("skill", TEXT_SKILL_COLUMN))
+        self._set_data(frame, version, text_loader, build_category_views(frame), skill_sources, TextIndex(frame))
+
+    def _set_data(self, frame, version, text_loader, views, skill_sources, text_index):
+        self.frame = frame
+        self.version = version
+        self.views = views
+        self.skill_sources = skill_sources
+        self.skill_index = skill_sources["tag"]
+        self.text_index = text_index
+        self.skill_leaderboards = {"total": self.skill_index.counts()}
+        for name, rows in self.views.items():
+            self.skill_leaderboards[name] = self.skill_index.counts(rows)
+        self._text_loader = text_loader
+        self._first_postings = None
+        self._lock = threading.Lock()
+        self._codes = {}
+        for col in CATEGORICAL_COLUMNS:
+            codes = frame[col].cat.codes.to_numpy()
+            codes.flags.writeable = False
+            self._codes[col] = codes
+
+    def append(self, rows, version=None, text_loader=None):
+        """
+        공고를 뒤에 추가한 새 버전의 데이터셋 (기존 데이터셋은 수정하지 않으므로 사용 중인 세션은 그대로 동작)
+
+        추가된 공고만 토큰화 / 색인해서 기존 색인에 이어 붙이고,
+        기술 스택 빈도표는 합친 희소 행렬에서 다시 집계 (토큰화 없이 행렬 곱 한 번)
+        중복 공고 마스크는 새 버전에서 처음 요청될 때 다시 계산
+        """
+        start = len(self.frame)
+        rows = to_categoricals(assign_categories(rows.reset_index(drop=True)))
+        rows.index = pd.RangeIndex(start, start + len(rows))
+        frame = concat_frames(self.frame, rows)
+
+        added_views = build_category_views(rows)
+        views = {
+            name: np.concatenate([positions, added_views.get(name, positions[:0]) + start])
+            for name, positions in self.views.items()
+        }
+        skill_sources = {name: index.extend(rows) for name, index in self.skill_sources.items()}
+        dataset = copy.copy(self)
+        dataset._set_data(frame, version, text_loader, views, skill_sources, self.text_index.extend(rows))
+        return dataset
+
+    def __len__(self):
+        return len(self.frame)
+
+    def all_rows(self):
+        return np.arange(len(self.frame))
+
+    def categories(self, column):
+        return self.frame[column].cat.categories
+
+    def code_of(self, column, value):
+        """카테고리 값의 코드 (없는 값이면 -2 로 어떤 행과도 일치하지 않음)"""
+        categories = self.categories(column)
+        return categories.get_loc(value) if value in categories else -2
+
+    def codes(self, column, rows=None):
+        codes = self._codes[column]
+        return codes if rows is None else codes[rows]
+
+    def value_counts(self, column, rows=None):
+        """선택된 행의 값별 개수 (내림차순, 0 인 값 제외) - Series.value_counts 와 같은 형태"""
+        codes = self.codes(column, rows)
+        categories = self.categories(column)
+        counts = pd.Series(
+            np.bincount(codes[codes >= 0], minlength=len(categories)),
+            index=pd.Index(categories, name=column),
+            name="count",
+        )
+        return counts[counts > 0].sort_values(ascending=False, kind="stable")
+
+    def nunique(self, column, rows=None):
+        codes = self.codes(column, rows)
+        return len(np.unique(codes[codes >= 0]))
+
+    def take(self, rows):
+        """표시할 소수의 행만 데이터프레임으로 꺼냄 (데이터 테이블 페이지 등)"""
+        return self.frame.iloc[rows]
+
+    def first_postings(self):
+        """중복 공고 그룹마다 첫 공고만 True 인 마스크 (읽기 전용)"""
+        with self._lock:
+            if self._first_postings is None:
+                if GROUP_COLUMN in self.frame.columns:
+                    # 그룹 번호가 없는 공고(중복 검사 뒤에 추가된 공고)는 각자 하나의 그룹
+                    positions = pd.Series(np.arange(len(self.frame)), index=self.frame.index)
+                    groups = self.frame[GROUP_COLUMN].fillna(positions)
+                elif self._text_loader is not None:
+                    groups = duplicate_groups(posting_texts(self._text_loader()))
+                else:
+                    groups = pd.Series(np.arange(len(self.frame)))
+                mask = ~pd.Series(groups).duplicated().to_numpy()
+                mask.flags.writeable = False
+                self._first_postings = mask
+            return self._first_postings
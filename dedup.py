@@ -0,0 +1,169 @@
+"""
+주요업무 / 자격요건 본문이 거의 같은 중복 공고 찾기 (MinHash + LSH)
+
+같은 공고가 재게시되거나 여러 검색 키워드로 중복 수집되면 회사 / 기술 스택 집계가 부풀려지므로,
+본문을 문자 k-gram 으로 나눠 MinHash 서명을 만들고 LSH 버킷으로 후보만 비교
+(모든 공고 쌍을 비교하지 않으므로 공고 수에 거의 비례하는 시간)
+
+    python dedup.py data/merged_data_total.csv             # dup_group 컬럼 추가
+    python dedup.py data/merged_data_total.csv --drop      # 중복 공고 제거 (그룹의 첫 공고만 남김)
+"""
+import argparse
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from skill_miner import posting_texts
+
+GROUP_COLUMN = "dup_group"
+
+_SPACE = re.compile(r"\s+")
+_ROLL = np.uint64(1000003)
+
+
+def shingle_hashes(text, k=5):
+    """공백을 정리한 소문자 본문의 문자 k-gram 해시 (uint64, 32비트 값, 중복 포함)"""
+    text = _SPACE.sub(" ", text.lower()).strip()
+    if len(text) < k:
+        return np.empty(0, dtype=np.uint64)
+    chars = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    # 다항식 해시를 k 번의 배열 덧셈으로 모든 창에 대해 한 번에 계산
+    n = len(chars) - k + 1
+    hashes = chars[:n].copy()
+    for j in range(1, k):
+        hashes = hashes * _ROLL + chars[j:j + n]
+    return hashes & np.uint64(0xFFFFFFFF)
+
+
+class MinHasher:
+    """
+    num_perm 개의 해시 함수로 본문을 MinHash 서명으로 변환
+    해시 함수는 multiply-shift ((a * h + b) mod 2^64 의 상위 32비트) 라 나머지 연산이 없음
+    """
+
+    def __init__(self, num_perm=64, k=5, seed=1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.k = k
+        self.a = rng.integers(1, 2 ** 63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self.b = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+
+    def signatures(self, texts):
+        """
+        본문 목록의 서명 행렬 (문서 x num_perm) 과 서명이 있는 문서 여부
+        본문이 너무 짧은 문서는 서명이 없고 어떤 공고와도 중복으로 보지 않음
+        """
+        hashes = [shingle_hashes(text, self.k) for text in texts]
+        lengths = np.array([len(h) for h in hashes], dtype=np.int64)
+        valid = lengths > 0
+        matrix = np.zeros((len(texts), self.num_perm), dtype=np.uint64)
+        if not valid.any():
+            return matrix, valid
+
+        # 모든 문서의 k-gram 을 이어 붙이고, 해시 함수마다 문서 구간별 최솟값을 한 번에 구함
+        shingles = np.concatenate(hashes)
+        starts = np.r_[0, np.cumsum(lengths)[:-1]][valid]
+        shift = np.uint64(32)
+        for p in range(self.num_perm):
+            matrix[valid, p] = np.minimum.reduceat((self.a[p] * shingles + self.b[p]) >> shift, starts)
+        return matrix, valid
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def lsh_groups(signatures, valid, bands=16, threshold=0.8):
+    """
+    서명 행렬을 bands 개 구간으로 나눠, 한 구간이라도 똑같은 문서끼리만 후보로 비교
+    서명 일치 비율(Jaccard 추정치)이 threshold 이상인 후보를 같은 그룹으로 묶음 (union-find)
+
+    반환: 문서별 그룹 번호 (그룹에서 가장 앞 문서의 위치)
+    """
+    n_docs, num_perm = signatures.shape
+    rows_per_band = num_perm // bands
+    parent = np.arange(n_docs)
+    docs = np.flatnonzero(valid)
+
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[docs, band * rows_per_band:(band + 1) * rows_per_band])
+        # 구간 전체를 하나의 값으로 보고 같은 값끼리 버킷으로 묶음
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows_per_band))).ravel()
+        _, bucket, sizes = np.unique(keys, return_inverse=True, return_counts=True)
+        shared = sizes[bucket] > 1
+        if not shared.any():
+            continue
+        members = docs[shared]
+        order = np.argsort(bucket[shared], kind="stable")
+        members, member_buckets = members[order], bucket[shared][order]
+        first = np.r_[True, member_buckets[1:] != member_buckets[:-1]]
+        heads = members[first][np.cumsum(first) - 1]
+
+        # 버킷의 첫 문서와만 비교 (버킷 안 쌍을 모두 비교하지 않음)
+        others = ~first
+        agree = (signatures[members[others]] == signatures[heads[others]]).mean(axis=1)
+        for doc, head in zip(members[others][agree >= threshold], heads[others][agree >= threshold]):
+            root_a, root_b = _find(parent, doc), _find(parent, head)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    return np.array([_find(parent, i) for i in range(n_docs)])
+
+
+def duplicate_groups(texts, threshold=0.8, num_perm=64, bands=16, k=5):
+    """
+    본문 Series 의 공고별 중복 그룹 번호 (그룹에서 가장 앞 공고의 위치, 중복이 없으면 자기 위치)
+    완전히 같은 본문은 서명을 한 번만 계산
+    """
+    codes, unique_texts = pd.factorize(texts.astype(object).fillna(""))
+    signatures, valid = MinHasher(num_perm, k).signatures(list(unique_texts))
+    unique_groups = lsh_groups(signatures, valid, bands, threshold)
+
+    # 고유 본문의 그룹 -> 공고 위치 기준 그룹 번호 (그룹마다 가장 앞 공고)
+    row_groups = unique_groups[codes]
+    _, first_rows = np.unique(row_groups, return_index=True)
+    group_first = np.empty(len(unique_groups), dtype=np.int64)
+    group_first[row_groups[first_rows]] = first_rows
+    groups = group_first[row_groups]
+    # 본문이 없는 공고는 서로 중복이 아님
+    empty = ~valid[codes]
+    groups[empty] = np.flatnonzero(empty)
+    return pd.Series(groups, index=texts.index, name=GROUP_COLUMN)
+
+
+def first_of_groups(groups):
+    """그룹별 첫 공고만 True 인 마스크"""
+    groups = np.asarray(groups)
+    return groups == np.arange(len(groups))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("csv_path")
+    parser.add_argument("--threshold", type=float, default=0.8, help="중복으로 볼 본문 유사도 (Jaccard)")
+    parser.add_argument("--drop", action="store_true", help="그룹의 첫 공고만 남기고 제거")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.csv_path, dtype=str)
+    groups = duplicate_groups(posting_texts(df), threshold=args.threshold)
+    n_duplicates = int((~first_of_groups(groups)).sum())
+    if args.drop:
+        df = df[first_of_groups(groups)].drop(columns=GROUP_COLUMN, errors="ignore")
+    else:
+        df[GROUP_COLUMN] = groups
+
+    # 대시보드가 읽는 도중 반쯤 쓰인 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = f"{args.csv_path}.{os.getpid()}.tmp"
+    df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+    os.replace(tmp_path, args.csv_path)
+    action = "제거" if args.drop else f"{GROUP_COLUMN} 컬럼에 표시"
+    print(f"{len(groups)}개 공고 중 중복 {n_duplicates}개 {action}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+작업 큐 기반 분산 수집
+
+    python crawl_worker.py seed --db crawl.db --pages 5      # 목록 페이지 작업 등록
+    python crawl_worker.py work --db crawl.db --processes 4  # 워커 실행 (여러 프로세스에서 동시에 실행 가능)
+    python crawl_worker.py status --db crawl.db              # 진행 상황
+    python crawl_worker.py export --db crawl.db              # 결과를 CSV 로 저장
+"""
+import argparse
+import os
+import socket
+import sqlite3
+import time
+from functools import partial
+from multiprocessing import Process
+from selenium import webdriver
+from driver_watchdog import DriverWatchdog
+from jumpit_data import JOB_CATEGORIES, collect_cards, get_detail_info, save_csv, search_url, to_row
+from work_queue import WorkQueue
+
+
+def seed(queue, pages):
+    added = 0
+    for keyword, job_category, title_keywords in JOB_CATEGORIES:
+        for page in range(1, pages + 1):
+            payload = {"category": job_category, "title_keywords": title_keywords, "page": page}
+            added += queue.enqueue("listing", search_url(keyword, page), payload)
+    print(f"목록 페이지 작업 {added}개 등록")
+
+
+def handle_task(watchdog, task):
+    """작업 하나를 처리하고 (후속 작업, 결과) 를 반환"""
+    payload = task.payload
+    if task.kind == "listing":
+        print(f"{payload['category']} - 페이지 {payload['page']}")
+        card_infos = watchdog.run(partial(collect_cards, title_keywords=payload["title_keywords"]), task.url)
+        new_tasks = [
+            ("detail", info["href"], {"category": payload["category"], "info": info})
+            for info in card_infos
+        ]
+        return new_tasks, []
+
+    detail = watchdog.run(get_detail_info, task.url)
+    print(f"{detail['회사명']} / {payload['info']['title']}")
+    return [], [(payload["category"], to_row(payload["category"], payload["info"], detail))]
+
+
+def work(db_path, worker_id, idle_exit=None, poll_interval=2):
+    queue = WorkQueue(db_path)
+    # 다른 워커가 lease 를 잡은 채 죽으면 lease 가 만료되어야 작업을 다시 가져갈 수 있으므로
+    # 그때까지는 기다린다 (idle_exit 는 lease 기한보다 짧을 수 없음)
+    idle_exit = max(idle_exit or 0, queue.lease_seconds + poll_interval)
+    options = webdriver.ChromeOptions()
+    options.add_argument("--window-size=1920,1080")
+    watchdog = DriverWatchdog(options, name=worker_id)
+
+    idle_since = None
+    try:
+        while True:
+            task = queue.lease(worker_id)
+            if task is None:
+                # 다른 워커가 처리 중인 작업이 남아 있으면 목록 페이지에서 상세 작업이 더 나올 수 있음
+                if not queue.has_unfinished():
+                    break
+                idle_since = idle_since or time.time()
+                if time.time() - idle_since > idle_exit:
+                    break
+                time.sleep(poll_interval)
+                continue
+            idle_since = None
+
+            try:
+                new_tasks, results = handle_task(watchdog, task)
+            except Exception as e:
+                # 페이지 실패뿐 아니라 파싱 오류 등도 작업 실패로 기록하고 다음 작업을 계속 처리
+                try:
+                    status = queue.fail(task, worker_id, repr(e))
+                except sqlite3.Error as db_error:
+                    status = f"기록 실패: {db_error}"
+                print(f"[{worker_id}] 작업 실패 ({task.attempts}회, {status}): {task.url} - {e.__class__.__name__}")
+                continue
+            try:
+                queue.complete(task, worker_id, new_tasks, results)
+            except sqlite3.Error as e:
+                # busy_timeout 을 넘긴 잠금(database is locked) 등 - 워커는 계속 돌고,
+                # 기록하지 못한 작업은 lease 가 만료되면 다시 처리됨
+                print(f"[{worker_id}] 완료 기록 실패, lease 만료 후 재처리: {task.url} - {e}")
+    finally:
+        watchdog.quit()
+        queue.close()
+    print(f"[{worker_id}] 종료 - 세션 교체 {watchdog.restarts}회")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="점핏 채용정보 분산 수집")
+    parser.add_argument("command", choices=["seed", "work", "status", "export"])
+    parser.add_argument("--db", default="crawl_queue.db")
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--idle-exit", type=int, default=None, help="할 일이 없을 때 기다릴 초 (최소 lease 기한)")
+    parser.add_argument("--out", default="jumpit_developer_jobs.csv")
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        seed(WorkQueue(args.db), args.pages)
+    elif args.command == "work":
+        host = socket.gethostname()
+        workers = [
+            Process(target=work, args=(args.db, f"{host}-{os.getpid()}-{i}", args.idle_exit))
+            for i in range(args.processes)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    elif args.command == "status":
+        for (kind, status), count in WorkQueue(args.db).stats().items():
+            print(f"{kind:8} {status:8} {count}")
+    elif args.command == "export":
+        rows = WorkQueue(args.db).result_rows()
+        save_csv(rows, args.out)
+        print(f"총 {len(rows)}개의 채용 정보 저장 완료: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import http.client
+import os
+import signal
+import subprocess
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+from urllib3.exceptions import HTTPError as Urllib3Error
+from webdriver_manager.chrome import ChromeDriverManager
+
+# 드라이버 프로세스가 죽으면 selenium 은 WebDriverException 대신 연결 오류를 그대로 올린다
+# (urllib3 MaxRetryError / ProtocolError, ConnectionRefusedError, RemoteDisconnected 등)
+SESSION_ERRORS = (WebDriverException, Urllib3Error, ConnectionError, http.client.HTTPException)
+
+
+class PageTaskFailed(Exception):
+    """페이지 작업이 기한 초과 또는 세션 오류로 실패했을 때 발생 (호출 측에서 URL 재등록)"""
+
+
+class DriverWatchdog:
+    """
+    크롬 드라이버 하나를 감시하는 워치독
+
+    - 페이지 작업마다 기한(deadline)을 두고, 넘기면 세션이 멈춘 것으로 판단
+    - 실패 후 세션이 응답하지 않으면 브라우저를 강제 종료하고 새 드라이버로 교체
+    - 실패한 작업은 PageTaskFailed 로 알려 호출 측이 URL 을 다시 큐에 넣도록 함
+    """
+
+    def __init__(self, options, name="driver", page_timeout=30, task_timeout=60, probe_timeout=5):
+        self.options = options
+        self.name = name
+        self.page_timeout = page_timeout
+        self.task_timeout = task_timeout
+        self.probe_timeout = probe_timeout
+        self.restarts = 0
+        self._driver_path = ChromeDriverManager().install()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self.driver = self._new_driver()
+
+    def _new_driver(self):
+        # 강제 종료할 때 크롬 자식 프로세스까지 한 번에 정리할 수 있도록 드라이버를 새 프로세스 그룹으로 실행
+        popen_kw = {} if sys.platform == "win32" else {"start_new_session": True}
+        service = Service(self._driver_path, popen_kw=popen_kw)
+        driver = webdriver.Chrome(service=service, options=self.options)
+        # 페이지 로딩이 page_timeout 을 넘으면 TimeoutException 발생
+        driver.set_page_load_timeout(self.page_timeout)
+        return driver
+
+    def _call(self, func, timeout, *args):
+        # 멈춘 세션에서 호출이 돌아오지 않을 수 있으므로 별도 스레드에서 기한을 두고 실행
+        future = self._executor.submit(func, self.driver, *args)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeout:
+            # 브라우저를 강제 종료해야 막혀 있는 스레드가 예외와 함께 풀려남
+            self._kill()
+            try:
+                future.result(timeout=self.probe_timeout)
+            except Exception:
+                pass
+            raise
+
+    def is_alive(self):
+        try:
+            return self._call(lambda driver: driver.execute_script("return 1"), self.probe_timeout) == 1
+        except (FutureTimeout,) + SESSION_ERRORS:
+            return False
+
+    def _kill(self):
+        service = getattr(self.driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None:
+            return
+        # chromedriver 만 죽이면 크롬 브라우저 프로세스가 남으므로 프로세스 그룹(트리) 전체를 종료
+        try:
+            if sys.platform == "win32":
+                subprocess.run(
+                    ["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
+                )
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        try:
+            process.kill()
+        except OSError:
+            pass
+
+    def restart(self):
+        print(f"[{self.name}] 세션 교체 (누적 {self.restarts + 1}회)")
+        try:
+            self._call(lambda driver: driver.quit(), self.probe_timeout)
+        except Exception:
+            self._kill()
+        # 이전 작업 스레드가 아직 막혀 있을 수 있으므로 실행기도 새로 만든다
+        self._executor.shutdown(wait=False)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self.driver = self._new_driver()
+        self.restarts += 1
+
+    def run(self, task, url):
+        """task(driver, url) 를 기한 내에 실행하고 결과를 반환"""
+        try:
+            return self._call(task, self.task_timeout, url)
+        except FutureTimeout:
+            print(f"[{self.name}] 작업 기한 초과 ({self.task_timeout}초): {url}")
+            self.restart()
+            raise PageTaskFailed(url)
+        except SESSION_ERRORS as e:
+            print(f"[{self.name}] 드라이버 오류: {url} - {e.__class__.__name__}")
+            if not self.is_alive():
+                self.restart()
+            raise PageTaskFailed(url) from e
+
+    def quit(self):
+        try:
+            self._call(lambda driver: driver.quit(), self.probe_timeout)
+        except Exception:
+            self._kill()
+        self._executor.shutdown(wait=False)
+
+
+def run_queue(watchdog, items, task, on_result, max_attempts=3, backoff=2):
+    """
+    (url, context) 목록을 워치독으로 처리하는 큐
+    실패한 URL 은 큐 뒤쪽에 다시 넣고, max_attempts 를 넘으면 포기한다
+    """
+    pending = deque((url, context, 1) for url, context in items)
+    while pending:
+        url, context, attempt = pending.popleft()
+        try:
+            result = watchdog.run(task, url)
+        except PageTaskFailed:
+            if attempt < max_attempts:
+                print(f"재시도 예약 ({attempt}/{max_attempts}): {url}")
+                pending.append((url, context, attempt + 1))
+                time.sleep(backoff)
+            else:
+                print(f"재시도 횟수 초과로 건너뜀: {url}")
+            continue
+        on_result(result, context)
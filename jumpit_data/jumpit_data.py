@@ -1,12 +1,54 @@
 import csv
 import re
 import time
+from functools import partial
 from selenium import webdriver
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from driver_watchdog import DriverWatchdog, run_queue
+
+# 요소를 못 찾은 경우만 무시하고, 세션 오류는 워치독까지 전달되도록 한다
+ELEMENT_ERRORS = (NoSuchElementException, StaleElementReferenceException, InvalidSelectorException)
+
+BASE_URL = "https://jumpit.saramin.co.kr"
+CSV_HEADER = ["회사명", "직무 구분", "공고명", "링크", "기술 스택", "주요업무", "자격요건"]
+
+# (검색 키워드, 직무 구분, 제목 필터 키워드)
+JOB_CATEGORIES = [
+    ("백엔드개발자", "백엔드 개발자", ['백엔드', 'backend', 'back-end', 'back end']),
+    ("프론트엔드개발자", "프론트엔드 개발자", ['프론트엔드', 'frontend', 'front-end', 'front end']),
+    ("풀스택개발자", "풀스택 개발자", ['풀스택', 'fullstack', 'full-stack', 'full stack']),
+]
+
+
+def search_url(keyword, page):
+    return f"{BASE_URL}/search?sort=relation&keyword={keyword}&page={page}"
+
+
+def to_row(job_category, info, detail):
+    return [
+        detail["회사명"],
+        job_category,
+        info["title"],
+        info["href"],
+        ", ".join(info["skills"]),
+        detail["주요업무"],
+        detail["자격요건"]
+    ]
+
+
+def save_csv(rows, path="jumpit_developer_jobs.csv"):
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(rows)
+
 
 def get_detail_info(driver_detail, link):
     driver_detail.get(link)
@@ -33,7 +75,7 @@ def get_detail_info(driver_detail, link):
                 if company:
                     print(f"회사명: {company} (선택자: {selector})")
                     break
-            except:
+            except ELEMENT_ERRORS:
                 continue
         
         # 선택자로 찾지 못한 경우, 페이지 소스에서 회사명 찾기 시도
@@ -48,9 +90,9 @@ def get_detail_info(driver_detail, link):
                         tag_name = elem.tag_name
                         class_name = elem.get_attribute("class")
                         print(f"태그: {tag_name}, 클래스: {class_name}, 텍스트: {text}")
-                except:
+                except ELEMENT_ERRORS:
                     continue
-    except Exception as e:
+    except ELEMENT_ERRORS as e:
         print(f"회사명 추출 중 예외 발생: {e}")
     
     # 기존 상세 정보 추출
@@ -63,131 +105,115 @@ def get_detail_info(driver_detail, link):
                 parent = dt.find_element(By.XPATH, "..")
                 pre = parent.find_element(By.TAG_NAME, "pre")
                 detail_info[heading] = pre.text.strip()
-    except:
+    except ELEMENT_ERRORS:
         pass
     
     return detail_info
 
-def scrape_jobs(keyword, job_category, title_keywords):
+def collect_cards(driver_main, url, title_keywords):
+    driver_main.get(url)
+    time.sleep(2)
+
+    cards = driver_main.find_elements(By.CSS_SELECTOR, "a[href^='/position/']")
+    print(f"찾은 카드 수: {len(cards)}")
+
+    # 세션이 중간에 죽어도 다시 읽을 수 있도록 카드 정보를 바로 꺼내 둔다
+    card_infos = []
+    for card in cards:
+        try:
+            # 제목 추출
+            try:
+                title_elem = card.find_element(By.CSS_SELECTOR, "h2.position_card_info_title")
+                title = title_elem.text.strip().replace("\n", " ")
+            except ELEMENT_ERRORS:
+                try:
+                    title_elem = card.find_element(By.TAG_NAME, "h2")
+                    title = title_elem.text.strip().replace("\n", " ")
+                except ELEMENT_ERRORS:
+                    title = "제목 추출 실패"
+
+            print(f"공고명: {title}")
+
+            # 제목 필터링: 검색 키워드에 따라 다름
+            title_lower = title.lower()
+
+            # 키워드 필터링
+            matching_keyword = False
+            for kw in title_keywords:
+                if kw in title_lower:
+                    matching_keyword = True
+                    break
+
+            if not matching_keyword:
+                continue  # 키워드가 제목에 없으면 건너뜀
+
+            href = card.get_attribute("href")
+            if not href.startswith("http"):
+                href = BASE_URL + href
+
+            # 기술 스택 추출
+            try:
+                skill_items = card.find_elements(By.CSS_SELECTOR, "ul.sc-15ba67b8-1.iFMgIl li")
+                skills = [skill.text.strip() for skill in skill_items]
+            except ELEMENT_ERRORS:
+                try:
+                    skill_items = card.find_elements(By.CSS_SELECTOR, "ul li")
+                    skills = [skill.text.strip() for skill in skill_items]
+                except ELEMENT_ERRORS:
+                    skills = ["기술 스택 정보 없음"]
+
+            card_infos.append({"title": title, "href": href, "skills": skills})
+
+        except ELEMENT_ERRORS as e:
+            print(f"카드 처리 중 예외 발생: {e}")
+
+    return card_infos
+
+
+def scrape_jobs(keyword, job_category, title_keywords, pages=range(1, 6)):
     print(f"{job_category} 채용 정보 수집 시작 - 키워드: {keyword}")
     job_list = []
-    base_url = "https://jumpit.saramin.co.kr"
 
     options = webdriver.ChromeOptions()
     options.add_argument("--window-size=1920,1080")
 
-    driver_main = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    driver_detail = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    # 목록/상세 드라이버를 각각 워치독으로 감시 (멈추거나 죽으면 새 세션으로 교체)
+    main_watchdog = DriverWatchdog(options, name="목록")
+    detail_watchdog = DriverWatchdog(options, name="상세")
 
-    for page in range(1, 6):  # 원하는 페이지 범위로 수정 가능
+    # 원하는 페이지 범위로 수정 가능
+    page_urls = [(search_url(keyword, page), page) for page in pages]
+    detail_items = []
+
+    def on_cards(card_infos, page):
         print(f"{job_category} - 페이지 {page}")
-        url = f"{base_url}/search?sort=relation&keyword={keyword}&page={page}"
-        driver_main.get(url)
-        time.sleep(2)
+        for info in card_infos:
+            detail_items.append((info["href"], info))
 
-        cards = driver_main.find_elements(By.CSS_SELECTOR, "a[href^='/position/']")
-        print(f"찾은 카드 수: {len(cards)}")
+    def on_detail(detail, info):
+        # 상세 페이지에서 회사명과 추가 정보 추출
+        print(f"{detail['회사명']} / {info['title']}")
+        job_list.append(to_row(job_category, info, detail))
 
-        for card in cards:
-            try:
-                # 제목 추출
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, "h2.position_card_info_title")
-                    title = title_elem.text.strip().replace("\n", " ")
-                except:
-                    try:
-                        title_elem = card.find_element(By.TAG_NAME, "h2")
-                        title = title_elem.text.strip().replace("\n", " ")
-                    except:
-                        title = "제목 추출 실패"
-                
-                print(f"공고명: {title}")
-                
-                # 제목 필터링: 검색 키워드에 따라 다름
-                title_lower = title.lower()
-                
-                # 키워드 필터링
-                matching_keyword = False
-                for kw in title_keywords:
-                    if kw in title_lower:
-                        matching_keyword = True
-                        break
-                
-                if not matching_keyword:
-                    continue  # 키워드가 제목에 없으면 건너뜀
-                
-                job_type = job_category
-                
-                href = card.get_attribute("href")
-                if not href.startswith("http"):
-                    href = base_url + href
-                
-                # 기술 스택 추출
-                try:
-                    skill_items = card.find_elements(By.CSS_SELECTOR, "ul.sc-15ba67b8-1.iFMgIl li")
-                    skills = [skill.text.strip() for skill in skill_items]
-                except:
-                    try:
-                        skill_items = card.find_elements(By.CSS_SELECTOR, "ul li")
-                        skills = [skill.text.strip() for skill in skill_items]
-                    except:
-                        skills = ["기술 스택 정보 없음"]
-                
-                # 상세 페이지에서 회사명과 추가 정보 추출
-                detail = get_detail_info(driver_detail, href)
-                company = detail["회사명"]
-                main_task = detail["주요업무"]
-                qualification = detail["자격요건"]
-                
-                print(f"{company} / {title}")
-                job_list.append([
-                    company,
-                    job_type,
-                    title,
-                    href,
-                    ", ".join(skills),
-                    main_task,
-                    qualification
-                ])
-            
-            except Exception as e:
-                print(f"카드 처리 중 예외 발생: {e}")
-
-    driver_main.quit()
-    driver_detail.quit()
+    try:
+        run_queue(main_watchdog, page_urls, partial(collect_cards, title_keywords=title_keywords), on_cards)
+        run_queue(detail_watchdog, detail_items, get_detail_info, on_detail)
+    finally:
+        main_watchdog.quit()
+        detail_watchdog.quit()
+
+    print(f"{job_category} 세션 교체 횟수 - 목록: {main_watchdog.restarts}, 상세: {detail_watchdog.restarts}")
     return job_list
 
 # 메인 실행 코드
-all_jobs = []
+if __name__ == "__main__":
+    all_jobs = []
 
-# 백엔드 개발자 채용 정보 수집
-backend_jobs = scrape_jobs(
-    "백엔드개발자", 
-    "백엔드 개발자", 
-    ['백엔드', 'backend', 'back-end', 'back end']
-)
-all_jobs.extend(backend_jobs)
-
-# 프론트엔드 개발자 채용 정보 수집
-frontend_jobs = scrape_jobs(
-    "프론트엔드개발자", 
-    "프론트엔드 개발자", 
-    ['프론트엔드', 'frontend', 'front-end', 'front end']
-)
-all_jobs.extend(frontend_jobs)
-
-# 풀스택 개발자 채용 정보 수집
-fullstack_jobs = scrape_jobs(
-    "풀스택개발자", 
-    "풀스택 개발자", 
-    ['풀스택', 'fullstack', 'full-stack', 'full stack']
-)
-all_jobs.extend(fullstack_jobs)
+    # 백엔드 / 프론트엔드 / 풀스택 개발자 채용 정보 수집
+    for keyword, job_category, title_keywords in JOB_CATEGORIES:
+        all_jobs.extend(scrape_jobs(keyword, job_category, title_keywords))
 
-# CSV 저장
-with open("jumpit_developer_jobs.csv", "w", newline="", encoding="utf-8-sig") as f:
-    writer = csv.writer(f)
-    writer.writerow(["회사명", "직무 구분", "공고명", "링크", "기술 스택", "주요업무", "자격요건"])
-    writer.writerows(all_jobs)
+    # CSV 저장
+    save_csv(all_jobs)
 
-print(f"총 {len(all_jobs)}개의 채용 정보 저장 완료: jumpit_developer_jobs.csv")
\ No newline at end of file
+    print(f"총 {len(all_jobs)}개의 채용 정보 저장 완료: jumpit_developer_jobs.csv")
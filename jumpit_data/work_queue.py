@@ -0,0 +1,170 @@
+import json
+import sqlite3
+import time
+from collections import namedtuple
+
+Task = namedtuple("Task", ["id", "kind", "url", "payload", "attempts"])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    url TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    payload TEXT NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    updated_at REAL,
+    UNIQUE (kind, url, category)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, kind, id);
+CREATE TABLE IF NOT EXISTS results (
+    task_id INTEGER PRIMARY KEY REFERENCES tasks (id),
+    category TEXT NOT NULL,
+    row TEXT NOT NULL,
+    worker TEXT,
+    finished_at REAL
+);
+"""
+
+# 목록 페이지를 먼저 처리해야 상세 페이지 작업이 빨리 쌓인다
+KIND_PRIORITY = "CASE kind WHEN 'listing' THEN 0 ELSE 1 END"
+
+
+class WorkQueue:
+    """
+    SQLite 기반 작업 큐 (외부 서비스 없이 파일 하나로 동작)
+
+    - 작업 상태: pending -> leased -> done / failed
+    - lease 기한 안에 complete / fail 하지 않으면 다른 워커가 다시 가져간다
+    - 같은 호스트의 여러 프로세스가 같은 DB 파일을 쓸 수 있도록 BEGIN IMMEDIATE 잠금을 사용한다
+      (SQLite 파일 잠금은 NFS / SMB 등 네트워크 파일 시스템에서 믿을 수 없어 같은 작업을 두 번 lease 할 수 있으므로
+      여러 머신에서 쓰려면 POSIX 잠금이 제대로 동작하는 볼륨이어야 함)
+    - 작업은 (kind, url, payload 의 category) 로 구분 - 여러 직무 구분 목록에 나온 상세 페이지는
+      직무 구분마다 한 행씩 결과가 남도록 따로 처리 (기존 수집 스크립트와 같은 결과)
+    - 작업 하나는 워치독 기한(task_timeout) 안에 끝나므로 lease_seconds 는 그보다 길게 둘 것
+    """
+
+    def __init__(self, path, lease_seconds=300, max_attempts=3, busy_timeout=30):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None)
+        self.conn.executescript(SCHEMA)
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(tasks)")]
+        if "category" not in columns:
+            raise RuntimeError(f"{path} 는 이전 형식의 작업 큐입니다 - 파일을 지우고 seed 부터 다시 실행하세요")
+
+    def _transaction(self):
+        return _Transaction(self.conn)
+
+    def enqueue(self, kind, url, payload=None):
+        """작업 추가 (같은 kind/url/category 가 이미 있으면 무시) - 추가되면 True"""
+        with self._transaction():
+            return self._insert(kind, url, payload)
+
+    def _insert(self, kind, url, payload):
+        payload = payload or {}
+        cur = self.conn.execute(
+            "INSERT OR IGNORE INTO tasks (kind, url, category, payload, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (kind, url, payload.get("category", ""), json.dumps(payload, ensure_ascii=False), time.time()),
+        )
+        return cur.rowcount == 1
+
+    def lease(self, worker):
+        """처리할 작업 하나를 lease 하여 반환 (없으면 None)"""
+        now = time.time()
+        with self._transaction():
+            # 기한이 지난 lease 중 재시도 횟수를 다 쓴 작업은 실패 처리
+            self.conn.execute(
+                "UPDATE tasks SET status = 'failed', last_error = 'lease expired', updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self.max_attempts),
+            )
+            row = self.conn.execute(
+                "SELECT id, kind, url, payload, attempts FROM tasks "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                f"ORDER BY {KIND_PRIORITY}, id LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE tasks SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (worker, now + self.lease_seconds, now, row[0]),
+            )
+        task_id, kind, url, payload, attempts = row
+        return Task(task_id, kind, url, json.loads(payload), attempts + 1)
+
+    def complete(self, task, worker, new_tasks=(), results=()):
+        """
+        작업 완료 처리 - 후속 작업 추가와 결과 저장을 한 트랜잭션으로 처리
+        new_tasks: (kind, url, payload) 목록, results: (category, row) 목록
+        """
+        with self._transaction():
+            cur = self.conn.execute(
+                "UPDATE tasks SET status = 'done', lease_owner = NULL, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (time.time(), task.id, worker),
+            )
+            if cur.rowcount != 1:
+                # lease 가 만료되어 다른 워커가 가져간 작업 - 결과는 그쪽에서 기록
+                return False
+            for kind, url, payload in new_tasks:
+                self._insert(kind, url, payload)
+            for category, row in results:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO results (task_id, category, row, worker, finished_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (task.id, category, json.dumps(row, ensure_ascii=False), worker, time.time()),
+                )
+        return True
+
+    def fail(self, task, worker, error):
+        """작업 실패 처리 - 재시도 횟수가 남아 있으면 다시 pending 으로"""
+        status = "failed" if task.attempts >= self.max_attempts else "pending"
+        with self._transaction():
+            self.conn.execute(
+                "UPDATE tasks SET status = ?, lease_owner = NULL, lease_expires = NULL, "
+                "last_error = ?, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (status, str(error)[:500], time.time(), task.id, worker),
+            )
+        return status
+
+    def has_unfinished(self):
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE status IN ('pending', 'leased')"
+        ).fetchone()
+        return row[0] > 0
+
+    def stats(self):
+        rows = self.conn.execute(
+            "SELECT kind, status, COUNT(*) FROM tasks GROUP BY kind, status ORDER BY kind, status"
+        ).fetchall()
+        return {(kind, status): count for kind, status, count in rows}
+
+    def result_rows(self):
+        rows = self.conn.execute("SELECT row FROM results ORDER BY task_id").fetchall()
+        return [json.loads(row) for (row,) in rows]
+
+    def close(self):
+        self.conn.close()
+
+
+class _Transaction:
+    # BEGIN IMMEDIATE 로 쓰기 잠금을 먼저 잡아 두 워커가 같은 작업을 lease 하지 않도록 함
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
@@ -0,0 +1,308 @@
+"""
+대시보드 필터 / 집계 실행 백엔드
+
+렌더링 함수는 현재 필터 상태에 대한 질의 객체(query)만 사용
+- PandasQuery: 메모리에 올린 Dataset 의 카테고리 코드 / 희소 행렬로 계산 (기본)
+- DuckDBQuery: Dataset 을 버전별 Parquet 파일로 내보낸 뒤 임베디드 DuckDB 가 SQL 로 계산
+  (필요한 컬럼만 읽고 조건을 스캔 단계에서 적용, 작은 집계 결과만 돌려받음)
+- PolarsQuery: Dataset 을 Arrow 메모리의 Polars 데이터프레임으로 옮긴 뒤 lazy 질의로 계산
+  (여러 스레드에서 실행)
+
+세 가지 모두 같은 표준화 결과(회사명 / 기술 스택)를 쓰며 집계 결과와 순서가 같음
+"""
+import hashlib
+import os
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+
+try:
+    import duckdb
+    HAS_DUCKDB = True
+except ImportError:
+    HAS_DUCKDB = False
+
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+ENGINES = ("pandas", "polars", "duckdb")
+
+
+class PandasQuery:
+    """필터링된 공고 위치 배열(rows) 위에서 Dataset 으로 집계"""
+
+    def __init__(self, dataset, rows):
+        self.dataset = dataset
+        self.rows = rows
+
+    def count(self):
+        return len(self.rows)
+
+    def nunique(self, column):
+        return self.dataset.nunique(column, self.rows)
+
+    def value_counts(self, column):
+        return self.dataset.value_counts(column, self.rows)
+
+    def skill_counts(self):
+        return self.dataset.skill_index.counts(self.rows)
+
+
+def value_count_series(dataset, column, values, counts):
+    """Dataset.value_counts 와 같은 형태의 값별 개수 (인덱스 dtype 은 카테고리와 같음 - 결과가 비어도 같은 형태)"""
+    return pd.Series(
+        np.asarray(counts, dtype=np.int64),
+        index=pd.Index(values, name=column, dtype=dataset.categories(column).dtype),
+        name="count",
+    )
+
+
+def skill_count_series(dataset, skills, counts):
+    """SkillIndex.counts 와 같은 형태의 기술 스택 빈도 (값 dtype 은 Dataset 의 기술 스택 행렬과 같고 인덱스 이름 없음)"""
+    return pd.Series(
+        np.asarray(counts).astype(dataset.skill_index.matrix.dtype),
+        index=pd.Index(np.asarray(skills, dtype=object), dtype=object),
+    )
+
+
+def export_frames(dataset):
+    """
+    외부 엔진으로 넘길 데이터프레임 두 개
+    - postings: row_id, company, position, category, search_text(검색용 소문자 본문)
+    - skills:   row_id, skill(표준 이름), mentions(공고 안 언급 횟수)
+    """
+    frame = dataset.frame
+    postings = pd.DataFrame({
+        "row_id": np.arange(len(frame), dtype=np.int64),
+        "company": frame["company"].astype(object),
+        "position": frame["position"].astype(object),
+        "category": frame["category"].astype(object),
+        "search_text": dataset.text_index.texts,
+    })
+    matrix = dataset.skill_index.matrix.tocoo()
+    skills = pd.DataFrame({
+        "row_id": matrix.row.astype(np.int64),
+        "skill": dataset.skill_index.skills[matrix.col].to_numpy(dtype=object),
+        "mentions": matrix.data.astype(np.int64),
+    }).sort_values(["skill", "row_id"])
+    return postings, skills
+
+
+class DuckDBBackend:
+    """
+    Dataset 하나를 Parquet 두 개(postings / skills, export_frames 참고)로 내보내고 DuckDB 로 질의
+    회사명 / 기술 스택은 Dataset 과 같은 표준화 결과를 쓰므로 pandas 경로와 집계가 같음
+
+    Parquet 파일은 백엔드마다 새 이름(데이터셋 버전 + 프로세스 + 객체)으로 한 번만 쓰고 수정하지 않음
+    - 새 버전이나 다른 프로세스가 파일을 덮어써 질의 중인 세션의 row_id 가 어긋나는 일이 없음
+    - 백엔드를 참조하는 세션이 모두 끝나 객체가 정리될 때 파일도 삭제
+    """
+
+    def __init__(self, dataset, cache_dir):
+        self.dataset = dataset
+        os.makedirs(cache_dir, exist_ok=True)
+        version = hashlib.sha1(repr(dataset.version).encode()).hexdigest()[:12]
+        tag = f"{version}-{os.getpid()}-{id(self):x}"
+        self.postings_path = os.path.join(cache_dir, f"postings-{tag}.parquet")
+        self.skills_path = os.path.join(cache_dir, f"skills-{tag}.parquet")
+        self._export()
+        weakref.finalize(self, _remove_files, (self.postings_path, self.skills_path))
+        self._con = duckdb.connect()
+        for name, path in (("postings", self.postings_path), ("skills", self.skills_path)):
+            quoted = path.replace("'", "''")
+            self._con.execute(f"CREATE VIEW {name} AS SELECT * FROM read_parquet('{quoted}')")
+        self._first_lock = threading.Lock()
+        self._has_first = False
+
+    def _export(self):
+        postings, skills = export_frames(self.dataset)
+        for df, path in ((postings, self.postings_path), (skills, self.skills_path)):
+            tmp_path = f"{path}.tmp"
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+
+    def _ensure_first_postings(self):
+        # 중복 공고 조건은 처음 쓸 때 Dataset 의 마스크를 DuckDB 테이블로 등록
+        with self._first_lock:
+            if not self._has_first:
+                first = pd.DataFrame({"row_id": np.flatnonzero(self.dataset.first_postings()).astype(np.int64)})
+                # register 한 데이터프레임은 커서(다른 연결)에서 보이지 않으므로 테이블로 복사
+                self._con.register("first_postings_df", first)
+                self._con.execute("CREATE TABLE first_postings AS SELECT * FROM first_postings_df")
+                self._con.unregister("first_postings_df")
+                self._has_first = True
+
+    def where(self, components):
+        """필터 조건 집합 -> (WHERE 절, 파라미터)"""
+        clauses, params = [], []
+        for kind, value in sorted(components):
+            if kind == "search":
+                clauses.append("contains(search_text, ?)")
+                params.append(value)
+            elif kind == "company":
+                clauses.append("company = ?")
+                params.append(value)
+            elif kind == "skill":
+                clauses.append("row_id IN (SELECT row_id FROM skills WHERE skill = ?)")
+                params.append(value)
+            elif kind == "dedup":
+                self._ensure_first_postings()
+                clauses.append("row_id IN (SELECT row_id FROM first_postings)")
+            else:
+                raise ValueError(f"알 수 없는 필터 조건: {kind}")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, sql, params=()):
+        # 세션 스레드마다 커서를 따로 열어 동시에 질의
+        return self._con.cursor().execute(sql, list(params))
+
+
+def _remove_files(paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class DuckDBQuery:
+    """필터 조건 집합을 SQL 로 바꿔 DuckDB 에서 집계 (공고 위치 배열은 필요한 탭에서만 조회)"""
+
+    def __init__(self, backend, components):
+        self.backend = backend
+        self.components = components
+        self._where, self._params = backend.where(components)
+        self._rows = None
+        self._groups = None
+
+    @property
+    def rows(self):
+        if self._rows is None:
+            result = self.backend.query(f"SELECT row_id FROM postings{self._where} ORDER BY row_id", self._params)
+            self._rows = result.fetchnumpy()["row_id"].astype(np.intp)
+        return self._rows
+
+    def _grouped(self):
+        """
+        회사별 / 직무별 / 전체 공고 수를 GROUPING SETS 로 한 번의 스캔에서 계산
+        (요약 지표와 회사 / 직무 순위가 같은 필터 결과를 여러 번 스캔하지 않도록 결과를 보관)
+        """
+        if self._groups is None:
+            sql = (
+                "SELECT company, position, GROUPING(company) AS all_companies, "
+                f"GROUPING(position) AS all_positions, count(*) AS count FROM postings{self._where} "
+                "GROUP BY GROUPING SETS ((company), (position), ())"
+            )
+            self._groups = self.backend.query(sql, self._params).df()
+        return self._groups
+
+    def count(self):
+        groups = self._grouped()
+        total = groups.loc[(groups["all_companies"] == 1) & (groups["all_positions"] == 1), "count"]
+        return int(total.iloc[0]) if len(total) else 0
+
+    def value_counts(self, column):
+        """Dataset.value_counts 와 같은 형태 (내림차순, 같은 개수는 값 순서)"""
+        groups = self._grouped()
+        other = "all_positions" if column == "company" else "all_companies"
+        counts = groups.loc[(groups[other] == 1) & groups[column].notna(), [column, "count"]]
+        counts = counts.sort_values(column, kind="stable").sort_values("count", ascending=False, kind="stable")
+        return value_count_series(self.backend.dataset, column, counts[column].to_numpy(), counts["count"].to_numpy())
+
+    def nunique(self, column):
+        return len(self.value_counts(column))
+
+    def skill_counts(self):
+        """SkillIndex.counts 와 같은 형태 (내림차순, 같은 개수는 기술 이름 순서)"""
+        sql = (
+            f"SELECT skill, sum(mentions)::BIGINT AS count FROM skills "
+            f"WHERE row_id IN (SELECT row_id FROM postings{self._where}) "
+            f"GROUP BY skill ORDER BY count DESC, skill"
+        )
+        df = self.backend.query(sql, self._params).df()
+        return skill_count_series(self.backend.dataset, df["skill"], df["count"])
+
+
+class PolarsBackend:
+    """Dataset 하나를 Polars 데이터프레임 두 개(postings / skills, export_frames 참고)로 옮겨 둠"""
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+        postings, skills = export_frames(dataset)
+        self.postings = pl.from_pandas(postings)
+        self.skills = pl.from_pandas(skills)
+        self._first = None
+        self._first_lock = threading.Lock()
+
+    def first_postings(self):
+        with self._first_lock:
+            if self._first is None:
+                rows = np.flatnonzero(self.dataset.first_postings()).astype(np.int64)
+                self._first = pl.DataFrame({"row_id": rows})
+            return self._first
+
+    def filtered(self, components):
+        """필터 조건 집합을 적용한 lazy 질의 (실행은 집계할 때)"""
+        query = self.postings.lazy()
+        for kind, value in sorted(components):
+            if kind == "search":
+                query = query.filter(pl.col("search_text").str.contains(value, literal=True))
+            elif kind == "company":
+                query = query.filter(pl.col("company") == value)
+            elif kind == "skill":
+                with_skill = self.skills.lazy().filter(pl.col("skill") == value).select("row_id")
+                query = query.join(with_skill, on="row_id", how="semi")
+            elif kind == "dedup":
+                query = query.join(self.first_postings().lazy(), on="row_id", how="semi")
+            else:
+                raise ValueError(f"알 수 없는 필터 조건: {kind}")
+        return query
+
+
+class PolarsQuery:
+    """필터 조건 집합을 Polars lazy 질의로 바꿔 집계"""
+
+    def __init__(self, backend, components):
+        self.backend = backend
+        self.components = components
+        self._filtered = backend.filtered(components)
+        self._rows = None
+
+    @property
+    def rows(self):
+        if self._rows is None:
+            rows = self._filtered.select("row_id").sort("row_id").collect()["row_id"]
+            self._rows = rows.to_numpy().astype(np.intp)
+        return self._rows
+
+    def count(self):
+        return self._filtered.select(pl.len()).collect().item()
+
+    def nunique(self, column):
+        return self._filtered.select(pl.col(column).drop_nulls().n_unique()).collect().item()
+
+    def value_counts(self, column):
+        """Dataset.value_counts 와 같은 형태 (내림차순, 같은 개수는 값 순서)"""
+        counts = (
+            self._filtered.filter(pl.col(column).is_not_null())
+            .group_by(column).agg(pl.len().alias("count"))
+            .sort(["count", column], descending=[True, False])
+            .collect()
+        )
+        return value_count_series(self.backend.dataset, column, counts[column].to_list(), counts["count"].to_numpy())
+
+    def skill_counts(self):
+        """SkillIndex.counts 와 같은 형태 (내림차순, 같은 개수는 기술 이름 순서)"""
+        counts = (
+            self.backend.skills.lazy()
+            .join(self._filtered.select("row_id"), on="row_id", how="semi")
+            .group_by("skill").agg(pl.col("mentions").sum().alias("count"))
+            .sort(["count", "skill"], descending=[True, False])
+            .collect()
+        )
+        return skill_count_series(self.backend.dataset, counts["skill"].to_list(), counts["count"].to_numpy())
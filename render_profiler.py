@@ -0,0 +1,142 @@
+"""
+대시보드 rerun 프로파일러
+
+rerun 한 번의 실행 기록(trace)에 다음을 남김
+- @profiled 를 붙인 함수의 실행 시간 (호출 깊이 포함, 데이터 로딩 / 필터 / 집계 / 렌더링 함수)
+- 공유 집계 캐시 조회의 적중 여부 (AggregateScope)
+- 그래프를 브라우저로 보낼 때의 Plotly JSON 크기와 직렬화 시간
+
+기록 중인 rerun 이 없으면 데코레이터는 함수를 그대로 호출하므로 프로파일을 끄면 비용이 거의 없음
+기록은 rerun 을 실행하는 스레드(세션)별로 따로 모임 (contextvars)
+"""
+import contextvars
+import functools
+import json
+import time
+
+import plotly.io
+
+_current = contextvars.ContextVar("render_trace", default=None)
+
+
+class RerunTrace:
+    """rerun 한 번의 실행 기록"""
+
+    def __init__(self, label=""):
+        self.label = label
+        self.started_at = time.time()
+        self.records = []
+        self.total_ms = None
+        self._start = time.perf_counter()
+        self._stack = []
+        self._token = None
+
+    def __enter__(self):
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.total_ms = self.elapsed_ms()
+        _current.reset(self._token)
+        return False
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self._start) * 1e3
+
+    def add(self, kind, name, **fields):
+        record = {"kind": kind, "name": name, "depth": len(self._stack), "at_ms": round(self.elapsed_ms(), 3)}
+        record.update(fields)
+        self.records.append(record)
+        return record
+
+    def calls(self):
+        """함수별 호출 수 / 전체 시간 / 최대 시간 (전체 시간 내림차순)"""
+        summary = {}
+        for record in self.records:
+            if record["kind"] != "call":
+                continue
+            entry = summary.setdefault(
+                record["name"], {"name": record["name"], "calls": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            entry["calls"] += 1
+            entry["total_ms"] += record["duration_ms"]
+            entry["max_ms"] = max(entry["max_ms"], record["duration_ms"])
+        return sorted(summary.values(), key=lambda entry: entry["total_ms"], reverse=True)
+
+    def cache_counts(self):
+        """(적중 수, 미적중 수)"""
+        lookups = [record["hit"] for record in self.records if record["kind"] == "cache"]
+        return sum(lookups), len(lookups) - sum(lookups)
+
+    def figure_bytes(self):
+        return sum(record["bytes"] for record in self.records if record["kind"] == "figure")
+
+    def to_dict(self):
+        hits, misses = self.cache_counts()
+        return {
+            "label": self.label,
+            "started_at": self.started_at,
+            "total_ms": self.total_ms if self.total_ms is not None else self.elapsed_ms(),
+            "cache_hits": hits,
+            "cache_misses": misses,
+            "figure_bytes": self.figure_bytes(),
+            "records": self.records,
+        }
+
+
+def current_trace():
+    return _current.get()
+
+
+def profiled(func=None, name=None):
+    """
+    실행 시간을 현재 rerun 기록에 남기는 데코레이터 (@profiled 또는 @profiled(name="..."))
+    st.rerun / st.stop 처럼 예외로 끝나는 경우도 기록
+    """
+    if func is None:
+        return functools.partial(profiled, name=name)
+    label = name or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        trace = _current.get()
+        if trace is None:
+            return func(*args, **kwargs)
+        record = trace.add("call", label)
+        trace._stack.append(label)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record["duration_ms"] = round((time.perf_counter() - start) * 1e3, 3)
+            trace._stack.pop()
+
+    return wrapper
+
+
+def record_cache(name, hit):
+    trace = _current.get()
+    if trace is not None:
+        trace.add("cache", name, hit=hit)
+
+
+def record_figure(fig, name=None):
+    """
+    그래프를 보낼 때의 JSON 크기와 직렬화 시간을 기록 (name 이 없으면 그래프를 그리는 함수 이름)
+    기록 중일 때만 한 번 더 직렬화하므로 프로파일을 켜면 그만큼 느려짐
+    """
+    trace = _current.get()
+    if trace is None:
+        return
+    start = time.perf_counter()
+    payload = plotly.io.to_json(fig, validate=False)
+    trace.add(
+        "figure", name or (trace._stack[-1] if trace._stack else "plotly"),
+        bytes=len(payload.encode("utf-8")),
+        serialize_ms=round((time.perf_counter() - start) * 1e3, 3),
+    )
+
+
+def traces_to_json(traces):
+    """rerun 기록 목록을 오프라인 분석용 JSON 문자열로"""
+    return json.dumps([trace.to_dict() for trace in traces], ensure_ascii=False, indent=2)
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from skill_aliases import canonical_skill
+
+ALL_COMPANIES = "전체"
+
+
+def filter_components(search_term, selected_company, selected_skills, dedup=False):
+    """
+    사이드바 필터 상태를 (종류, 값) 조건 집합으로 변환 (dedup: 중복 공고는 첫 공고만)
+    조건 집합이 이전 집합을 포함하면 필터가 더 엄격해진 것
+    """
+    components = set()
+    if search_term:
+        components.add(("search", search_term.lower()))
+    if selected_company != ALL_COMPANIES:
+        components.add(("company", selected_company))
+    for skill in selected_skills:
+        # 별칭이 달라도 같은 기술이면 같은 조건 (불용어는 어떤 공고와도 일치하지 않음)
+        components.add(("skill", canonical_skill(skill) or skill.strip().upper()))
+    if dedup:
+        components.add(("dedup", "first"))
+    return frozenset(components)
+
+
+def component_mask(dataset, kind, value):
+    """조건 하나에 해당하는 공고의 불리언 마스크"""
+    if kind == "search":
+        return dataset.text_index.mask(value)
+    if kind == "company":
+        return dataset.codes("company") == dataset.code_of("company", value)
+    if kind == "skill":
+        return dataset.skill_index.mask([value])
+    if kind == "dedup":
+        return dataset.first_postings()
+    raise ValueError(f"알 수 없는 필터 조건: {kind}")
+
+
+class IncrementalFilter:
+    """
+    세션별 필터 조합기
+
+    - 조건별 마스크를 캐시해 두고 (최근 max_masks 개)
+    - 조건이 추가되기만 했으면 이전 선택(row id)에서 새 조건만 적용해 좁혀 나감
+    - 조건이 빠지거나 바뀌었으면 캐시된 조건별 마스크를 AND 해서 다시 만듦
+    """
+
+    def __init__(self, dataset, max_masks=16):
+        self.dataset = dataset
+        self.max_masks = max_masks
+        self._masks = OrderedDict()
+        self._last_components = None
+        self._last_rows = None
+
+    def mask(self, kind, value):
+        key = (kind, value)
+        if key in self._masks:
+            self._masks.move_to_end(key)
+            return self._masks[key]
+        mask = component_mask(self.dataset, kind, value)
+        mask.flags.writeable = False
+        self._masks[key] = mask
+        if len(self._masks) > self.max_masks:
+            self._masks.popitem(last=False)
+        return mask
+
+    def select(self, components):
+        """조건 집합에 맞는 공고 위치 배열 (오름차순)"""
+        if components == self._last_components:
+            return self._last_rows
+
+        if self._last_components is not None and self._last_components <= components:
+            # 필터가 더 엄격해진 경우: 이전 결과에서 추가된 조건만 확인
+            rows = self._last_rows
+            for kind, value in components - self._last_components:
+                rows = rows[self.mask(kind, value)[rows]]
+        else:
+            mask = np.ones(len(self.dataset), dtype=bool)
+            for kind, value in components:
+                mask &= self.mask(kind, value)
+            rows = np.flatnonzero(mask)
+
+        rows.flags.writeable = False
+        self._last_components, self._last_rows = components, rows
+        return rows
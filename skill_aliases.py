@@ -0,0 +1,214 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# 표준 기술 스택 이름 -> 같은 기술로 볼 표기들 (카드 태그 표준화와 본문 추출(skill_miner) 이 함께 쓰는 유일한 표)
+# - 태그는 alias_key 로 정규화한 뒤 비교하므로 대소문자 / 공백 / 점 / 하이픈 차이는 따로 적지 않아도 됨
+#   ("React.js", "ReactJS", "react-js" 는 모두 "REACTJS" 로 비교)
+# - 본문은 표기 그대로(소문자) 찾으므로 본문에 나오는 표기("REACT.JS", "NEST.JS" 등)는 따로 적음
+# - 단독으로 흔한 단어가 되는 이름(C, R 등)이나 "ES" 처럼 다른 표기("ES6")와 헷갈리는 약어는 넣지 않음
+SKILL_ALIASES = {
+    # 언어
+    "JAVA": ["JAVA8", "JAVA11", "JAVA17", "자바"],
+    "JAVASCRIPT": ["JS", "ES6", "ECMASCRIPT", "자바스크립트"],
+    "TYPESCRIPT": ["TS", "타입스크립트"],
+    "PYTHON": ["PYTHON3", "파이썬"],
+    "KOTLIN": ["코틀린"],
+    "GO": ["GOLANG", "고랭"],
+    "RUST": ["러스트"],
+    "C++": ["CPP", "C/C++"],
+    "C#": ["CSHARP", "C SHARP", "씨샵"],
+    "SWIFT": ["스위프트"],
+    "SCALA": ["스칼라"],
+    "RUBY": ["루비"],
+    "PHP": [],
+    "DART": [],
+    "ELIXIR": [],
+    "SQL": [],
+    "OBJECTIVE-C": ["OBJC"],
+    "HTML": ["HTML5"],
+    "CSS": ["CSS3"],
+    "SASS": ["SCSS"],
+    # 백엔드 프레임워크
+    "SPRING": ["SPRING FRAMEWORK", "SPRINGFRAMEWORK", "스프링"],
+    "SPRING BOOT": ["SPRINGBOOT", "BOOT", "스프링부트", "스프링 부트"],
+    "SPRING BATCH": ["스프링 배치"],
+    "SPRING SECURITY": ["스프링 시큐리티"],
+    "JPA": ["SPRING DATA JPA", "HIBERNATE", "하이버네이트"],
+    "QUERYDSL": [],
+    "MYBATIS": ["마이바티스"],
+    "NODE.JS": ["NODE", "NODEJS"],
+    "EXPRESS": ["EXPRESSJS", "EXPRESS.JS"],
+    "NESTJS": ["NEST", "NEST.JS"],
+    "DJANGO": ["장고"],
+    "FLASK": ["플라스크"],
+    "FASTAPI": [],
+    "RUBY ON RAILS": ["RAILS", "레일즈"],
+    "LARAVEL": ["라라벨"],
+    "ASP.NET": [".NET", "DOTNET", "ASP.NET CORE", ".NET CORE", "닷넷"],
+    "GRPC": [],
+    "GRAPHQL": ["그래프큐엘"],
+    "REST API": ["REST", "RESTFUL", "RESTFUL API"],
+    "WEBSOCKET": ["웹소켓", "SOCKET.IO"],
+    "MSA": ["MICROSERVICE", "MICROSERVICES", "마이크로서비스"],
+    # 프론트엔드 / 모바일
+    "REACT": ["REACTJS", "REACT.JS", "리액트"],
+    "REACT NATIVE": ["REACTNATIVE", "RN", "리액트 네이티브", "리액트네이티브"],
+    "NEXT.JS": ["NEXT", "NEXTJS"],
+    "VUE.JS": ["VUE", "VUEJS", "VUE3", "VUE2"],
+    "NUXT.JS": ["NUXT", "NUXTJS"],
+    "ANGULAR": ["ANGULARJS", "앵귤러"],
+    "SVELTE": ["스벨트"],
+    "JQUERY": ["제이쿼리"],
+    "REDUX": ["REDUX TOOLKIT", "RTK", "리덕스"],
+    "RECOIL": ["리코일"],
+    "ZUSTAND": [],
+    "MOBX": [],
+    "REACT QUERY": ["TANSTACK QUERY", "REACTQUERY", "리액트 쿼리"],
+    "TAILWIND CSS": ["TAILWIND", "TAILWINDCSS", "테일윈드"],
+    "STYLED-COMPONENTS": ["STYLEDCOMPONENTS", "STYLED COMPONENTS", "STYLED COMPONENT", "스타일드 컴포넌트"],
+    "EMOTION": [],
+    "STORYBOOK": ["스토리북"],
+    "WEBPACK": ["웹팩"],
+    "VITE": [],
+    "BABEL": ["바벨"],
+    "JEST": ["제스트"],
+    "CYPRESS": ["사이프러스"],
+    "PLAYWRIGHT": [],
+    "FLUTTER": ["플러터"],
+    "ANDROID": ["안드로이드"],
+    "IOS": [],
+    "ELECTRON": ["일렉트론"],
+    # 데이터베이스 / 캐시 / 검색
+    "MYSQL": ["마이에스큐엘"],
+    "POSTGRESQL": ["POSTGRES", "PSQL", "포스트그레스"],
+    "ORACLE": ["오라클"],
+    "MARIADB": ["마리아DB"],
+    "MSSQL": ["SQL SERVER", "MS SQL", "MS-SQL", "SQLSERVER"],
+    "MONGODB": ["MONGO", "몽고DB", "몽고디비"],
+    "REDIS": ["레디스"],
+    "ELASTICSEARCH": ["ELASTIC SEARCH", "OPENSEARCH", "엘라스틱서치"],
+    "DYNAMODB": [],
+    "CASSANDRA": [],
+    "INFLUXDB": [],
+    # 메시징 / 데이터
+    "KAFKA": ["카프카"],
+    "RABBITMQ": ["래빗MQ"],
+    "SPARK": ["PYSPARK", "스파크"],
+    "HADOOP": ["하둡"],
+    "AIRFLOW": ["에어플로우"],
+    "FLINK": [],
+    "PANDAS": ["판다스"],
+    "TENSORFLOW": ["텐서플로우", "텐서플로"],
+    "PYTORCH": ["파이토치"],
+    # 인프라 / 클라우드 / DevOps
+    "AWS": ["AMAZON WEB SERVICES", "AMAZON AWS", "아마존 웹 서비스"],
+    "EC2": [],
+    "S3": [],
+    "AWS LAMBDA": ["LAMBDA", "AWS 람다"],
+    "ECS": [],
+    "EKS": [],
+    "RDS": [],
+    "GCP": ["GOOGLE CLOUD", "GOOGLE CLOUD PLATFORM", "구글 클라우드"],
+    "AZURE": ["MICROSOFT AZURE", "애저"],
+    "DOCKER": ["도커"],
+    "KUBERNETES": ["K8S", "쿠버네티스"],
+    "HELM": [],
+    "TERRAFORM": ["테라폼"],
+    "ANSIBLE": ["앤서블"],
+    "JENKINS": ["젠킨스"],
+    "GITHUB ACTIONS": ["GITHUB ACTION", "GH ACTIONS", "깃허브 액션"],
+    "GITLAB CI": ["GITLAB-CI"],
+    "ARGOCD": ["ARGO CD"],
+    "CI/CD": ["CICD", "CI CD", "CI / CD"],
+    "NGINX": ["엔진엑스"],
+    "APACHE": ["아파치"],
+    "TOMCAT": ["톰캣"],
+    "LINUX": ["리눅스"],
+    "PROMETHEUS": ["프로메테우스"],
+    "GRAFANA": ["그라파나"],
+    "DATADOG": [],
+    "ELK": ["ELK STACK"],
+    "SENTRY": [],
+    # 협업 도구 / 방법론
+    "GIT": [],
+    "GITHUB": ["깃허브"],
+    "GITLAB": [],
+    "JIRA": ["지라"],
+    "CONFLUENCE": ["컨플루언스"],
+    "SLACK": ["슬랙"],
+    "FIGMA": ["피그마"],
+    "TDD": ["테스트 주도 개발"],
+    "DDD": ["도메인 주도 설계"],
+    "OAUTH": ["OAUTH2", "OAUTH 2.0"],
+    "JWT": [],
+}
+
+# 카드 태그(토큰 전체가 기술 이름)로는 확실하지만 본문에서는 일반 단어나 다른 뜻과 겹치는 표기
+# - 태그 표준화에는 쓰고, 본문 추출 사전(skill_miner.text_dictionary)에서는 뺌
+TAG_ONLY_ALIASES = {"GO", "BOOT", "NODE", "NEXT", "NEST", "REST", "RN", "RTK", "LAMBDA"}
+
+# 기술 스택이 아니거나 너무 포괄적인 토큰 - 로딩 시 제거되어 차트 / 필터 어디에도 나오지 않음
+STOP_SKILLS = [
+    "AI", "UI", "UIUX", "UI/UX", "UX", "NATIVE", "API", "WEB", "SW", "IT", "APP",
+    "SERVER", "BACKEND", "FRONTEND", "FULLSTACK", "DEVOPS", "DATABASE", "DB", "ETC", "-",
+]
+
+_KEY_PATTERN = re.compile(r"[\s._\-]+")
+
+
+def alias_key(token):
+    """표기 비교용 키 (대문자, 공백 / 점 / 밑줄 / 하이픈 제거)"""
+    return _KEY_PATTERN.sub("", str(token).upper())
+
+
+def _build_lookup():
+    lookup = {}
+    for canonical, aliases in SKILL_ALIASES.items():
+        for alias in [canonical, *aliases]:
+            lookup[alias_key(alias)] = canonical
+    return lookup
+
+
+ALIAS_LOOKUP = _build_lookup()
+STOP_KEYS = {alias_key(skill) for skill in STOP_SKILLS}
+
+
+def canonical_skill(token):
+    """토큰 하나의 표준 이름 (불용어면 None) - 사용자가 고른 필터 값 변환용"""
+    key = alias_key(token.strip())
+    if key in STOP_KEYS:
+        return None
+    return ALIAS_LOOKUP.get(key, token.strip().upper())
+
+
+def canonicalize_tokens(tokens):
+    """
+    기술 스택 토큰 Series 를 표준 이름으로 바꾸고 불용어를 제거 (인덱스 유지)
+
+    고유 토큰만 카테고리 코드로 한 번 변환하고 행에는 코드 배열 인덱싱으로 적용하므로
+    변환 비용은 행 수가 아니라 고유 토큰 수에 비례
+    - 별칭 표에 없는 토큰은 정규화 키가 같은 표기끼리 묶고, 그중 가장 많이 쓰인 표기를 이름으로 사용
+    """
+    codes, uniques = pd.factorize(tokens)
+    frequency = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+    keys = [alias_key(token) for token in uniques]
+    names = [None] * len(uniques)
+    representative = {}
+    for i in np.argsort(-frequency, kind="stable"):
+        key = keys[i]
+        if key in ALIAS_LOOKUP:
+            names[i] = ALIAS_LOOKUP[key]
+        elif key not in STOP_KEYS:
+            names[i] = representative.setdefault(key, uniques[i])
+
+    # 고유 토큰 코드 -> 표준 이름 코드 (불용어는 -1) 를 행 코드에 한 번에 적용
+    name_codes, categories = pd.factorize(pd.Series(names, dtype=object), sort=True)
+    row_codes = np.append(name_codes, -1)[codes]
+    keep = row_codes >= 0
+    return pd.Series(
+        pd.Categorical.from_codes(row_codes[keep], categories),
+        index=tokens.index[keep],
+    )
@@ -0,0 +1,177 @@
+import copy
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from skill_aliases import STOP_SKILLS, alias_key, canonical_skill, canonicalize_tokens
+
+# 기술 스택 순위에서 제외할 스킬 목록 (SkillIndex 는 로딩 시 이미 제거하므로 원본 토큰을 다룰 때만 사용)
+EXCLUDED_SKILLS = STOP_SKILLS
+
+
+def explode_skills(df, column="skill"):
+    """skill 컬럼을 행 인덱스별 정규화된(공백 제거, 대문자) 기술 스택 Series 로 펼치기"""
+    skills = df[column].dropna().astype(str)
+    return skills.str.split(",").explode().str.strip().str.upper()
+
+
+class SkillIndex:
+    """
+    공고 x 기술 스택 희소 행렬 (데이터 로딩 시 한 번만 생성)
+
+    - 행: 공고 위치(0..n-1), 열: 표준 기술 스택 이름, 값: 공고 안에서의 언급 횟수
+    - 토큰은 별칭 표로 표준 이름으로 바꾸고 불용어는 빼고 색인 (skill_aliases.py)
+    - 기술 스택 필터는 정확히 같은 토큰만 매칭 ("Java" 가 "JavaScript" 와 매칭되지 않음)
+    - columns 에 여러 컬럼(태그 skill + 본문 text_skill 등)을 주면 합쳐서 색인하고,
+      이때는 같은 공고에서 여러 컬럼에 나온 기술을 한 번만 셈
+    """
+
+    def __init__(self, df, columns=("skill",)):
+        self.labels = df.index
+        self.n_postings = len(df)
+        self.columns = columns
+
+        df = df.reset_index(drop=True)
+        tokens = pd.concat([explode_skills(df, col) for col in columns])
+        tokens = canonicalize_tokens(tokens[tokens != ""])
+        if len(columns) > 1:
+            tokens = tokens[~pd.MultiIndex.from_arrays([tokens.index, tokens.to_numpy()]).duplicated()]
+        codes, skills = pd.factorize(tokens, sort=True)
+        self.skills = pd.Index(skills.astype(object))
+        rows = tokens.index.to_numpy()
+
+        # 같은 공고에 같은 기술이 여러 번 나오면 토큰 단위 빈도(explode_skills 의 value_counts)와 같게 중복 횟수를 유지
+        matrix = sparse.csr_matrix(
+            (np.ones(len(codes), dtype=np.int32), (rows, codes)),
+            shape=(self.n_postings, len(self.skills)),
+        )
+        matrix.sum_duplicates()
+        self._set_matrix(matrix)
+
+    def _set_matrix(self, matrix):
+        self.matrix = matrix
+        # 기술 스택별 공고 목록 (열 단위 조회용)
+        self.by_skill = self.matrix.T.tocsr()
+        # 동시 출현 분석용 0/1 행렬 (같은 공고 안의 중복 언급은 1로)
+        self.binary = self.matrix.copy()
+        self.binary.data[:] = 1
+
+    def extend(self, df):
+        """
+        공고를 뒤에 추가한 새 색인 (기존 색인은 수정하지 않음)
+
+        추가된 공고의 토큰만 표준화해 색인한 뒤 기존 행렬 아래에 붙이고, 열은 합친 기술 이름 순서로 맞춤
+        - 새 표기가 기존 기술과 정규화 키가 같으면 기존 이름으로 합침 (이미 있는 기술 이름은 바뀌지 않음)
+        """
+        added = SkillIndex(df, self.columns)
+        existing = {alias_key(skill): skill for skill in self.skills}
+        added_names = [existing.get(alias_key(skill), skill) for skill in added.skills]
+        skills = self.skills.union(pd.Index(added_names, dtype=object))
+
+        # 기존 열 -> 합친 열 (둘 다 정렬되어 있으므로 행마다 열 순서가 유지됨)
+        old = self.matrix
+        old = sparse.csr_matrix(
+            (old.data, skills.get_indexer(self.skills)[old.indices], old.indptr),
+            shape=(self.n_postings, len(skills)),
+        )
+        new = added.matrix.tocoo()
+        new = sparse.csr_matrix(
+            (new.data, (new.row, skills.get_indexer(added_names)[new.col])),
+            shape=(added.n_postings, len(skills)),
+        )
+        new.sum_duplicates()
+        if len(self.columns) > 1:
+            # 여러 컬럼을 합친 색인은 공고당 한 번만 셈
+            new.data[:] = 1
+
+        index = copy.copy(self)
+        index.labels = self.labels.append(df.index)
+        index.n_postings = self.n_postings + added.n_postings
+        index.skills = skills
+        index._set_matrix(sparse.vstack([old, new], format="csr"))
+        return index
+
+    def postings(self, skill):
+        """기술 스택 하나를 가진 공고 위치 배열 (별칭으로 찾아도 됨)"""
+        col = self.skills.get_indexer([canonical_skill(skill)])[0]
+        if col < 0:
+            return np.empty(0, dtype=self.by_skill.indices.dtype)
+        return self.by_skill.indices[self.by_skill.indptr[col]:self.by_skill.indptr[col + 1]]
+
+    def mask(self, skills):
+        """선택한 기술 스택을 모두 가진 공고의 불리언 마스크 (AND)"""
+        result = np.ones(self.n_postings, dtype=bool)
+        for skill in skills:
+            skill_mask = np.zeros(self.n_postings, dtype=bool)
+            skill_mask[self.postings(skill)] = True
+            result &= skill_mask
+        return result
+
+    def positions(self, index):
+        """원본 데이터프레임의 인덱스 라벨을 공고 위치로 변환"""
+        return self.labels.get_indexer(index)
+
+    def counts(self, rows=None, exclude_skills=None):
+        """
+        공고 부분집합의 기술 스택 빈도 (explode_skills(df).value_counts() 와 같은 값, 표준 이름 기준)
+        rows: 불리언 마스크 또는 공고 위치 배열 (None 이면 전체), 빈 토큰은 제외
+        """
+        weights = np.zeros(self.n_postings, dtype=np.int32)
+        if rows is None:
+            weights[:] = 1
+        else:
+            weights[rows] = 1
+        skill_counts = pd.Series(self.by_skill @ weights, index=self.skills)
+        skill_counts = skill_counts[skill_counts > 0]
+
+        if exclude_skills:
+            exclude_skills_upper = {skill.upper() for skill in exclude_skills}
+            skill_counts = skill_counts[~skill_counts.index.isin(exclude_skills_upper)]
+
+        return skill_counts.sort_values(ascending=False, kind="stable").rename_axis(None)
+
+    def cooccurrence(self, rows=None):
+        """
+        기술 스택 동시 출현 행렬 C = X^T X (희소, 기술 x 기술)
+        C[a, b] 는 두 기술을 함께 요구한 공고 수, 대각선은 기술별 공고 수
+        """
+        binary = self.binary if rows is None else self.binary[rows]
+        return (binary.T @ binary).tocoo(), binary.shape[0]
+
+    def associations(self, rows=None, min_together=5, exclude_skills=None):
+        """
+        기술 쌍별 연관 지표 (파이썬 반복 없이 희소 행렬 연산으로 계산)
+
+        - together: 두 기술을 함께 요구한 공고 수
+        - lift: P(a, b) / (P(a) P(b)) - 1 보다 크면 우연보다 자주 함께 등장
+        - pmi: log2(lift)
+        """
+        cooc, n_postings = self.cooccurrence(rows)
+        per_skill = cooc.diagonal()
+        keep = (cooc.row < cooc.col) & (cooc.data >= min_together)
+        if exclude_skills:
+            excluded = self.skills.isin({skill.upper() for skill in exclude_skills})
+            keep &= ~excluded[cooc.row] & ~excluded[cooc.col]
+        a, b, together = cooc.row[keep], cooc.col[keep], cooc.data[keep]
+
+        lift = together * n_postings / (per_skill[a].astype(float) * per_skill[b])
+        pairs = pd.DataFrame({
+            "skill_a": self.skills[a],
+            "skill_b": self.skills[b],
+            "together": together,
+            "count_a": per_skill[a],
+            "count_b": per_skill[b],
+            "lift": lift,
+            "pmi": np.log2(lift),
+        })
+        return pairs.sort_values(["lift", "together"], ascending=False, kind="stable").reset_index(drop=True)
+
+    def cooccurrence_table(self, skills, rows=None):
+        """선택한 기술들 사이의 동시 출현 공고 수 (데이터프레임, 히트맵용)"""
+        cols = self.skills.get_indexer([canonical_skill(skill) for skill in skills])
+        cols = cols[cols >= 0]
+        binary = self.binary if rows is None else self.binary[rows]
+        sub = binary[:, cols]
+        names = self.skills[cols]
+        return pd.DataFrame((sub.T @ sub).toarray(), index=names, columns=names)
@@ -0,0 +1,205 @@
+"""
+주요업무 / 자격요건 본문에서 기술 스택 추출
+
+카드 태그(skill 컬럼)에 없는 기술도 본문에는 자주 나오므로, 기술 사전을 Aho-Corasick
+오토마톤으로 만들어 모든 공고를 한 번씩만 훑어 text_skill 컬럼에 저장
+
+    python skill_miner.py data/merged_data_total.csv --processes 4
+    python skill_miner.py data/merged_data_total.csv --dictionary my_skills.json
+"""
+import argparse
+import json
+import os
+from collections import deque
+from multiprocessing import Pool
+
+import pandas as pd
+
+from skill_aliases import ALIAS_LOOKUP, SKILL_ALIASES, TAG_ONLY_ALIASES, alias_key
+
+TEXT_COLUMNS = ["주요업무", "자격요건"]
+OUTPUT_COLUMN = "text_skill"
+
+
+def text_dictionary(aliases=SKILL_ALIASES):
+    """
+    본문 검색용 사전 {표준 이름: [본문에서 찾을 표기, ...]} - 별칭 표(skill_aliases.SKILL_ALIASES)에서 만듦
+    표준 이름 자체도 표기로 쓰고, 본문에서 일반 단어와 겹치는 표기(TAG_ONLY_ALIASES)는 뺌
+    """
+    return {
+        canonical: [alias for alias in [canonical, *names] if alias not in TAG_ONLY_ALIASES]
+        for canonical, names in aliases.items()
+    }
+
+
+SKILL_DICTIONARY = text_dictionary()
+
+_ASCII_WORD = set("abcdefghijklmnopqrstuvwxyz0123456789")
+
+
+def _is_hangul(ch):
+    return "가" <= ch <= "힣"
+
+
+class SkillAutomaton:
+    """
+    기술 사전 Aho-Corasick 오토마톤 (소문자 기준)
+
+    - 본문 길이에 비례하는 한 번의 순회로 모든 별칭을 찾음 (사전 크기와 무관)
+    - 겹치는 매칭은 가장 왼쪽, 가장 긴 별칭을 우선 ("자바스크립트" 안의 "자바" 는 무시)
+    - 영문 별칭은 앞뒤가 영문/숫자가 아닐 때만, 한글 별칭은 앞이 한글이 아닐 때만 인정
+      (한글은 뒤에 조사가 붙으므로 뒤쪽 경계는 보지 않음)
+    - dictionary 의 표기 목록만 찾음 (표준 이름도 찾으려면 목록에 넣을 것 - text_dictionary 참고)
+    """
+
+    def __init__(self, dictionary=SKILL_DICTIONARY):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for canonical, aliases in dictionary.items():
+            for alias in {alias.lower() for alias in aliases}:
+                self._add(alias, canonical)
+        self._build_failure_links()
+
+    def _add(self, alias, canonical):
+        node = 0
+        for ch in alias:
+            if ch not in self._goto[node]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][ch] = len(self._goto) - 1
+            node = self._goto[node][ch]
+        self._output[node].append((len(alias), canonical))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _matches(self, text):
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for end, ch in enumerate(text, 1):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, canonical in output[node]:
+                yield end - length, end, canonical
+
+    @staticmethod
+    def _at_boundary(text, start, end):
+        first, last = text[start], text[end - 1]
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+        if first in _ASCII_WORD and before in _ASCII_WORD:
+            return False
+        if _is_hangul(first) and _is_hangul(before):
+            return False
+        if last in _ASCII_WORD and after in _ASCII_WORD:
+            return False
+        return True
+
+    def find(self, text):
+        """본문에 나온 기술 스택 표준 이름 목록 (처음 나온 순서, 중복 제거)"""
+        text = text.lower()
+        matches = sorted(
+            (start, -end, canonical)
+            for start, end, canonical in self._matches(text)
+            if self._at_boundary(text, start, end)
+        )
+        skills = {}
+        covered = 0
+        for start, neg_end, canonical in matches:
+            if start < covered:
+                continue
+            skills.setdefault(canonical, None)
+            covered = -neg_end
+        return list(skills)
+
+
+_worker_automaton = None
+
+
+def _init_worker(dictionary):
+    global _worker_automaton
+    _worker_automaton = SkillAutomaton(dictionary)
+
+
+def _mine_chunk(texts):
+    return [",".join(_worker_automaton.find(text)) for text in texts]
+
+
+def posting_texts(df, columns=TEXT_COLUMNS):
+    """공고별 본문 (주요업무 + 자격요건) Series"""
+    texts = [df[col].astype(object).fillna("").astype(str) for col in columns if col in df.columns]
+    if not texts:
+        return pd.Series("", index=df.index)
+    joined = texts[0]
+    for text in texts[1:]:
+        joined = joined + "\n" + text
+    return joined
+
+
+def mine_skills(texts, dictionary=SKILL_DICTIONARY, processes=1, chunk_size=2000):
+    """
+    본문 Series 에서 공고별 기술 스택을 추출해 쉼표로 이어 붙인 Series 로 반환 (skill 컬럼과 같은 형식)
+    같은 본문은 한 번만 처리하고, processes > 1 이면 여러 프로세스로 나눠 처리
+    """
+    codes, unique_texts = pd.factorize(texts.astype(object).fillna(""))
+    unique_texts = list(unique_texts)
+
+    if processes > 1 and len(unique_texts) > chunk_size:
+        chunks = [unique_texts[i:i + chunk_size] for i in range(0, len(unique_texts), chunk_size)]
+        with Pool(processes, initializer=_init_worker, initargs=(dictionary,)) as pool:
+            mined = [skills for chunk in pool.imap(_mine_chunk, chunks) for skills in chunk]
+    else:
+        automaton = SkillAutomaton(dictionary)
+        mined = [",".join(automaton.find(text)) for text in unique_texts]
+
+    mined = pd.Series(mined, dtype=object)
+    return pd.Series(mined.to_numpy()[codes], index=texts.index, name=OUTPUT_COLUMN)
+
+
+def load_dictionary(path=None):
+    """
+    기본 사전에 JSON 파일({표준 이름: [별칭, ...]}) 의 항목을 덧붙인 사전
+    JSON 의 이름이 별칭 표에 있는 기술이면 그 표준 이름 아래에 합침 (이름 자체도 별칭으로 사용)
+    """
+    dictionary = {name: list(aliases) for name, aliases in SKILL_DICTIONARY.items()}
+    if path:
+        with open(path, encoding="utf-8") as f:
+            for name, aliases in json.load(f).items():
+                canonical = ALIAS_LOOKUP.get(alias_key(name), name.upper())
+                dictionary.setdefault(canonical, []).extend([name, *aliases])
+    return dictionary
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("csv_path")
+    parser.add_argument("--dictionary", help="추가 기술 사전 JSON 파일")
+    parser.add_argument("--processes", type=int, default=1)
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.csv_path, dtype=str)
+    df[OUTPUT_COLUMN] = mine_skills(
+        posting_texts(df), load_dictionary(args.dictionary), processes=args.processes
+    )
+    # 대시보드가 읽는 도중 반쯤 쓰인 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = f"{args.csv_path}.{os.getpid()}.tmp"
+    df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+    os.replace(tmp_path, args.csv_path)
+    found = (df[OUTPUT_COLUMN] != "").sum()
+    print(f"{len(df)}개 공고 중 {found}개에서 본문 기술 스택 추출 -> {OUTPUT_COLUMN} 컬럼 저장")
+
+
+if __name__ == "__main__":
+    main()
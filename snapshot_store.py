@@ -0,0 +1,181 @@
+"""
+수집 결과를 날짜별 스냅샷으로 쌓아 두는 저장소 (Parquet, 날짜별 파티션)
+
+수집할 때마다 CSV 를 덮어쓰면 기술 수요 / 회사별 채용 변화를 볼 수 없으므로
+- postings/snapshot_date=YYYY-MM-DD/   처음 본 공고만 저장 (공고 ID 기준으로 스냅샷 간 중복 제거)
+- sightings/snapshot_date=YYYY-MM-DD/  그날 게시 중이던 공고 ID 목록
+- aggregates/*.parquet                  날짜별 집계 (추가할 때 그 날짜만 계산해 덧붙임)
+대시보드의 트렌드 탭은 작은 집계 파일만 읽으므로 1년치가 쌓여도 빠름
+스냅샷은 날짜 순서대로만 추가할 수 있음 (마지막 날짜는 다시 추가해 교체 가능)
+
+    python snapshot_store.py data/merged_data_total.csv --date 2025-05-01
+"""
+import argparse
+import datetime
+import hashlib
+import os
+import re
+import shutil
+
+import pandas as pd
+
+from columnar_cache import file_signature
+from company_names import MAPPING_FILE, canonicalize_companies
+from skill_index import SkillIndex
+
+STORE_DIR = "history"
+AGGREGATE_NAMES = ("summary", "skills", "companies")
+# 날짜별로 저장할 상위 항목 수 (전체를 저장하면 1년치 집계가 불필요하게 커짐)
+TOP_N = 200
+
+_POSITION_ID = re.compile(r"/position/(\d+)")
+
+# 수집 스크립트가 저장한 CSV 의 헤더 -> 대시보드 데이터 컬럼명
+RAW_COLUMNS = {"회사명": "company", "공고명": "position", "기술 스택": "skill", "직무 구분": "category"}
+
+
+def position_ids(df):
+    """링크의 공고 번호 (링크가 없으면 회사명 + 공고명 해시)"""
+    links = df["링크"] if "링크" in df.columns else pd.Series("", index=df.index)
+    ids = links.astype(object).fillna("").astype(str).str.extract(_POSITION_ID, expand=False)
+    missing = ids.isna()
+    if missing.any():
+        fallback = (df.loc[missing, "company"].astype(str) + "|" + df.loc[missing, "position"].astype(str))
+        ids[missing] = ["h" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] for key in fallback]
+    return ids
+
+
+def daily_aggregates(df, snapshot_date, previous_ids, seen_ids):
+    """스냅샷 하나의 집계 (요약 / 기술 스택별 / 회사별 게시 중인 공고 수)"""
+    ids = set(df["position_id"])
+    summary = pd.DataFrame([{
+        "date": snapshot_date,
+        "active": len(ids),
+        "new": len(ids - seen_ids),
+        "closed": len(previous_ids - ids),
+    }])
+    skill_counts = SkillIndex(df).counts().head(TOP_N)
+    skills = pd.DataFrame({"date": snapshot_date, "skill": skill_counts.index, "count": skill_counts.to_numpy()})
+    company_counts = df["company"].value_counts().head(TOP_N)
+    companies = pd.DataFrame({
+        "date": snapshot_date, "company": company_counts.index, "count": company_counts.to_numpy(),
+    })
+    return {"summary": summary, "skills": skills, "companies": companies}
+
+
+class SnapshotStore:
+    """
+    날짜별 스냅샷 저장소 - 마지막 날짜를 다시 추가하면 그 날짜의 데이터를 교체
+    신규 / 마감 공고와 처음 본 공고 저장은 앞 날짜들에 따라 정해지므로 마지막 날짜보다 앞선 날짜는 추가할 수 없음
+    """
+
+    def __init__(self, root, company_mapping=None):
+        self.root = root
+        self.company_mapping = company_mapping
+
+    def _partition(self, table, snapshot_date):
+        return os.path.join(self.root, table, f"snapshot_date={snapshot_date}")
+
+    def _aggregate_path(self, name):
+        return os.path.join(self.root, "aggregates", f"{name}.parquet")
+
+    def snapshot_dates(self):
+        sightings = os.path.join(self.root, "sightings")
+        if not os.path.isdir(sightings):
+            return []
+        return sorted(name.split("=", 1)[1] for name in os.listdir(sightings) if name.startswith("snapshot_date="))
+
+    def _read_ids(self, table, dates):
+        """지정한 날짜 파티션들의 공고 ID (position_id 컬럼만 읽음)"""
+        frames = [
+            pd.read_parquet(self._partition(table, snapshot_date), columns=["position_id"])
+            for snapshot_date in dates
+        ]
+        return set(pd.concat(frames)["position_id"]) if frames else set()
+
+    def _write_partition(self, table, snapshot_date, df):
+        path = self._partition(table, snapshot_date)
+        # "." 으로 시작하는 임시 폴더는 파티션 목록 / pyarrow 데이터셋 읽기에서 무시됨
+        tmp_path = os.path.join(self.root, table, f".tmp-{os.getpid()}-{snapshot_date}")
+        os.makedirs(tmp_path, exist_ok=True)
+        df.to_parquet(os.path.join(tmp_path, "part-0.parquet"), index=False)
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.replace(tmp_path, path)
+
+    def _update_aggregate(self, name, snapshot_date, rows):
+        path = self._aggregate_path(name)
+        if os.path.exists(path):
+            existing = pd.read_parquet(path)
+            rows = pd.concat([existing[existing["date"] != snapshot_date], rows], ignore_index=True)
+        rows = rows.sort_values("date", kind="stable").reset_index(drop=True)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        rows.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    def append(self, df, snapshot_date=None):
+        """
+        수집 결과 하나를 스냅샷으로 추가 (회사명 표준화, 공고 ID 기준 중복 제거 후 저장)
+        반환: 그 날짜의 요약 집계
+        """
+        snapshot_date = snapshot_date or datetime.date.today().isoformat()
+        dates = self.snapshot_dates()
+        if dates and snapshot_date < dates[-1]:
+            # 앞선 날짜를 끼워 넣으면 뒤 날짜들의 처음 본 공고 / 신규 / 마감 집계가 모두 달라짐
+            raise ValueError(f"스냅샷은 날짜 순서대로 추가해야 합니다 (마지막 스냅샷 {dates[-1]}, 추가하려는 날짜 {snapshot_date})")
+        df = canonicalize_companies(df.rename(columns=RAW_COLUMNS).reset_index(drop=True), self.company_mapping)
+        df["position_id"] = position_ids(df)
+        df = df.drop_duplicates("position_id")
+
+        earlier_dates = [d for d in dates if d < snapshot_date]
+        seen_ids = self._read_ids("postings", earlier_dates)
+        previous_ids = self._read_ids("sightings", earlier_dates[-1:])
+
+        self._write_partition("postings", snapshot_date, df[~df["position_id"].isin(seen_ids)])
+        self._write_partition("sightings", snapshot_date, df[["position_id"]])
+        aggregates = daily_aggregates(df, snapshot_date, previous_ids, seen_ids)
+        for name, rows in aggregates.items():
+            self._update_aggregate(name, snapshot_date, rows)
+        return aggregates["summary"]
+
+    def aggregate_signature(self):
+        """집계 파일 전체의 (수정 시각, 크기) - 한 파일이라도 바뀌면 달라지므로 캐시 키로 사용"""
+        return tuple(
+            file_signature(path) if os.path.exists(path) else None
+            for path in map(self._aggregate_path, AGGREGATE_NAMES)
+        )
+
+    def read_aggregate(self, name):
+        """날짜별 집계 (없으면 빈 데이터프레임)"""
+        path = self._aggregate_path(name)
+        return pd.read_parquet(path) if os.path.exists(path) else pd.DataFrame()
+
+    def read_postings(self, columns=None):
+        """중복 제거된 전체 공고 (필요한 컬럼만 읽음)"""
+        path = os.path.join(self.root, "postings")
+        return pd.read_parquet(path, columns=columns) if os.path.isdir(path) else pd.DataFrame()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("csv_path")
+    parser.add_argument("--date", help="스냅샷 날짜 YYYY-MM-DD (기본: 오늘)")
+    parser.add_argument("--store", help=f"저장소 폴더 (기본: CSV 와 같은 폴더의 {STORE_DIR})")
+    args = parser.parse_args()
+
+    data_dir = os.path.dirname(args.csv_path)
+    store = SnapshotStore(args.store or os.path.join(data_dir, STORE_DIR), os.path.join(data_dir, MAPPING_FILE))
+    df = pd.read_csv(args.csv_path, dtype=str)
+    try:
+        summary = store.append(df, args.date).iloc[0]
+    except ValueError as e:
+        parser.error(str(e))
+    print(
+        f"{summary['date']}: 게시 중 {summary['active']}개, 신규 {summary['new']}개, 마감 {summary['closed']}개 "
+        f"(스냅샷 {len(store.snapshot_dates())}개)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+필터 / 집계 엔진 결과 비교 - pandas(Dataset) 와 Polars / DuckDB 가 같은 필터에서 같은 집계(값과 순서)를 내는지 확인
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmark"))
+from synthetic_data import make_jobs  # noqa: E402
+from dataset import Dataset  # noqa: E402
+from dedup import GROUP_COLUMN  # noqa: E402
+from query_backend import (  # noqa: E402
+    HAS_DUCKDB, HAS_POLARS, DuckDBBackend, DuckDBQuery, PandasQuery, PolarsBackend, PolarsQuery,
+)
+from selection import ALL_COMPANIES, IncrementalFilter, filter_components  # noqa: E402
+
+N_ROWS = 3000
+
+# (검색어, 회사, 기술 스택, 중복 공고 제외) - 회사 None 은 가장 공고가 많은 회사
+FILTERS = [
+    ("", ALL_COMPANIES, [], False),
+    ("java", ALL_COMPANIES, [], False),
+    ("백엔드", ALL_COMPANIES, ["React"], False),
+    ("", ALL_COMPANIES, ["Spring", "JPA"], False),
+    ("", ALL_COMPANIES, ["reactjs"], False),
+    ("", None, [], False),
+    ("aws", None, ["Docker"], False),
+    ("", ALL_COMPANIES, [], True),
+    ("java", ALL_COMPANIES, ["Spring"], True),
+    ("없는검색어", ALL_COMPANIES, [], False),
+    ("", ALL_COMPANIES, ["UI"], False),
+]
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    frame = make_jobs(N_ROWS, seed=3, text=False)
+    # 세 공고마다 하나씩 앞 공고와 같은 중복 그룹
+    groups = np.arange(N_ROWS)
+    groups[2::3] -= 1
+    frame[GROUP_COLUMN] = groups
+    return Dataset(frame)
+
+
+@pytest.fixture(scope="module")
+def top_company(dataset):
+    return dataset.value_counts("company", np.arange(len(dataset))).index[0]
+
+
+@pytest.fixture(scope="module")
+def engine_queries(dataset, tmp_path_factory):
+    queries = {}
+    if HAS_POLARS:
+        polars_backend = PolarsBackend(dataset)
+        queries["polars"] = lambda components: PolarsQuery(polars_backend, components)
+    if HAS_DUCKDB:
+        duckdb_backend = DuckDBBackend(dataset, str(tmp_path_factory.mktemp("duckdb")))
+        queries["duckdb"] = lambda components: DuckDBQuery(duckdb_backend, components)
+    if not queries:
+        pytest.skip("polars / duckdb 가 설치되어 있지 않음")
+    return queries
+
+
+def run_query(query):
+    return {
+        "count": query.count(),
+        "nunique_company": query.nunique("company"),
+        "nunique_position": query.nunique("position"),
+        "company_counts": query.value_counts("company"),
+        "position_counts": query.value_counts("position"),
+        "skill_counts": query.skill_counts(),
+        "rows": query.rows,
+    }
+
+
+def assert_same(expected, actual, engine):
+    """값과 순서뿐 아니라 dtype / 인덱스 이름까지 같아야 함 (엔진과 관계없이 같은 집계 캐시 항목을 쓰므로)"""
+    for key, value in expected.items():
+        other = actual[key]
+        if isinstance(value, pd.Series):
+            pd.testing.assert_series_equal(other, value, check_dtype=True, obj=f"{engine} {key}")
+        elif isinstance(value, np.ndarray):
+            assert other.dtype == value.dtype, f"{engine} {key} dtype {other.dtype} != {value.dtype}"
+            np.testing.assert_array_equal(other, value, err_msg=f"{engine} {key}")
+        else:
+            assert type(other) is type(value) and other == value, f"{engine} {key}"
+
+
+@pytest.mark.parametrize("term, company, skills, dedup", FILTERS)
+def test_engines_match_pandas(dataset, top_company, engine_queries, term, company, skills, dedup):
+    components = filter_components(term, company or top_company, skills, dedup)
+    expected = run_query(PandasQuery(dataset, IncrementalFilter(dataset).select(components)))
+    for engine, make_query in engine_queries.items():
+        assert_same(expected, run_query(make_query(components)), engine)
+
+
+def test_incremental_filter_matches_fresh_selection(dataset, engine_queries):
+    # 한 세션에서 필터를 좁혔다 넓혀도(캐시된 마스크 재사용) 엔진 결과와 같아야 함
+    selector = IncrementalFilter(dataset)
+    for term, skills, dedup in [("", [], False), ("java", [], False), ("java", ["Spring"], True), ("", ["Spring"], False)]:
+        components = filter_components(term, ALL_COMPANIES, skills, dedup)
+        expected = run_query(PandasQuery(dataset, selector.select(components)))
+        for engine, make_query in engine_queries.items():
+            assert_same(expected, run_query(make_query(components)), engine)
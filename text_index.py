@@ -0,0 +1,88 @@
+import copy
+from collections import defaultdict
+
+import numpy as np
+
+SEARCH_COLUMNS = ["company", "position", "skill"]
+NGRAM = 3
+# 컬럼 사이 구분자 - 검색어가 두 컬럼에 걸쳐 매칭되지 않도록 함
+FIELD_SEP = "\x1f"
+
+
+def _ngrams(text, n):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _search_texts(df, columns):
+    # 카테고리형 컬럼도 있으므로 object 로 바꾼 뒤 결측값 채움
+    texts = df[columns[0]].astype(object).fillna("").astype(str)
+    for col in columns[1:]:
+        texts = texts + FIELD_SEP + df[col].astype(object).fillna("").astype(str)
+    return texts.str.lower().tolist()
+
+
+def _build_postings(texts, start=0):
+    """n-gram -> 그 n-gram 을 포함하는 공고 위치 배열 (위치는 start 부터)"""
+    postings = defaultdict(list)
+    for row, text in enumerate(texts, start):
+        grams = set()
+        for n in range(1, NGRAM + 1):
+            grams |= _ngrams(text, n)
+        for gram in grams:
+            postings[gram].append(row)
+    return {gram: np.array(rows, dtype=np.int32) for gram, rows in postings.items()}
+
+
+class TextIndex:
+    """
+    회사명 / 직무 / 기술 스택 키워드 검색용 n-gram 역색인
+
+    - 1~3 글자 n-gram 마다 해당 문자열을 포함하는 공고 위치 배열을 저장
+    - 3글자 이하 검색어는 색인 조회만으로, 더 긴 검색어는 3-gram 교집합으로 후보를 줄인 뒤
+      후보 행만 부분 문자열 일치를 확인 (대소문자 무시, str.contains 와 같은 결과)
+    """
+
+    def __init__(self, df, columns=SEARCH_COLUMNS):
+        self.columns = columns
+        self.texts = _search_texts(df, columns)
+        self.n_postings = len(self.texts)
+        self.postings = _build_postings(self.texts)
+
+    def extend(self, df):
+        """
+        공고를 뒤에 추가한 새 색인 (기존 색인은 수정하지 않음)
+        추가된 공고의 n-gram 만 만들고, 그 n-gram 의 위치 배열에만 새 위치를 이어 붙임
+        """
+        texts = _search_texts(df, self.columns)
+        index = copy.copy(self)
+        index.texts = self.texts + texts
+        index.n_postings = self.n_postings + len(texts)
+        index.postings = dict(self.postings)
+        for gram, rows in _build_postings(texts, start=self.n_postings).items():
+            old_rows = self.postings.get(gram)
+            index.postings[gram] = rows if old_rows is None else np.concatenate([old_rows, rows])
+        return index
+
+    def lookup(self, term):
+        """검색어를 포함하는 공고 위치 배열 (오름차순)"""
+        term = term.lower()
+        if not term:
+            return np.arange(self.n_postings, dtype=np.int32)
+        if len(term) <= NGRAM:
+            return self.postings.get(term, np.empty(0, dtype=np.int32))
+
+        # 희소한 n-gram 부터 교집합을 구해 후보를 빠르게 줄임
+        grams = sorted(_ngrams(term, NGRAM), key=lambda g: len(self.postings.get(g, ())))
+        candidates = self.postings.get(grams[0], np.empty(0, dtype=np.int32))
+        for gram in grams[1:]:
+            if len(candidates) == 0:
+                break
+            candidates = np.intersect1d(candidates, self.postings[gram], assume_unique=True)
+        return np.array(
+            [row for row in candidates if term in self.texts[row]], dtype=np.int32
+        )
+
+    def mask(self, term):
+        result = np.zeros(self.n_postings, dtype=bool)
+        result[self.lookup(term)] = True
+        return result
@@ -5,173 +5,205 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
-from collections import Counter
 from streamlit_plotly_events import plotly_events
-import re
+import os
+from columnar_cache import CACHE_DIR_NAME, read_csv_cached, read_rows_cached
+from company_names import MAPPING_FILE, CompanyMapping
+from data_watcher import DatasetWatcher
+from snapshot_store import AGGREGATE_NAMES, STORE_DIR, SnapshotStore
+from aggregate_cache import AggregateCache, AggregateScope
+from dataset import Dataset
+from render_profiler import RerunTrace, profiled, record_figure, traces_to_json
+from query_backend import (
+    ENGINES, HAS_DUCKDB, HAS_POLARS, DuckDBBackend, DuckDBQuery, PandasQuery, PolarsBackend, PolarsQuery,
+)
+from selection import IncrementalFilter, filter_components
 
 def autopct_func(pct):
     return f"{pct:.1f}%"
 
 
-def count_skills(df, exclude_skills=None):
-    skill_counts = Counter()
-    for index, row in df.iterrows():
-        skills_str = row["skill"]
-        if pd.notna(skills_str):
-            skills = [skill.strip().upper() for skill in skills_str.split(",")]
-            skill_counts.update(skills)
-
-    if exclude_skills:
-        exclude_skills_upper = [skill.upper() for skill in exclude_skills]
-        skill_counts = {
-            skill: count
-            for skill, count in skill_counts.items()
-            if skill not in exclude_skills_upper
-        }
+# 데이터 파일을 찾을 폴더 (상대 경로 -> 절대 경로 순)
+DATA_DIRS = ["data", "C:\\Users\\user\\PJT1_job\\project-data-scraping\\data"]
+
+# 대시보드에서 사용하는 컬럼은 항상 문자열로 읽음 (나머지는 자동 추론)
+CSV_DTYPES = {"company": str, "position": str, "skill": str, "text_skill": str}
+
+# 필터 / 집계 엔진 기본값 (환경 변수 DASHBOARD_ENGINE: pandas / polars / duckdb, 사이드바에서 변경 가능)
+DEFAULT_ENGINE = os.environ.get("DASHBOARD_ENGINE", "pandas")
+
+# 데이터 파일 변경 확인 주기 (초) - 수집 결과가 갱신되면 추가된 행만 읽어 데이터셋에 반영
+DATA_POLL_SECONDS = float(os.environ.get("DASHBOARD_POLL_SECONDS", "5"))
+
+# 렌더링 프로파일 기본값 (환경 변수 DASHBOARD_PROFILE=1 이면 켜진 상태로 시작) / 세션에 보관할 rerun 기록 수
+PROFILE_DEFAULT = os.environ.get("DASHBOARD_PROFILE", "") == "1"
+PROFILE_HISTORY = 20
+
+# 데이터 테이블 탭에서만 쓰는 긴 텍스트 컬럼 - 기본 데이터에서 빼고 필요할 때만 읽음
+TEXT_COLUMNS = ["주요업무", "자격요건"]
+
+DATASET_FILE = "merged_data_total.csv"
+
+
+def resolve_data_path(file_name):
+    for data_dir in DATA_DIRS:
+        file_path = os.path.join(data_dir, file_name)
+        if os.path.exists(file_path):
+            return file_path
+    return None
+
+
+def load_text_rows(rows, file_name=DATASET_FILE):
+    # 긴 텍스트 컬럼은 데이터 테이블 현재 페이지의 행만 사이드카에서 읽음 (해당 행 그룹만 읽음)
+    file_path = resolve_data_path(file_name)
+    if file_path is None:
+        return None
+    return read_rows_cached(file_path, rows, dtype=CSV_DTYPES, usecols=TEXT_COLUMNS)
+
+
+def text_loader(file_path, n_rows):
+    # 중복 공고 검사용 본문 (데이터셋에 들어간 행까지만) - 검사 결과는 데이터셋이 보관하므로 본문은 캐시하지 않음
+    return lambda: read_csv_cached(file_path, dtype=CSV_DTYPES, usecols=TEXT_COLUMNS).iloc[:n_rows]
+
+
+def load_shared_dataset(file_path, signature, companies):
+    frame = read_csv_cached(file_path, dtype=CSV_DTYPES, usecols=lambda col: col not in TEXT_COLUMNS)
+    # 표기만 다른 회사명은 수집 / 병합 단계에서 저장한 회사 ID 매핑으로 하나로 묶음
+    # (대시보드는 매핑 파일을 쓰지 않음 - 매핑에 없는 새 회사는 메모리에서만 ID 를 받음)
+    companies.reload()
+    frame = companies.canonicalize(frame)
+    return Dataset(frame, version=signature, text_loader=text_loader(file_path, len(frame)))
+
+
+def append_shared_dataset(dataset, rows, signature, file_path, companies):
+    # 새로 수집된 행만 회사명 표준화 / 색인해서 새 버전을 만듦
+    # (전체를 읽을 때 쓴 매핑을 이어서 쓰므로 메모리에서 받은 회사 ID 도 기존 행과 같게 유지)
+    rows = companies.canonicalize(rows)
+    loader = text_loader(file_path, len(dataset) + len(rows))
+    return dataset.append(rows, version=signature, text_loader=loader)
+
+
+@st.cache_resource(show_spinner=False)
+@profiled
+def get_dataset_watcher(file_path):
+    # 데이터셋과 인덱스는 프로세스당 하나만 만들어 모든 세션이 읽기 전용으로 공유
+    # (파일이 바뀌면 감시 스레드가 새 버전으로 교체하고, 세션은 다음 rerun 에서 새 버전을 사용 - render_update_notice 참고)
+    companies = CompanyMapping(os.path.join(os.path.dirname(file_path), MAPPING_FILE))
+    watcher = DatasetWatcher(
+        file_path,
+        load=lambda path, signature: load_shared_dataset(path, signature, companies),
+        append=lambda dataset, rows, signature: append_shared_dataset(dataset, rows, signature, file_path, companies),
+        dtype=CSV_DTYPES,
+        usecols=lambda col: col not in TEXT_COLUMNS,
+        interval=DATA_POLL_SECONDS,
+    )
+    return watcher.start()
+
+
+@st.cache_data(show_spinner=False)
+@profiled
+def read_trend_aggregates(store_root, signature):
+    # 트렌드 탭은 날짜별 집계 파일만 읽음 (signature 는 집계 파일 전체의 수정 시각 / 크기 - 하나라도 바뀌면 다시 읽음)
+    store = SnapshotStore(store_root)
+    return {name: store.read_aggregate(name) for name in AGGREGATE_NAMES}
+
+
+def load_trend_aggregates():
+    for data_dir in DATA_DIRS:
+        store_root = os.path.join(data_dir, STORE_DIR)
+        if os.path.exists(os.path.join(store_root, "aggregates", "summary.parquet")):
+            return read_trend_aggregates(store_root, SnapshotStore(store_root).aggregate_signature())
+    return None
 
-    return pd.Series(skill_counts).sort_values(ascending=False)
 
-@st.cache_data(ttl=3600, show_spinner=False)
-def load_csv_data(file_name):
+@profiled
+def load_all_data(file_name=DATASET_FILE):
+    # 전체 데이터 하나만 읽고 백엔드/프론트엔드/풀스택은 category 컬럼으로 구분
+    file_path = resolve_data_path(file_name)
+    if file_path is None:
+        st.warning(f"{file_name} 파일을 찾을 수 없습니다.")
+        return None
     try:
-        # 상대 경로로 시도
-        file_path = f"data/{file_name}"
-        df = pd.read_csv(file_path)
-        return df
-    except FileNotFoundError:
-        try:
-            # 절대 경로로 시도
-            file_path = f"C:\\Users\\user\\PJT1_job\\project-data-scraping\\data\\{file_name}"
-            df = pd.read_csv(file_path)
-            return df
-        except FileNotFoundError:
-            st.warning(f"{file_name} 파일을 찾을 수 없습니다.")
-            return None
+        return get_dataset_watcher(file_path).dataset
     except Exception as e:
         st.error(f"데이터 로딩 중 오류 발생: {e}")
         return None
 
+@st.fragment(run_every=DATA_POLL_SECONDS)
+def render_update_notice():
+    """
+    감시 스레드가 새 버전을 만들었는데 이 세션이 아직 이전 버전을 보고 있으면 알림 표시
+    (이 부분만 DATA_POLL_SECONDS 마다 다시 실행하고, 전체 rerun 은 사용자가 버튼으로 선택)
+    """
+    file_path = resolve_data_path(DATASET_FILE)
+    if file_path is None or "dataset_version" not in st.session_state:
+        return
+    if get_dataset_watcher(file_path).dataset.version != st.session_state.dataset_version:
+        st.info("새로 수집된 공고가 반영되었습니다. 새로고침하면 최신 데이터로 다시 계산합니다.")
+        if st.button("🔄 최신 데이터로 새로고침", key="reload_dataset"):
+            st.rerun(scope="app")
 
-def load_all_data():
-    data = {
-        'total': load_csv_data("merged_data_total.csv"),
-        'backend': load_csv_data("merged_data_backend.csv"),
-        'frontend': load_csv_data("merged_data_frontend.csv")
-    }
-    return data
 
+@profiled
 def create_animated_bar_chart(data_df, x_col, y_col, title, orientation="v", color_scale="Plasma"):
 
     if data_df.empty:
         return None
-        
-    # 애니메이션 프레임 설정 - 최적화
-    animation_frames = []
-    # 최대 8개 프레임으로 제한
-    for i in range(1, 8):
-        subset = data_df.copy()
-        subset["animated_count"] = (subset[y_col] * (i / 7)).round(1)
-        
-        if orientation == "h":
-            frame = go.Frame(
-                data=[
-                    go.Bar(
-                        x=subset["animated_count"],
-                        y=subset[x_col],
-                        orientation="h",
-                        marker=dict(
-                            color=subset["animated_count"],
-                            colorscale=color_scale,
-                            showscale=True,
-                            colorbar=dict(title="빈도"),
-                        ),
-                        text=subset["animated_count"].round(0).astype(int),
-                        textposition="outside",
-                        hovertemplate="<b>%{y}</b><br>빈도: %{x:,}",
-                    )
-                ],
-                name=f"frame{i}",
-            )
-        else:
-            frame = go.Frame(
-                data=[
-                    go.Bar(
-                        x=subset[x_col],
-                        y=subset["animated_count"],
-                        marker=dict(
-                            color=subset["animated_count"],
-                            colorscale=color_scale,
-                            showscale=True,
-                            colorbar=dict(title="빈도"),
-                        ),
-                        text=subset["animated_count"].round(0).astype(int),
-                        textposition="outside",
-                        hovertemplate="<b>%{x}</b><br>빈도: %{y:,}",
-                    )
-                ],
-                name=f"frame{i}",
-            )
-        animation_frames.append(frame)
+    
+    # 라벨과 값 튜플이 데이터 지문 역할 - 같은 데이터면 캐시된 그래프를 재사용
+    labels = tuple(data_df[x_col].astype(str))
+    values = tuple(data_df[y_col].tolist())
+    return build_animated_bar_chart(labels, values, title, orientation, color_scale)
 
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+@profiled
+def build_animated_bar_chart(labels, values, title, orientation="v", color_scale="Plasma"):
+    """
+    막대가 0에서 자라나는 애니메이션 그래프 (캐시되어 세션 간에 공유되므로 수정하지 말 것)
+    
+    막대 트레이스 하나만 두고, 애니메이션 프레임은 최종 값 배열만 담아
+    plotly 전환(transition) 효과로 보간 - 프레임마다 전체 트레이스를 복제하지 않음
+    """
+    empty_vals = [0] * len(values)
+    horizontal = orientation == "h"
+    
     # 처음에는 빈 값으로 시작
-    empty_vals = [0] * len(data_df)
-    
-    # 그래프 생성
-    if orientation == "h":
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=empty_vals,
-                    y=data_df[x_col],
-                    orientation="h",
-                    marker=dict(
-                        color=empty_vals,
-                        colorscale=color_scale,
-                        showscale=True,
-                        colorbar=dict(title="빈도"),
-                    ),
-                    text=empty_vals,
-                    textposition="outside",
-                    hovertemplate="<b>%{y}</b><br>빈도: %{x:,}",
-                )
-            ],
-            frames=animation_frames,
-        )
-        
-        # x축 범위 설정 (최대값의 1.1배까지)
-        xmax = max(data_df[y_col]) * 1.1
+    bar = go.Bar(
+        x=empty_vals if horizontal else labels,
+        y=labels if horizontal else empty_vals,
+        orientation=orientation,
+        marker=dict(
+            color=values,
+            colorscale=color_scale,
+            showscale=True,
+            colorbar=dict(title="빈도"),
+        ),
+        text=empty_vals,
+        textposition="outside",
+        hovertemplate="<b>%{y}</b><br>빈도: %{x:,}" if horizontal else "<b>%{x}</b><br>빈도: %{y:,}",
+    )
+    # 애니메이션 프레임 - 바뀌는 값 배열만 포함
+    final_frame = go.Frame(
+        data=[go.Bar(x=values, text=values) if horizontal else go.Bar(y=values, text=values)],
+        name="grow",
+    )
+    fig = go.Figure(data=[bar], frames=[final_frame])
+    
+    # 값 축 범위 설정 (최대값의 1.1배까지)
+    value_range = [0, max(values) * 1.1]
+    if horizontal:
         fig.update_layout(
             xaxis_title="빈도",
             yaxis_title="",
-            xaxis_range=[0, xmax],
+            xaxis_range=value_range,
             yaxis={"categoryorder": "total ascending"},
         )
     else:
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=data_df[x_col],
-                    y=empty_vals,
-                    marker=dict(
-                        color=empty_vals,
-                        colorscale=color_scale,
-                        showscale=True,
-                        colorbar=dict(title="빈도"),
-                    ),
-                    text=empty_vals,
-                    textposition="outside",
-                    hovertemplate="<b>%{x}</b><br>빈도: %{y:,}",
-                )
-            ],
-            frames=animation_frames,
-        )
-        
-        # y축 범위 설정 (최대값의 1.1배까지)
-        ymax = max(data_df[y_col]) * 1.1
         fig.update_layout(
             xaxis_title="",
             yaxis_title="빈도", 
-            yaxis_range=[0, ymax],
+            yaxis_range=value_range,
             xaxis=dict(tickangle=-45),
         )
 
@@ -185,7 +217,7 @@ def create_animated_bar_chart(data_df, x_col, y_col, title, orientation="v", col
             "yanchor": "top",
         },
         height=600,
-        margin=dict(l=20 if orientation == "v" else 150, r=20, t=70, b=100 if orientation == "v" else 70),
+        margin=dict(l=150 if horizontal else 20, r=20, t=70, b=70 if horizontal else 100),
         updatemenus=[
             {
                 "type": "buttons",
@@ -196,7 +228,8 @@ def create_animated_bar_chart(data_df, x_col, y_col, title, orientation="v", col
                         "args": [
                             None,
                             {
-                                "frame": {"duration": 200, "redraw": True},
+                                "frame": {"duration": 1400, "redraw": False},
+                                "transition": {"duration": 1400, "easing": "cubic-out"},
                                 "fromcurrent": True,
                                 "mode": "immediate",
                             },
@@ -217,6 +250,7 @@ def create_animated_bar_chart(data_df, x_col, y_col, title, orientation="v", col
     return fig
 
 
+@profiled
 def create_clickable_bar_chart(data_df, title, key_prefix):
     """
     클릭 가능한 막대 그래프를 생성하는 함수
@@ -246,6 +280,7 @@ def create_clickable_bar_chart(data_df, title, key_prefix):
     )
     
     # 클릭 이벤트 처리
+    record_figure(fig)
     clicked = plotly_events(fig, click_event=True, key=graph_key)
     
     # 클릭 이벤트 처리 로직
@@ -285,7 +320,8 @@ def setup_page():
     # 앱 제목
     st.title("🚀 IT 채용정보 분석")
 
-def render_sidebar(data):
+@profiled
+def render_sidebar(dataset):
     st.sidebar.title("💻 검색 옵션")
     
     # 필터링 옵션 추가
@@ -293,7 +329,7 @@ def render_sidebar(data):
     search_term = st.sidebar.text_input("검색어 입력 (회사명, 직무, 기술스택)")
     
     # 회사명 필터링 옵션
-    all_companies = ["전체"] + sorted(data['total']["company"].unique().tolist())
+    all_companies = ["전체"] + sorted(dataset.categories("company").tolist())
     selected_company = st.sidebar.selectbox("회사 선택", all_companies)
     
     # 기술 스택 검색 옵션
@@ -303,61 +339,98 @@ def render_sidebar(data):
     ]
     selected_skills = st.sidebar.multiselect("기술 스택 선택", common_skills)
     
+    # 표시 옵션
+    st.sidebar.subheader("⚙️ 표시 옵션")
+    installed = {"pandas": True, "polars": HAS_POLARS, "duckdb": HAS_DUCKDB}
+    engines = [engine for engine in ENGINES if installed[engine]]
+    options = {
+        # 켜면 선택한 탭만 계산하고 그래프를 만듦 (끄면 모든 탭을 매번 렌더링)
+        "lazy_tabs": st.sidebar.checkbox("선택한 탭만 계산", value=True),
+        # 본문이 거의 같은 재게시 / 중복 수집 공고는 하나만 집계
+        "dedup": st.sidebar.checkbox("중복 공고 제외", value=False),
+        # pandas: 메모리의 데이터셋, polars: Polars lazy 질의, duckdb: Parquet 위의 SQL
+        "engine": st.sidebar.selectbox(
+            "필터 / 집계 엔진",
+            engines,
+            index=engines.index(DEFAULT_ENGINE) if DEFAULT_ENGINE in engines else 0,
+        ),
+    }
+    
     # 푸터
     st.sidebar.markdown("---")
     st.sidebar.markdown("© 2025 IT 채용정보 분석 대시보드")
     
-    return search_term, selected_company, selected_skills
+    return search_term, selected_company, selected_skills, options
 
 
-def filter_data(df, search_term, selected_company, selected_skills):
-    filtered_df = df.copy()
-    
-    # 검색어로 필터링
-    if search_term:
-        search_mask = (
-            filtered_df["company"].str.contains(search_term, case=False, na=False)
-            | filtered_df["position"].str.contains(search_term, case=False, na=False)
-            | filtered_df["skill"].str.contains(search_term, case=False, na=False)
-        )
-        filtered_df = filtered_df[search_mask]
-    
-    # 선택한 회사로 필터링
-    if selected_company != "전체":
-        filtered_df = filtered_df[filtered_df["company"] == selected_company]
-    
-    # 선택한 기술 스택으로 필터링
-    for skill in selected_skills:
-        filtered_df = filtered_df[
-            filtered_df["skill"].str.contains(skill, case=False, na=False)
-        ]
-    
-    return filtered_df
+@st.cache_resource(show_spinner=False, max_entries=1)
+@profiled
+def load_duckdb_backend(_dataset, version):
+    # 데이터셋 버전마다 한 번만 Parquet 으로 내보내고 모든 세션이 같은 DuckDB 를 사용
+    data_dir = os.path.dirname(resolve_data_path(DATASET_FILE))
+    return DuckDBBackend(_dataset, os.path.join(data_dir, CACHE_DIR_NAME, "duckdb"))
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+@profiled
+def load_polars_backend(_dataset, version):
+    # 데이터셋 버전마다 한 번만 Polars 데이터프레임으로 옮기고 모든 세션이 공유
+    return PolarsBackend(_dataset)
+
+
+@profiled
+def make_query(dataset, components, engine):
+    """현재 필터 상태에 대한 질의 객체 (렌더링 함수는 엔진과 관계없이 같은 메서드만 사용)"""
+    if engine == "duckdb":
+        return DuckDBQuery(load_duckdb_backend(dataset, dataset.version), components)
+    if engine == "polars":
+        return PolarsQuery(load_polars_backend(dataset, dataset.version), components)
+    return PandasQuery(dataset, get_session_filter(dataset).select(components))
+
+
+@st.cache_resource(show_spinner=False)
+def get_aggregate_cache():
+    # 프로세스 전체에서 하나만 사용하는 집계 캐시 (메모리 예산 64MB, LRU 제거)
+    return AggregateCache(max_bytes=64 * 1024 * 1024)
+
+
+def get_session_filter(dataset):
+    # 세션마다 필터 조합기를 하나씩 유지 (데이터셋이 새 버전으로 바뀌면 새로 만듦)
+    row_filter = st.session_state.get("row_filter")
+    if row_filter is None or row_filter.dataset is not dataset:
+        row_filter = IncrementalFilter(dataset)
+        st.session_state.row_filter = row_filter
+    return row_filter
 
 
-def render_summary_metrics(filtered_df):
+@profiled
+def render_summary_metrics(query, aggregates):
     st.header("📈 채용정보 요약")
     
     # KPI 지표를 3개 컬럼으로 나눠 표시
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric(label="총 채용공고 수", value=f"{len(filtered_df):,}")
+        total_count = aggregates.get("count", query.count)
+        st.metric(label="총 채용공고 수", value=f"{total_count:,}")
     
     with col2:
-        company_count = filtered_df["company"].nunique()
+        company_count = aggregates.get("nunique:company", lambda: query.nunique("company"))
         st.metric(label="기업 수", value=f"{company_count:,}")
     
     with col3:
-        job_count = filtered_df["position"].nunique()
+        job_count = aggregates.get("nunique:position", lambda: query.nunique("position"))
         st.metric(label="고유 직무 수", value=f"{job_count:,}")
 
 
-def render_company_analysis(filtered_df):
+@profiled
+def render_company_analysis(query, aggregates):
     st.subheader("채용공고가 많은 상위 20개 기업")
     
     # 전체 기업 채용 공고 수 (상위 20개)
-    company_counts = filtered_df["company"].value_counts().head(20).reset_index()
+    company_counts = aggregates.get(
+        "top20:company", lambda: query.value_counts("company").head(20)
+    ).reset_index()
     company_counts.columns = ["company", "count"]
     
     if not company_counts.empty:
@@ -369,17 +442,21 @@ def render_company_analysis(filtered_df):
             orientation="v",
             color_scale="Plasma"
         )
+        record_figure(fig)
         st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("필터링된 데이터가 없습니다.")
 
 
-def render_job_analysis(filtered_df):
+@profiled
+def render_job_analysis(query, aggregates):
     """직무 분석 탭 렌더링"""
     st.subheader("상위 20개 직무")
     
     # 직무명(position) 열의 상위 빈도 항목 출력
-    position_counts = filtered_df["position"].value_counts().head(20).reset_index()
+    position_counts = aggregates.get(
+        "top20:position", lambda: query.value_counts("position").head(20)
+    ).reset_index()
     position_counts.columns = ["position", "count"]
     
     if not position_counts.empty:
@@ -391,220 +468,255 @@ def render_job_analysis(filtered_df):
             orientation="h",
             color_scale="Viridis"
         )
+        record_figure(fig)
         st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("필터링된 데이터가 없습니다.")
 
 
-def render_skill_analysis(data, filtered_df):
+# 기술 스택 분석 서브 탭: (세션 상태 키, 탭 이름, 그래프 제목)
+SKILL_TABS = [
+    ("total", "전체 기술 스택", "전체 기술 스택 상위 15개"),
+    ("backend", "백엔드 기술 스택", "백엔드 기술 스택 상위 15개"),
+    ("frontend", "프론트엔드 기술 스택", "프론트엔드 기술 스택 상위 15개"),
+    ("fullstack", "풀스택 기술 스택", "풀스택 기술 스택 상위 15개"),
+]
+
+# 기술 스택 출처 (본문 추출 컬럼 text_skill 이 있을 때만 선택 가능)
+SKILL_SOURCES = {"tag": "카드 태그", "text": "본문 추출", "all": "태그 + 본문"}
+
+
+def render_tabs(labels, key, lazy=True):
+    """
+    탭 렌더링 - (탭 이름, 컨테이너) 목록 반환
+    lazy 모드에서는 선택된 탭 하나만 반환해 나머지 탭의 계산과 그래프 생성을 건너뜀
+    """
+    if lazy:
+        active = st.radio(key, labels, horizontal=True, key=key, label_visibility="collapsed")
+        return [(active, st.container())]
+    return list(zip(labels, st.tabs(labels)))
+
+
+def handle_skill_selection(tab_name, skill):
+    if skill != "선택하세요...":
+        if skill not in st.session_state.tab_skills[tab_name]:
+            st.session_state.tab_skills[tab_name].append(skill)
+            st.session_state.add_skill[tab_name] = True
+
+
+@profiled
+def render_skill_leaderboard(tab_name, title, skill_counts):
+    # 데이터 준비
+    skill_df = skill_counts.head(15).reset_index()
+    skill_df.columns = ["skill", "count"]
+    
+    # 막대 그래프 생성
+    fig = px.bar(
+        skill_df,
+        x="skill", 
+        y="count",
+        title=title,
+        color="count",
+        color_continuous_scale="Viridis",
+    )
+    
+    fig.update_layout(
+        height=500,
+        margin=dict(l=30, r=30, t=50, b=50),
+        title_x=0.5,
+        xaxis_tickangle=-45,
+    )
+    
+    record_figure(fig)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # 선택 추가 상태 확인 및 초기화
+    if st.session_state.add_skill[tab_name]:
+        st.session_state.add_skill[tab_name] = False
+        st.rerun()
+    
+    # 기술 스택 선택용 셀렉트 박스 추가
+    selected_skill = st.selectbox(
+        "기술 스택 선택",
+        ["선택하세요..."] + skill_df["skill"].tolist(),
+        key=f"select_{tab_name}"
+    )
+    
+    # 선택 처리
+    handle_skill_selection(tab_name, selected_skill)
+    
+    # 선택된 스킬 표시
+    with st.container():
+        if st.session_state.tab_skills[tab_name]:
+            st.write("선택된 기술 스택:", ", ".join(st.session_state.tab_skills[tab_name]))
+
+
+@profiled
+def render_skill_analysis(dataset, query, aggregates, lazy=True):
     """기술 스택 분석 탭 - session_state 수정 오류 해결"""
     st.subheader("기술 스택 분석")
     
-    # 제외할 스킬 목록 정의
-    excluded_skills = ["AI", "UI", "UIUX", "NATIVE", "BOOT", "API", "WEB", "SW"]
-    
     # 현재 활성 탭 추적을 위한 세션 상태 초기화
     if 'active_stack_tab' not in st.session_state:
         st.session_state.active_stack_tab = "total"
     
-    # 탭별 선택된 스킬 추적
-    if 'tab_skills' not in st.session_state:
-        st.session_state.tab_skills = {"total": [], "backend": [], "frontend": []}
-    
-    # 선택 추가 상태 관리
-    if 'add_skill' not in st.session_state:
-        st.session_state.add_skill = {"total": False, "backend": False, "frontend": False}
-    
-    # 선택 처리 함수 정의
-    def handle_skill_selection(tab_name, skill):
-        if skill != "선택하세요...":
-            if skill not in st.session_state.tab_skills[tab_name]:
-                st.session_state.tab_skills[tab_name].append(skill)
-                st.session_state.add_skill[tab_name] = True
-    
-    if data['backend'] is not None and data['frontend'] is not None:
-        # 스택별 분석을 위한 서브 탭 생성
-        stack_tab1, stack_tab2, stack_tab3 = st.tabs(
-            ["전체 기술 스택", "백엔드 기술 스택", "프론트엔드 기술 스택"]
+    # 탭별 선택된 스킬 추적 / 선택 추가 상태 관리
+    st.session_state.setdefault('tab_skills', {})
+    st.session_state.setdefault('add_skill', {})
+    for name, _, _ in SKILL_TABS:
+        st.session_state.tab_skills.setdefault(name, [])
+        st.session_state.add_skill.setdefault(name, False)
+    
+    leaderboards = dataset.skill_leaderboards
+    
+    source = "tag"
+    if len(dataset.skill_sources) > 1:
+        source = st.radio(
+            "기술 스택 출처",
+            list(dataset.skill_sources),
+            format_func=SKILL_SOURCES.get,
+            horizontal=True,
+            key="skill_source",
         )
-        
-        # 전체 기술 스택 탭
-        with stack_tab1:
-            # 탭 선택 감지 및 처리
-            prev_tab = st.session_state.active_stack_tab
-            st.session_state.active_stack_tab = "total"
-            
-            # 전체 데이터 기술 스택 분석
-            total_skill_counts = count_skills(
-                filtered_df, exclude_skills=excluded_skills
-            )
-            
-            # 데이터 준비
-            skill_df = total_skill_counts.head(15).reset_index()
-            skill_df.columns = ["skill", "count"]
-            
-            # 막대 그래프 생성
-            fig = px.bar(
-                skill_df,
-                x="skill", 
-                y="count",
-                title="전체 기술 스택 상위 15개",
-                color="count",
-                color_continuous_scale="Viridis",
-            )
-            
-            fig.update_layout(
-                height=500,
-                margin=dict(l=30, r=30, t=50, b=50),
-                title_x=0.5,
-                xaxis_tickangle=-45,
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 선택 추가 상태 확인 및 초기화
-            if st.session_state.add_skill["total"]:
-                st.session_state.add_skill["total"] = False
-                st.rerun()
-            
-            # 기술 스택 선택용 셀렉트 박스 추가
-            selected_skill = st.selectbox(
-                "기술 스택 선택",
-                ["선택하세요..."] + skill_df["skill"].tolist(),
-                key="select_total"
-            )
-            
-            # 선택 처리
-            handle_skill_selection("total", selected_skill)
-            
-            # 선택된 스킬 표시
-            with st.container():
-                if st.session_state.tab_skills["total"]:
-                    st.write("선택된 기술 스택:", ", ".join(st.session_state.tab_skills["total"]))
-                    
-        # 백엔드 기술 스택 탭
-        with stack_tab2:
-            # 탭 선택 감지 및 처리
-            prev_tab = st.session_state.active_stack_tab
-            st.session_state.active_stack_tab = "backend"
-            
-            # 백엔드 데이터 기술 스택 분석
-            backend_skill_counts = count_skills(
-                data['backend'], exclude_skills=excluded_skills
-            )
-            
-            # 데이터 준비
-            backend_skill_df = backend_skill_counts.head(15).reset_index()
-            backend_skill_df.columns = ["skill", "count"]
-            
-            # 막대 그래프 생성
-            fig = px.bar(
-                backend_skill_df,
-                x="skill", 
-                y="count",
-                title="백엔드 기술 스택 상위 15개",
-                color="count",
-                color_continuous_scale="Viridis",
-            )
-            
-            fig.update_layout(
-                height=500,
-                margin=dict(l=30, r=30, t=50, b=50),
-                title_x=0.5,
-                xaxis_tickangle=-45,
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 선택 추가 상태 확인 및 초기화
-            if st.session_state.add_skill["backend"]:
-                st.session_state.add_skill["backend"] = False
-                st.rerun()
-            
-            # 기술 스택 선택용 셀렉트 박스 추가
-            selected_skill = st.selectbox(
-                "기술 스택 선택",
-                ["선택하세요..."] + backend_skill_df["skill"].tolist(),
-                key="select_backend"
-            )
-            
-            # 선택 처리
-            handle_skill_selection("backend", selected_skill)
-            
-            # 선택된 스킬 표시
-            with st.container():
-                if st.session_state.tab_skills["backend"]:
-                    st.write("선택된 기술 스택:", ", ".join(st.session_state.tab_skills["backend"]))
-        
-        # 프론트엔드 기술 스택 탭
-        with stack_tab3:
-            # 탭 선택 감지 및 처리
-            prev_tab = st.session_state.active_stack_tab
-            st.session_state.active_stack_tab = "frontend"
-            
-            # 프론트엔드 데이터 기술 스택 분석
-            frontend_skill_counts = count_skills(
-                data['frontend'], exclude_skills=excluded_skills
-            )
-            
-            # 데이터 준비
-            frontend_skill_df = frontend_skill_counts.head(15).reset_index()
-            frontend_skill_df.columns = ["skill", "count"]
-            
-            # 막대 그래프 생성
-            fig = px.bar(
-                frontend_skill_df,
-                x="skill", 
-                y="count",
-                title="프론트엔드 기술 스택 상위 15개",
-                color="count",
-                color_continuous_scale="Viridis",
+    skill_index = dataset.skill_sources[source]
+    
+    def skill_counts(tab_name):
+        if source == "tag":
+            # 직무별 탭과 필터가 없는 전체 탭은 로딩 시 미리 계산한 순위표를 그대로 사용
+            if tab_name != "total" or aggregates.get("count", query.count) == len(dataset):
+                return leaderboards[tab_name]
+            # 필터가 적용된 전체 탭만 필터링된 공고 기준으로 계산
+            return aggregates.get(
+                "skills:total",
+                query.skill_counts,
             )
-            
-            fig.update_layout(
-                height=500,
-                margin=dict(l=30, r=30, t=50, b=50),
-                title_x=0.5,
-                xaxis_tickangle=-45,
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 선택 추가 상태 확인 및 초기화
-            if st.session_state.add_skill["frontend"]:
-                st.session_state.add_skill["frontend"] = False
-                st.rerun()
-            
-            # 기술 스택 선택용 셀렉트 박스 추가
-            selected_skill = st.selectbox(
-                "기술 스택 선택",
-                ["선택하세요..."] + frontend_skill_df["skill"].tolist(),
-                key="select_frontend"
-            )
-            
-            # 선택 처리
-            handle_skill_selection("frontend", selected_skill)
-            
-            # 선택된 스킬 표시
-            with st.container():
-                if st.session_state.tab_skills["frontend"]:
-                    st.write("선택된 기술 스택:", ", ".join(st.session_state.tab_skills["frontend"]))
-                    
+        # 본문 추출 기술 스택은 처음 볼 때 계산해 집계 캐시에 보관
+        tab_rows = query.rows if tab_name == "total" else dataset.views[tab_name]
+        return aggregates.get(
+            f"skills:{source}:{tab_name}",
+            lambda: skill_index.counts(tab_rows),
+        )
     
-    else:
-        st.info("백엔드 또는 프론트엔드 데이터 파일을 찾을 수 없습니다.")
+    # 공고가 있는 직무의 서브 탭만 생성
+    tab_info = {
+        label: (name, title)
+        for name, label, title in SKILL_TABS
+        if name == "total" or len(dataset.views[name]) > 0
+    }
+    if len(tab_info) == 1:
+        st.info("백엔드 / 프론트엔드 / 풀스택 채용공고가 없습니다.")
+    
+    for label, container in render_tabs(list(tab_info), "stack_tab", lazy):
+        tab_name, title = tab_info[label]
+        with container:
+            st.session_state.active_stack_tab = tab_name
+            render_skill_leaderboard(tab_name, title, skill_counts(tab_name))
 
 
-def render_data_table(filtered_df):
+@profiled
+def render_skill_combinations(dataset, rows, aggregates):
+    """기술 조합 분석 탭 - 함께 요구되는 기술 스택 (동시 출현, lift / PMI)"""
+    st.subheader("함께 요구되는 기술 스택")
+    
+    if len(rows) == 0:
+        st.info("필터링된 데이터가 없습니다.")
+        return
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        min_together = st.number_input("최소 동시 출현 공고 수", min_value=1, value=5)
+    with col2:
+        top_n = st.slider("히트맵 기술 스택 수", min_value=5, max_value=40, value=20)
+    
+    skill_index = dataset.skill_index
+    
+    # 기술 쌍별 lift / PMI 순위 (희소 행렬 곱으로 계산, 필터 상태별로 캐시)
+    pairs = aggregates.get(
+        f"skill_pairs:{min_together}",
+        lambda: skill_index.associations(rows, min_together=min_together),
+    )
+    
+    if pairs.empty:
+        st.info("조건을 만족하는 기술 조합이 없습니다.")
+    else:
+        pairs_view = pairs.head(30).rename(columns={
+            "skill_a": "기술 A", "skill_b": "기술 B", "together": "함께 요구한 공고 수",
+            "count_a": "A 공고 수", "count_b": "B 공고 수",
+        })
+        st.dataframe(pairs_view.round({"lift": 2, "pmi": 2}), use_container_width=True)
+    
+    # 상위 기술 스택 간 동시 출현 히트맵
+    top_skills = aggregates.get(
+        "skills:total", lambda: skill_index.counts(rows)
+    ).head(top_n).index
+    table = aggregates.get(
+        f"skill_cooccurrence:{top_n}", lambda: skill_index.cooccurrence_table(top_skills, rows)
+    )
+    fig = px.imshow(
+        table,
+        color_continuous_scale="Viridis",
+        text_auto=True,
+        aspect="auto",
+        labels=dict(color="공고 수"),
+    )
+    fig.update_layout(height=700, margin=dict(l=30, r=30, t=30, b=30), xaxis_tickangle=-45)
+    record_figure(fig)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@profiled
+def render_trend_chart(df, column, selected, title):
+    trend = df[df[column].isin(selected)]
+    fig = px.line(trend, x="date", y="count", color=column, markers=True, title=title)
+    fig.update_layout(height=450, margin=dict(l=20, r=20, t=50, b=20), xaxis_title="", yaxis_title="공고 수")
+    record_figure(fig)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@profiled
+def render_hiring_trends():
+    """채용 트렌드 탭 - 날짜별 스냅샷 집계로 공고 수 / 기술 스택 / 회사별 변화 표시"""
+    st.subheader("채용 트렌드")
+    
+    aggregates = load_trend_aggregates()
+    if aggregates is None or aggregates["summary"].empty:
+        st.info("스냅샷 기록이 없습니다. 수집할 때마다 `python snapshot_store.py data/merged_data_total.csv` 로 기록을 쌓아 주세요.")
+        return
+    
+    st.caption("사이드바 필터와 관계없이 스냅샷 날짜별 전체 공고 기준으로 집계한 결과입니다.")
+    summary = aggregates["summary"].melt(id_vars="date", var_name="구분", value_name="count")
+    summary["구분"] = summary["구분"].map({"active": "게시 중", "new": "신규", "closed": "마감"})
+    fig = px.line(summary, x="date", y="count", color="구분", markers=True, title="날짜별 채용공고 수")
+    fig.update_layout(height=400, margin=dict(l=20, r=20, t=50, b=20), xaxis_title="", yaxis_title="공고 수")
+    record_figure(fig)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    skills, companies = aggregates["skills"], aggregates["companies"]
+    latest = aggregates["summary"]["date"].max()
+    
+    # 기본 선택은 가장 최근 스냅샷의 상위 항목
+    skill_options = skills["skill"].unique().tolist()
+    top_skills = skills[skills["date"] == latest].nlargest(5, "count")["skill"].tolist()
+    selected_skills = st.multiselect("기술 스택", skill_options, default=top_skills, key="trend_skills")
+    render_trend_chart(skills, "skill", selected_skills, "기술 스택별 게시 중인 공고 수")
+    
+    company_options = companies["company"].unique().tolist()
+    top_companies = companies[companies["date"] == latest].nlargest(5, "count")["company"].tolist()
+    selected_companies = st.multiselect("회사", company_options, default=top_companies, key="trend_companies")
+    render_trend_chart(companies, "company", selected_companies, "회사별 게시 중인 공고 수")
+
+
+@profiled
+def render_data_table(dataset, rows):
     """데이터 테이블 탭 렌더링"""
     st.subheader("데이터 테이블")
     
     # 페이지네이션을 위한 설정
     page_size = st.selectbox("페이지 크기", [10, 25, 50, 100])
     
-    if not filtered_df.empty:
-        total_pages = len(filtered_df) // page_size + (
-            1 if len(filtered_df) % page_size > 0 else 0
+    if len(rows) > 0:
+        total_pages = len(rows) // page_size + (
+            1 if len(rows) % page_size > 0 else 0
         )
         page_number = st.number_input(
             "페이지 번호", min_value=1, max_value=max(1, total_pages), value=1
@@ -612,55 +724,112 @@ def render_data_table(filtered_df):
         
         # 현재 페이지 데이터 가져오기
         start_idx = (page_number - 1) * page_size
-        end_idx = min(start_idx + page_size, len(filtered_df))
+        end_idx = min(start_idx + page_size, len(rows))
         
         st.write(
-            f"전체 {len(filtered_df)}개 중 {start_idx+1}~{end_idx}개 데이터를 표시합니다."
+            f"전체 {len(rows)}개 중 {start_idx+1}~{end_idx}개 데이터를 표시합니다."
         )
-        st.dataframe(filtered_df.iloc[start_idx:end_idx])
+        # 공유 데이터셋에서 현재 페이지 행만 꺼냄
+        page_rows = rows[start_idx:end_idx]
+        page_df = dataset.take(page_rows)
+        
+        # 현재 페이지 행에 대해서만 주요업무/자격요건 텍스트를 읽어 붙임
+        text_df = load_text_rows(page_rows)
+        if text_df is not None:
+            page_df = page_df.join(text_df.set_axis(page_df.index))
+        st.dataframe(page_df)
     else:
         st.info("필터링된 데이터가 없습니다.")
 
 
-def main():
-    """메인 함수"""
-    # 페이지 설정
-    setup_page()
-    
+def render_debug_panel():
+    """사이드바 디버그 패널 - 최근 rerun 의 함수별 실행 시간 / 집계 캐시 적중 / 그래프 크기, JSON 내보내기"""
+    enabled = st.sidebar.checkbox("렌더링 프로파일", value=PROFILE_DEFAULT, key="profile_render")
+    traces = st.session_state.get("render_traces", [])
+    if not enabled or not traces:
+        return
+
+    trace = traces[-1]
+    hits, misses = trace.cache_counts()
+    with st.sidebar.expander("⏱️ 마지막 rerun", expanded=True):
+        st.write(
+            f"전체 {trace.total_ms:,.1f}ms · 집계 캐시 적중 {hits} / 미적중 {misses} · "
+            f"그래프 {trace.figure_bytes() / 1024:,.1f}KB"
+        )
+        calls = pd.DataFrame(trace.calls(), columns=["name", "calls", "total_ms", "max_ms"])
+        st.dataframe(calls.round({"total_ms": 1, "max_ms": 1}), hide_index=True, use_container_width=True)
+
+        figures = [record for record in trace.records if record["kind"] == "figure"]
+        if figures:
+            figures = pd.DataFrame(figures, columns=["name", "bytes", "serialize_ms"])
+            st.dataframe(figures, hide_index=True, use_container_width=True)
+
+        st.download_button(
+            f"JSON 내보내기 (최근 {len(traces)}회)",
+            traces_to_json(traces),
+            file_name="render_profile.json",
+            mime="application/json",
+        )
+
+
+def render_dashboard():
+    """대시보드 본문 (데이터 로드, 사이드바 필터, 탭 렌더링)"""
     # 데이터 로드
-    data = load_all_data()
+    dataset = load_all_data()
     
-    if data['total'] is not None:
-        # 사이드바 렌더링
-        search_term, selected_company, selected_skills = render_sidebar(data)
+    if dataset is not None:
+        # 이 rerun 이 그리는 데이터 버전 (이후 새 버전이 생기면 render_update_notice 가 알림)
+        st.session_state.dataset_version = dataset.version
+        render_update_notice()
         
-        # 필터링 적용
-        filtered_df = filter_data(data['total'], search_term, selected_company, selected_skills)
+        # 사이드바 렌더링
+        search_term, selected_company, selected_skills, options = render_sidebar(dataset)
         
-        # 요약 정보 렌더링
-        render_summary_metrics(filtered_df)
+        # 필터링 적용 (세션별로는 공고 위치 배열만 만들고, 조건이 좁아지면 이전 결과에서 이어서 계산)
+        components = filter_components(search_term, selected_company, selected_skills, options["dedup"])
+        query = make_query(dataset, components, options["engine"])
         
-        # 탭 생성
-        tab1, tab2, tab3, tab4 = st.tabs(
-            ["📊 기업 분석", "🔍 직무 분석", "🧩 기술 스택 분석", "📋 데이터 테이블"]
-        )
+        # 같은 필터 상태의 집계는 세션 간 공유 캐시에서 재사용
+        aggregates = AggregateScope(get_aggregate_cache(), dataset.version, components)
         
-        # 각 탭 렌더링
-        with tab1:
-            render_company_analysis(filtered_df)
-        
-        with tab2:
-            render_job_analysis(filtered_df)
+        # 요약 정보 렌더링
+        render_summary_metrics(query, aggregates)
         
-        with tab3:
-            render_skill_analysis(data, filtered_df)
+        # 탭별 렌더링 함수 (lazy 모드에서는 선택된 탭만 실행)
+        lazy = options["lazy_tabs"]
+        tab_renderers = {
+            "📊 기업 분석": lambda: render_company_analysis(query, aggregates),
+            "🔍 직무 분석": lambda: render_job_analysis(query, aggregates),
+            "🧩 기술 스택 분석": lambda: render_skill_analysis(dataset, query, aggregates, lazy),
+            "🔗 기술 조합 분석": lambda: render_skill_combinations(dataset, query.rows, aggregates),
+            "📈 채용 트렌드": render_hiring_trends,
+            "📋 데이터 테이블": lambda: render_data_table(dataset, query.rows),
+        }
         
-        with tab4:
-            render_data_table(filtered_df)
+        # 탭 생성 및 렌더링
+        for label, container in render_tabs(list(tab_renderers), "main_tab", lazy):
+            with container:
+                tab_renderers[label]()
     
     else:
         st.error("데이터를 불러오는데 실패했습니다. 파일 경로를 확인해주세요.")
 
 
+def main():
+    """메인 함수"""
+    # 페이지 설정
+    setup_page()
+    
+    # 프로파일이 켜져 있으면 이번 rerun 의 실행 기록을 모아 세션에 보관 (꺼져 있으면 기록하지 않음)
+    if st.session_state.get("profile_render", PROFILE_DEFAULT):
+        with RerunTrace(label=st.session_state.get("main_tab", "")) as trace:
+            render_dashboard()
+        st.session_state.render_traces = (st.session_state.get("render_traces", []) + [trace])[-PROFILE_HISTORY:]
+    else:
+        render_dashboard()
+    
+    render_debug_panel()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file